@@ -1,10 +1,15 @@
-import numpy as np
+import argparse
 import pygame
-import random
-import math
 import sys
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
-random.seed()
+import instrument
+from engine import new_game as new_engine_game, EMPTY_CELL, BOARD_CELL, HAND_SIZE, MERGER_ORDER, Score_Card
+from bots import BOTS, TRADE, SELL, KEEP, best_buy
+from replay import save_log
+from client import Connection, RemoteSeat
+from server import HOST, PORT
 
 # Constants
 TILE_SIZE = 75
@@ -15,15 +20,18 @@ COLUMN_COUNT = 12 + 8
 WINDOW_WIDTH = COLUMN_COUNT * TILE_SIZE
 WINDOW_HEIGHT = ROW_COUNT * TILE_SIZE
 
-# Initialize Pygame
-pygame.init()
-game_screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
-pygame.display.set_caption('Acquire Game')
+FRAME_RATE = 60
 
-# Fonts
-font_small = pygame.font.Font(None, 18)
-font_medium = pygame.font.Font(None, 30)
-font_large = pygame.font.Font(None, 40)
+# move log of the last game played, replay.py plays it again
+LOG_FILE = "last_game.json"
+
+# policy of a seat held by another client of the server
+REMOTE = "remote"
+
+# Font sizes
+SMALL_FONT = 18
+MEDIUM_FONT = 30
+LARGE_FONT = 40
 
 # Color
 BLACK = (0, 0, 0)
@@ -42,368 +50,238 @@ RED = (255, 48, 48)
 GRAY = (128, 128, 128)
 No_Company_Col = (205, 192, 176)
 
-# Reference Card
-Score_Card = np.array([[ 2,  0,  0,  200,  2000, 1000],
-                       [ 3,  2,  0,  300,  3000, 1500],
-                       [ 4,  3,  2,  400,  4000, 2000],
-                       [ 5,  4,  3,  500,  5000, 2500],
-                       [ 6,  5,  4,  600,  6000, 3000],
-                       [11,  6,  5,  700,  7000, 3500],
-                       [21, 11,  6,  800,  8000, 4000],
-                       [31, 21, 11,  900,  9000, 4500],
-                       [41, 31, 21, 1000, 10000, 5000],
-                       [99, 41, 31, 1100, 11000, 5500],
-                       [99, 99, 41, 1200, 12000, 6000]])
-Score_Card_Str = np.array([[    "2",     "-",     "-",   "200",  "2,000", "1,000"],
-                           [    "3",     "2",     "-",   "300",  "3,000", "1,500"],
-                           [    "4",     "3",     "2",   "400",  "4,000", "2,000"],
-                           [    "5",     "4",     "3",   "500",  "5,000", "2,500"],
-                           [ "6-10",     "5",     "4",   "600",  "6,000", "3,000"],
-                           ["11-20",  "6-10",     "5",   "700",  "7,000", "3,500"],
-                           ["21-30", "11-20",  "6-10",   "800",  "8,000", "4,000"],
-                           ["31-40", "21-20", "11-20",   "900",  "9,000", "4,500"],
-                           [  "41+", "31-40", "21-30", "1,000", "10,000", "5,000"],
-                           [    "-",   "41+", "31-40", "1,100", "11,000", "5,500"],
-                           [    "-",     "-",   "41+", "1,200", "12,000", "6,000"]])
-
-
-# Define a Tile
-class Tile:
-    def __init__(self, row, col):
-        self.row = row
-        self.col = col
-        self.position = str(col + 1) + "abcdefghi"[row]
-        self.owner = "unplaced"
-
-    def change_ownership(self, new_owner):
-        self.owner = new_owner
-
-    # Draws the tile on the board, merger indicates a circle draw
-    def draw(self, screen, color=WHITE, merger=False):
-        rect = pygame.Rect(self.col * TILE_SIZE, self.row * TILE_SIZE, TILE_SIZE, TILE_SIZE)
-        pygame.draw.rect(screen, pygame.Color('blue'), rect)
-        pygame.draw.rect(screen, color, rect.inflate(-5, -5))
-        text = font_medium.render(f'{self.position}', True, TEXT_COLOR)
-        screen.blit(text, (self.col * TILE_SIZE + 35 - 5 * len(f'{self.position}'), self.row * TILE_SIZE + 28))
-
-        if merger:
-            circle_center = ((self.col + 0.5) * TILE_SIZE, (self.row + 0.5) * TILE_SIZE)
-            pygame.draw.circle(screen, BLACK, circle_center, 0.45 * TILE_SIZE, 3)
-
-
-# Define a Player
-class Player:
-    def __init__(self, name):
-        self.name = name
-        self.hand = []
-        self.money = 6000
-        self.stock = {}
+Hotel_Colors = {"Worldwide": PURPLE,
+                "Sackson": ORANGE,
+                "Festival": GREEN,
+                "Imperial": GOLD,
+                "American": BLUE,
+                "Continental": RED,
+                "Tower": GRAY}
 
-    def add_tile_to_hand(self, bag):
-        if len(bag) != 0:
-            tile = bag.pop(random.choice(list(bag.keys())))
-            self.hand.append(tile)
+# Reference Card, the labels of engine.Score_Card, a size column shows the range of sizes up to the next row
+def score_card_label(row, col):
+    value = Score_Card[row][col]
+    if col >= 3:
+        return f"{value:,}"
+    if value == 0 or value == 99:
+        return "-"
+    if row + 1 == len(Score_Card) or Score_Card[row + 1][col] == 99:
+        return f"{value}+"
 
-    def remove_tile_from_hand(self, tile):
-        if tile in self.hand:
-            self.hand.remove(tile)
+    last = Score_Card[row + 1][col] - 1
+    return f"{value}-{last}" if last > value else f"{value}"
 
-    def increase_money(self, amount):
-        self.money += amount
 
-    def decrease_money(self, amount):
-        self.money -= amount
+Score_Card_Str = [[score_card_label(row, col) for col in range(len(Score_Card[row]))] for row in range(len(Score_Card))]
 
-    def add_stock(self, hotel, count):
-        if hotel in self.stock:
-            self.stock[hotel] += count
-        else:
-            self.stock[hotel] = count
-
-    def remove_stock(self, hotel, count):
-        if hotel in self.stock:
-            self.stock[hotel] -= count
-
-    def invalid_tiles(self, bag={}, replace=True):
-        count = 0
-        for tile in self.hand:
-            touching_hotel = game.touching_hotel(tile)
-            if len(touching_hotel) > 1:
-                company_len = [len(hotel.tiles) for hotel in touching_hotel]
-                # More than one hotel is safe
-                if sum(1 if length >= 11 else 0 for length in company_len) > 1:
-                    # Tile is invalid
-                    if replace:
-                        self.remove_tile_from_hand(tile)
-                        self.add_tile_to_hand(bag)
-                    else:
-                        count += 1
-        if not replace:
-            return count
-
-    def playable_tiles(self):
-        count = len(self.hand) - self.invalid_tiles(replace=False)
-
-        for tile in self.hand:
-            touching_hotel = game.touching_hotel(tile)
-            new_comp_tiles = game.touching_board(tile)
-            # if the tile is not touching a hotel
-            if len(touching_hotel) == 0:
-                # check if a new company would be made but all 7 companies exist
-                if len(new_comp_tiles) >= 1 and not game.empty_companies:
-                    count -= 1
-
-        return count == 0
-
-    # draws the tiles to screen
-    def draw_tiles(self, screen):
-        for col in range(len(self.hand)):
-            rectangle = pygame.Rect(5 + (13.75 + col) * TILE_SIZE, 6.75 * TILE_SIZE + 5,
-                                    TILE_SIZE - 5, TILE_SIZE - 5)
-            pygame.draw.rect(screen, WHITE, rectangle)
 
-            label = font_medium.render(self.hand[col].position, True, BLACK)
-            screen.blit(label, label.get_rect(center=rectangle.center))
+# Rendered text by (font size, text, color), the least recently used are dropped past TEXT_CACHE_SIZE
+TEXT_CACHE_SIZE = 256
+text_cache = OrderedDict()
 
-            pygame.display.update()
+# Fonts by size, each loaded the first time text of its size is drawn
+fonts = {}
 
-    def cover_tile(self, screen, tile):
-        rectangle = pygame.Rect(5 + (13.75 + self.hand.index(tile)) * TILE_SIZE, 6.75 * TILE_SIZE + 5,
-                                TILE_SIZE - 5, TILE_SIZE - 5)
-        pygame.draw.rect(screen, BLACK, rectangle)
+# Tile images by (position, color, merger)
+tile_sprites = {}
 
-        pygame.display.update()
 
+# the game window, opened on first use so importing this module opens nothing
+game_screen = None
 
-# Define a Hotel
-class Hotel:
-    def __init__(self, name, tier, color):
-        self.name = name
-        self.tier = tier
-        self.color = color
-        self.tiles = []
-        self.available_stock = 25
-        self.stock_choice_amount = 0
 
-    @property
-    def size(self):
-        return len(self.tiles)
+def window():
+    global game_screen
+    if game_screen is None:
+        pygame.display.init()
+        game_screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+        pygame.display.set_caption('Acquire Game')
+    return game_screen
 
-    @property
-    def stock_price(self):
-        return Score_Card[next((i for i, val in enumerate(Score_Card[:, self.tier - 1])
-                                if val > self.size), - 1) - 1][3] if self.size >= 2 else 0
 
-    @property
-    def major_bonus(self):
-        return Score_Card[next((i for i, val in enumerate(Score_Card[:, self.tier - 1])
-                                if val > self.size), - 1) - 1][4] if self.size >= 2 else 0
+def font(size):
+    loaded = fonts.get(size)
+    if loaded is None:
+        pygame.font.init()
+        loaded = fonts[size] = pygame.font.Font(None, size)
+    return loaded
 
-    @property
-    def minor_bonus(self):
-        return Score_Card[next((i for i, val in enumerate(Score_Card[:, self.tier - 1])
-                                if val > self.size), - 1) - 1][5] if self.size >= 2 else 0
 
-    def add_tile(self, tile):
-        self.tiles.append(tile)
+def render_text(size, text, color):
+    key = (size, text, tuple(color))
+    label = text_cache.get(key)
 
-    def clear_tiles(self):
-        self.tiles = []
+    if label is None:
+        label = font(size).render(text, True, color)
+        text_cache[key] = label
+        if len(text_cache) > TEXT_CACHE_SIZE:
+            text_cache.popitem(last=False)
+    else:
+        text_cache.move_to_end(key)
 
-    def increase_stock(self, count):
-        self.available_stock += count
+    return label
 
-    def decrease_stock(self, count):
-        self.available_stock -= count
 
-    # keeps track of players purchasing
-    def stock_choice(self, choice):
-        if choice == self.stock_choice_amount:
-            self.stock_choice_amount = 0
-        elif choice <= self.available_stock:
-            self.stock_choice_amount = choice
+# Image of a tile, merger indicates a circle draw
+def tile_sprite(position, color, merger):
+    key = (position, tuple(color), merger)
+    sprite = tile_sprites.get(key)
 
+    if sprite is None:
+        sprite = pygame.Surface((TILE_SIZE, TILE_SIZE)).convert()
+        rect = sprite.get_rect()
+        pygame.draw.rect(sprite, pygame.Color('blue'), rect)
+        pygame.draw.rect(sprite, color, rect.inflate(-5, -5))
+        text = render_text(MEDIUM_FONT, f'{position}', TEXT_COLOR)
+        sprite.blit(text, (35 - 5 * len(f'{position}'), 28))
 
-# Define the Board
-class Board:
-    def __init__(self, rows, cols):
-        self.rows = rows
-        self.cols = cols
-        self.tiles = []
+        if merger:
+            pygame.draw.circle(sprite, BLACK, (0.5 * TILE_SIZE, 0.5 * TILE_SIZE), 0.45 * TILE_SIZE, 3)
 
-    def place_tile(self, tile):
-        self.tiles.append(tile)
+        tile_sprites[key] = sprite
 
-    def remove_tile(self, tile):
-        if tile in self.tiles:
-            self.tiles.remove(tile)
+    return sprite
 
 
-# Define the Game
+# Draws the tile on the board, merger indicates a circle draw, returns the area drawn
+def draw_tile(screen, tile, color=WHITE, merger=False):
+    rect = pygame.Rect(tile.col * TILE_SIZE, tile.row * TILE_SIZE, TILE_SIZE, TILE_SIZE)
+    screen.blit(tile_sprite(tile.position, color, merger), rect)
+    return rect
 
-class AcquireGame:
-    def __init__(self, game_items):
-        self.screen = game_items["screen"]
-        self.board = game_items["game_board"]
-        self.tile_bag = game_items["tile_bag"]
-        self.lst_players = game_items["players"]
-        self.lst_hotels = game_items["hotels"]
-        self.turn_counter = random.randint(0, len(self.lst_players) - 1)
-        self.game_state = 0
 
-    # True if empty company exists
-    @property
-    def empty_companies(self):
-        counter = 0
+# Define the Display, draws an engine game to the screen
+class GameDisplay:
+    def __init__(self, game, screen):
+        self.game = game
+        self.screen = screen
 
-        for hotel in self.lst_hotels:
-            if not hotel.tiles:
-                counter += 1
+        # (color, merger) of each board cell as last drawn, only changed cells are redrawn
+        self.cell_states = [None] * len(game.tiles)
 
-        return True if counter > 0 else False
+        # areas drawn since the last present
+        self.dirty_rects = []
 
     @property
     def active_player(self):
-        return self.lst_players[self.turn_counter]
+        return self.game.active_player
 
-    def next_game_state(self, num=1):
-        self.game_state = (self.game_state + num) % 5
+    # drawing only records the area changed, present puts every change on the window at once
+    def dirty(self, rect):
+        self.dirty_rects.append(rect)
 
-    def next_turn(self):
-        self.turn_counter = (self.turn_counter + 1) % len(self.lst_players)
-
-    def reset_stock_picks(self):
-        for hotel in self.lst_hotels:
-            hotel.stock_choice(0)
-
-    # checks what tiles on board would form a hotel with new tile
-    def touching_board(self, tile):
-        list_of_tiles = [tile]
-        prev_list = []
-
-        while list_of_tiles != prev_list:
-            prev_list = list_of_tiles.copy()
+    def blit(self, surface, dest):
+        self.dirty(self.screen.blit(surface, dest))
 
-            for c_tile in list_of_tiles:
-                for b_tile in self.board.tiles:
-                    if abs(c_tile.row - b_tile.row) == 1 and abs(c_tile.col - b_tile.col) == 0 or \
-                       abs(c_tile.row - b_tile.row) == 0 and abs(c_tile.col - b_tile.col) == 1:
-                        if b_tile not in list_of_tiles:
-                            list_of_tiles.append(b_tile)
+    def draw_rect(self, color, rect):
+        self.dirty(pygame.draw.rect(self.screen, color, rect))
 
-        list_of_tiles.remove(tile)
+    def fill(self, color):
+        self.dirty(self.screen.fill(color))
 
-        return list_of_tiles
+    # shows the changes drawn since the last frame
+    def present(self):
+        if self.dirty_rects:
+            pygame.display.update(self.dirty_rects)
+            self.dirty_rects = []
 
-    # checks if places tile is touching any hotels
-    def touching_hotel(self, tile):
-        temp_list = []
-
-        for hotel in self.lst_hotels:
-            for each_tile in hotel.tiles:
-                if abs(tile.row - each_tile.row) == 1 and abs(tile.col - each_tile.col) == 0 or \
-                   abs(tile.row - each_tile.row) == 0 and abs(tile.col - each_tile.col) == 1:
-                    if hotel not in temp_list:
-                        temp_list.append(hotel)
-
-        return temp_list
-
-    # checks endgame conditions
-    def endgame_con(self):
-        length_41 = False
-        all_hotels_safe = True
-        companies_exist = False
+    # draws the active players tiles to screen
+    def draw_tiles(self):
+        for col in range(HAND_SIZE):
+            rectangle = pygame.Rect(5 + (13.75 + col) * TILE_SIZE, 6.75 * TILE_SIZE + 5,
+                                    TILE_SIZE - 5, TILE_SIZE - 5)
 
-        # 41 or more in length
-        for hotel in self.lst_hotels:
-            if len(hotel.tiles) >= 41:
-                length_41 = True
+            # a tile played during a merger leaves an empty slot
+            if col >= len(self.active_player.hand):
+                self.draw_rect(BLACK, rectangle)
+                continue
 
-            # all hotels are safe
-            elif 0 < len(hotel.tiles) < 11:
-                all_hotels_safe = False
+            self.draw_rect(WHITE, rectangle)
 
-            # at least one hotel exists
-            if 0 < len(hotel.tiles):
-                companies_exist = True
+            label = render_text(MEDIUM_FONT, self.active_player.hand[col].position, BLACK)
+            self.blit(label, label.get_rect(center=rectangle.center))
 
-        return length_41 or (all_hotels_safe and companies_exist)
+    def cover_tile(self, tile):
+        rectangle = pygame.Rect(5 + (13.75 + self.active_player.hand.index(tile)) * TILE_SIZE, 6.75 * TILE_SIZE + 5,
+                                TILE_SIZE - 5, TILE_SIZE - 5)
+        self.draw_rect(BLACK, rectangle)
 
     # draw active player name
     def active_player_name(self):
-        label = font_medium.render(self.active_player.name + "'s Turn", True, WHITE)
-        self.screen.blit(label, (15.75 * TILE_SIZE - 6 * len(self.active_player.name), 32.5 + 6 * TILE_SIZE))
-        pygame.display.update()
+        label = render_text(MEDIUM_FONT, self.active_player.name + "'s Turn", WHITE)
+        self.blit(label, (15.75 * TILE_SIZE - 6 * len(self.active_player.name), 32.5 + 6 * TILE_SIZE))
 
     # draw active player info -> stocks, money
     def active_player_info(self):
         # Stocks
-        for iter, hotel in enumerate(self.lst_hotels):
+        for iter, hotel in enumerate(self.game.lst_hotels):
             rectangle = pygame.Rect(3 + 12.1 * TILE_SIZE, 7 + (20 + iter) / 3 * TILE_SIZE,
                                     TILE_SIZE - 6, 1 / 3 * TILE_SIZE - 9)
-            pygame.draw.rect(self.screen, hotel.color, rectangle)
+            self.draw_rect(hotel.color, rectangle)
 
-            label = font_small.render(hotel.name, True, WHITE)
-            self.screen.blit(label, label.get_rect(center=rectangle.center))
+            label = render_text(SMALL_FONT, hotel.name, WHITE)
+            self.blit(label, label.get_rect(center=rectangle.center))
 
             rectangle = pygame.Rect(3 + 13.1 * TILE_SIZE, 7 + (20 + iter) / 3 * TILE_SIZE,
                                     0.5 * (TILE_SIZE - 6), 1 / 3 * TILE_SIZE - 9)
-            pygame.draw.rect(self.screen, WHITE, rectangle)
-            label = font_small.render(str(self.active_player.stock.get(hotel.name, 0)), True, BLACK)
-            self.screen.blit(label, label.get_rect(center=rectangle.center))
+            self.draw_rect(WHITE, rectangle)
+            label = render_text(SMALL_FONT, str(self.active_player.stock[hotel.index]), BLACK)
+            self.blit(label, label.get_rect(center=rectangle.center))
 
         # Money
         rectangle = pygame.Rect(3 + 13.75 * TILE_SIZE, 7 + (8 + 1 / 5) * TILE_SIZE,
                                 TILE_SIZE - 6, 2 / 3 * TILE_SIZE - 9)
-        pygame.draw.rect(self.screen, WHITE, rectangle)
-
-        label = font_small.render("MONEY", True, BLACK)
-        self.screen.blit(label, label.get_rect(center=pygame.Rect(5 + 13.75 * TILE_SIZE, 7 + (8 + 1 / 5) * TILE_SIZE,
-                                                                  TILE_SIZE - 9, 1 / 2 * TILE_SIZE - 9).center))
-        label = font_small.render(str(self.active_player.money), True, BLACK)
-        self.screen.blit(label, label.get_rect(center=pygame.Rect(5 + 13.75 * TILE_SIZE, 7 + (8 + 2 / 5) * TILE_SIZE,
-                                                                  TILE_SIZE - 9, 1 / 2 * TILE_SIZE - 9).center))
-
-        pygame.display.update()
-
-    # draw the game board
+        self.draw_rect(WHITE, rectangle)
+
+        label = render_text(SMALL_FONT, "MONEY", BLACK)
+        self.blit(label, label.get_rect(center=pygame.Rect(5 + 13.75 * TILE_SIZE, 7 + (8 + 1 / 5) * TILE_SIZE,
+                                                           TILE_SIZE - 9, 1 / 2 * TILE_SIZE - 9).center))
+        label = render_text(SMALL_FONT, str(self.active_player.money), BLACK)
+        self.blit(label, label.get_rect(center=pygame.Rect(5 + 13.75 * TILE_SIZE, 7 + (8 + 2 / 5) * TILE_SIZE,
+                                                           TILE_SIZE - 9, 1 / 2 * TILE_SIZE - 9).center))
+
+    # colour of a cell from the ownership index
+    def cell_color(self, owner_id):
+        if owner_id == BOARD_CELL:
+            return No_Company_Col
+        elif owner_id == EMPTY_CELL:
+            return WHITE
+        return self.game.lst_hotels[owner_id - 1].color
+
+    # circles the tile being merged until the next draw_board
+    def draw_merger_tile(self, tile):
+        self.cell_states[tile.index] = (WHITE, True)
+        self.dirty(draw_tile(self.screen, tile, merger=True))
+
+    # draw the game board, only the cells that changed since the last draw
     def draw_board(self):
-        for tile in self.board.tiles:
-            tile.draw(self.screen, No_Company_Col)
-
-        for player in self.lst_players:
-            for tile in player.hand:
-                tile.draw(self.screen)
-
-        for hotel in self.lst_hotels:
-            for tile in hotel.tiles:
-                tile.draw(self.screen, hotel.color)
+        for index, owner_id in enumerate(self.game.board.cell_owners.tolist()):
+            state = (self.cell_color(owner_id), False)
 
-        for key, value in self.tile_bag.items():
-            value.draw(self.screen)
-
-        pygame.display.update()
+            if self.cell_states[index] != state:
+                self.cell_states[index] = state
+                self.dirty(draw_tile(self.screen, self.game.tiles[index], *state))
 
     # draw the reference card
     def draw_ref_card(self):
         # Draws the white and black squares on the reference card
         for col in range(6):
             rect = pygame.Rect((13 + col) * TILE_SIZE, 0, TILE_SIZE, TILE_SIZE)
-            pygame.draw.rect(self.screen, BLACK, rect)
-            pygame.draw.rect(self.screen, WHITE, rect.inflate(-6, -6))
+            self.draw_rect(BLACK, rect)
+            self.draw_rect(WHITE, rect.inflate(-6, -6))
             for row in range(3, 14):
                 rect = pygame.Rect((13 + col) * TILE_SIZE, row * 1/3 * TILE_SIZE, TILE_SIZE, 1/3 * TILE_SIZE)
-                pygame.draw.rect(self.screen, BLACK, rect)
-                pygame.draw.rect(self.screen, WHITE, rect.inflate(-6, -6))
+                self.draw_rect(BLACK, rect)
+                self.draw_rect(WHITE, rect.inflate(-6, -6))
 
         rect = pygame.Rect((13 + 4) * TILE_SIZE, 0, TILE_SIZE * 2, TILE_SIZE * 0.7)
-        pygame.draw.rect(self.screen, BLACK, rect)
-        pygame.draw.rect(self.screen, WHITE, rect.inflate(-6, -6))
+        self.draw_rect(BLACK, rect)
+        self.draw_rect(WHITE, rect.inflate(-6, -6))
 
         # Inserts the reference information - TOP
         hotel_names = []
         hotel_colors = []
-        for hotel in self.lst_hotels:
+        for hotel in self.game.lst_hotels:
             hotel_names.append(hotel.name)
             hotel_colors.append(hotel.color)
 
@@ -412,29 +290,29 @@ class AcquireGame:
             rectangle = pygame.Rect(3 + (13 + (index+1)//3) * TILE_SIZE,
                                     7 + ((index+1) % 3 + ((index+1)//3 - 1)/2) * (1/3 * TILE_SIZE - 4),
                                     TILE_SIZE - 6, 1 / 3 * TILE_SIZE - 7)
-            pygame.draw.rect(self.screen, color, rectangle)
+            self.draw_rect(color, rectangle)
 
-            label = font_small.render(name, True, WHITE)
-            self.screen.blit(label, label.get_rect(center=rectangle.center))
+            label = render_text(SMALL_FONT, name, WHITE)
+            self.blit(label, label.get_rect(center=rectangle.center))
 
         for i in range(3):
             label_str = ["STOCK", "BUY/SELL", "PRICE"][i]
-            self.screen.blit(font_small.render(label_str, True, BLACK),
-                        ((13.16 + 3.36) * TILE_SIZE - 4 * (len(label_str)),
-                        12 + i / 5 * TILE_SIZE))
-
-        label = font_small.render("SHAREHOLDERS", True, BLACK)
-        self.screen.blit(label, label.get_rect(center=pygame.Rect((13 + 4) * TILE_SIZE, 0,
-                                                                  TILE_SIZE * 2, TILE_SIZE * 0.5).center))
-        label = font_small.render("BONUS", True, BLACK)
-        self.screen.blit(label, label.get_rect(center=pygame.Rect((13 + 4) * TILE_SIZE, TILE_SIZE * 0.1,
-                                                                  TILE_SIZE * 2, TILE_SIZE * 0.7).center))
-        label = font_small.render("MAJORITY", True, BLACK)
-        self.screen.blit(label, label.get_rect(center=pygame.Rect((13 + 4) * TILE_SIZE, TILE_SIZE * 0.7,
-                                                                  TILE_SIZE, TILE_SIZE * 0.3).center))
-        label = font_small.render("MINORITY", True, BLACK)
-        self.screen.blit(label, label.get_rect(center=pygame.Rect((13 + 5) * TILE_SIZE, TILE_SIZE * 0.7,
-                                                                  TILE_SIZE, TILE_SIZE * 0.3).center))
+            self.blit(render_text(SMALL_FONT, label_str, BLACK),
+                      ((13.16 + 3.36) * TILE_SIZE - 4 * (len(label_str)),
+                       12 + i / 5 * TILE_SIZE))
+
+        label = render_text(SMALL_FONT, "SHAREHOLDERS", BLACK)
+        self.blit(label, label.get_rect(center=pygame.Rect((13 + 4) * TILE_SIZE, 0,
+                                                           TILE_SIZE * 2, TILE_SIZE * 0.5).center))
+        label = render_text(SMALL_FONT, "BONUS", BLACK)
+        self.blit(label, label.get_rect(center=pygame.Rect((13 + 4) * TILE_SIZE, TILE_SIZE * 0.1,
+                                                           TILE_SIZE * 2, TILE_SIZE * 0.7).center))
+        label = render_text(SMALL_FONT, "MAJORITY", BLACK)
+        self.blit(label, label.get_rect(center=pygame.Rect((13 + 4) * TILE_SIZE, TILE_SIZE * 0.7,
+                                                           TILE_SIZE, TILE_SIZE * 0.3).center))
+        label = render_text(SMALL_FONT, "MINORITY", BLACK)
+        self.blit(label, label.get_rect(center=pygame.Rect((13 + 5) * TILE_SIZE, TILE_SIZE * 0.7,
+                                                           TILE_SIZE, TILE_SIZE * 0.3).center))
 
 
         # Inserts the reference information - Bottom
@@ -442,633 +320,646 @@ class AcquireGame:
             for r in range(11):
                 rect = pygame.Rect((13 + c) * TILE_SIZE, (3 + r) * 1 / 3 * TILE_SIZE, TILE_SIZE, 1 / 3 * TILE_SIZE)
                 label_str = Score_Card_Str[r][c]
-                label = font_small.render(label_str, True, BLACK)
+                label = render_text(SMALL_FONT, label_str, BLACK)
                 # self.screen.blit(label, (65 - 5 * len(label_str) + (12.75 + c) * TILE_SIZE,
                 #                          33 + (r + 2) * 1/3 * TILE_SIZE))
-                self.screen.blit(label, label.get_rect(center=rect.center))
-        pygame.display.update()
+                self.blit(label, label.get_rect(center=rect.center))
 
     # draw the stock purchasing buttons
     def stock_button(self):
-        for index, hotel in enumerate(self.lst_hotels):
+        for index, hotel in enumerate(self.game.lst_hotels):
             # Hotel Name
             rectangle = pygame.Rect(3 + (12.5 + index) * TILE_SIZE, 7 + 14 / 3 * TILE_SIZE,
                                     TILE_SIZE - 6, 1 / 3 * TILE_SIZE - 9)
-            pygame.draw.rect(self.screen, hotel.color, rectangle)
+            self.draw_rect(hotel.color, rectangle)
 
-            label = font_small.render(hotel.name, True, WHITE)
-            self.screen.blit(label, label.get_rect(center=rectangle.center))
+            label = render_text(SMALL_FONT, hotel.name, WHITE)
+            self.blit(label, label.get_rect(center=rectangle.center))
 
             # Hotel Remaining Stock
             rectangle = pygame.Rect(3 + (12.5 + index) * TILE_SIZE, 7 + 15 / 3 * TILE_SIZE,
                                     TILE_SIZE - 6, 1 / 3 * TILE_SIZE - 9)
-            pygame.draw.rect(self.screen, WHITE, rectangle)
+            self.draw_rect(WHITE, rectangle)
 
-            label = font_small.render(str(hotel.available_stock) + " Left", True, BLACK)
-            self.screen.blit(label, label.get_rect(center=rectangle.center))
+            label = render_text(SMALL_FONT, str(hotel.available_stock) + " Left", BLACK)
+            self.blit(label, label.get_rect(center=rectangle.center))
 
         for row in range(3):
-            for col, hotel in enumerate(self.lst_hotels):
+            for col, hotel in enumerate(self.game.lst_hotels):
                 rectangle = pygame.Rect(3 + (12.5 + col) * TILE_SIZE, 7 + (16 + row)/3 * TILE_SIZE,
                                         TILE_SIZE - 6, 1 / 3 * TILE_SIZE - 9)
 
                 if hotel.stock_choice_amount == row + 1:
-                    pygame.draw.rect(self.screen, (0, 255, 0), rectangle)
+                    self.draw_rect((0, 255, 0), rectangle)
                 else:
-                    pygame.draw.rect(self.screen, (160, 160, 160), rectangle)
+                    self.draw_rect((160, 160, 160), rectangle)
 
-                label = font_small.render(str(row + 1), True, BLACK)
-                self.screen.blit(label, label.get_rect(center=rectangle.center))
+                label = render_text(SMALL_FONT, str(row + 1), BLACK)
+                self.blit(label, label.get_rect(center=rectangle.center))
 
                 if hotel.available_stock < row + 1:
-                    pygame.draw.rect(self.screen, BLACK, rectangle)
-        pygame.display.update()
+                    self.draw_rect(BLACK, rectangle)
 
     # draws button in bottom right with given text
     def button(self, text):
         rectangle = pygame.Rect(18 * TILE_SIZE, 8 * TILE_SIZE, 1.9 * TILE_SIZE, TILE_SIZE)
-        pygame.draw.rect(self.screen, WHITE, rectangle)
+        self.draw_rect(WHITE, rectangle)
 
-        label = font_large.render(text, True, BLACK)
-        self.screen.blit(label, label.get_rect(center=rectangle.center))
-        pygame.display.update()
+        label = render_text(LARGE_FONT, text, BLACK)
+        self.blit(label, label.get_rect(center=rectangle.center))
 
     # trade/sell/keep buttons for given hotel
     def tsk_button(self, hotel):
         rect = pygame.Rect(15 * TILE_SIZE, 8 * TILE_SIZE, 4 * TILE_SIZE, 2 * TILE_SIZE)
-        pygame.draw.rect(self.screen, BLACK, rect)
+        self.draw_rect(BLACK, rect)
 
         options = ["TRADE", "SELL", "KEEP"]
 
-        if self.active_player.stock[hotel.name] < 2:
+        if self.active_player.stock[hotel.index] < 2:
             options.pop(0)
 
         for index, text in enumerate(options[::-1]):
             rectangle = pygame.Rect((18.32 - 1.66 * index) * TILE_SIZE, 8 * TILE_SIZE, 1.6 * TILE_SIZE, TILE_SIZE)
-            pygame.draw.rect(self.screen, WHITE, rectangle)
-
-            label = font_large.render(text, True, BLACK)
-            self.screen.blit(label, label.get_rect(center=rectangle.center))
+            self.draw_rect(WHITE, rectangle)
 
-        pygame.display.update()
+            label = render_text(LARGE_FONT, text, BLACK)
+            self.blit(label, label.get_rect(center=rectangle.center))
 
     # offers end game option
     def endgame_button(self):
-        label = font_large.render("End Game?", True, WHITE)
-        self.screen.blit(label, (15.3 * TILE_SIZE, 7.85 * TILE_SIZE))
+        label = render_text(LARGE_FONT, "End Game?", WHITE)
+        self.blit(label, (15.3 * TILE_SIZE, 7.85 * TILE_SIZE))
 
         for index, text in enumerate(["Yes", "No"]):
             rectangle = pygame.Rect((15 + 1.3 * index) * TILE_SIZE, 8.25 * TILE_SIZE, 1.2 * TILE_SIZE, 0.75 * TILE_SIZE)
-            pygame.draw.rect(self.screen, WHITE, rectangle)
+            self.draw_rect(WHITE, rectangle)
 
-            label = font_large.render(text, True, BLACK)
-            self.screen.blit(label, label.get_rect(center=rectangle.center))
-        pygame.display.update()
+            label = render_text(LARGE_FONT, text, BLACK)
+            self.blit(label, label.get_rect(center=rectangle.center))
 
     # displays which hotel is being absorbed
     def hotel_choice(self, hotels):
         for index, hotel in enumerate(hotels):
             rectangle = pygame.Rect(3 + (15.25 + index % 2) * TILE_SIZE, 7 + (24 + index//2) / 3 * TILE_SIZE,
                                     TILE_SIZE - 6, 1 / 3 * TILE_SIZE - 9)
-            pygame.draw.rect(self.screen, hotel.color, rectangle)
+            self.draw_rect(hotel.color, rectangle)
 
-            label = font_small.render(hotel.name, True, WHITE)
-            self.screen.blit(label, label.get_rect(center=rectangle.center))
-        pygame.display.update()
+            label = render_text(SMALL_FONT, hotel.name, WHITE)
+            self.blit(label, label.get_rect(center=rectangle.center))
 
     def clear_info(self):
         rectangle = pygame.Rect(12 * TILE_SIZE, 6.45 * TILE_SIZE, 8 * TILE_SIZE, 3 * TILE_SIZE)
-        pygame.draw.rect(self.screen, BLACK, rectangle)
-        pygame.display.update()
+        self.draw_rect(BLACK, rectangle)
 
     def winner(self):
-        player_money = {}
-
-        for player in self.lst_players:
-            player_money[player.name] = player.money
-
-        sorted_players = sorted(player_money, key=lambda x: player_money[x], reverse=True)
-
         rectangle = pygame.Rect(12 * TILE_SIZE, 14/3 * TILE_SIZE, 8 * TILE_SIZE, 5 * TILE_SIZE)
-        pygame.draw.rect(self.screen, BLACK, rectangle)
+        self.draw_rect(BLACK, rectangle)
 
         rectangle = pygame.Rect(5 + 13 * TILE_SIZE, 7 + 14 / 3 * TILE_SIZE,
                                 6 * TILE_SIZE - 9, 3.1 * TILE_SIZE)
-        pygame.draw.rect(self.screen, WHITE, rectangle)
+        self.draw_rect(WHITE, rectangle)
 
         places = ["Winner", "Second", "Third", "Fourth", "Fifth", "Sixth"]
 
-        counts = {}
-        finish_place = [counts.setdefault(item, index) for index, item
-                        in enumerate(sorted(list(player_money.values()), reverse=True))]
-
-        for iter, (player, finish) in enumerate(zip(sorted_players, finish_place)):
+        for iter, (finish, player, money) in enumerate(self.game.standings()):
 
-            label = font_large.render(places[finish], True, BLACK)
-            self.screen.blit(label, label.get_rect(
+            label = render_text(LARGE_FONT, places[finish], BLACK)
+            self.blit(label, label.get_rect(
                 center=pygame.Rect(7 + 13 * TILE_SIZE, 7 + (14.5 / 3 + iter / 2.5) * TILE_SIZE,
                                    2 * TILE_SIZE, 0.5 * TILE_SIZE).center))
 
-            label = font_large.render(sorted_players[iter], True, BLACK)
-            self.screen.blit(label, label.get_rect(
+            label = render_text(LARGE_FONT, player, BLACK)
+            self.blit(label, label.get_rect(
                 center=pygame.Rect(7 + 15 * TILE_SIZE, 7 + (14.5 / 3 + iter / 2.5) * TILE_SIZE,
                                    2 * TILE_SIZE, 0.5 * TILE_SIZE).center))
 
-            label = font_large.render(str(player_money[sorted_players[iter]]), True, BLACK)
-            self.screen.blit(label, label.get_rect(
+            label = render_text(LARGE_FONT, str(money), BLACK)
+            self.blit(label, label.get_rect(
                 center=pygame.Rect(7 + 17 * TILE_SIZE, 7 + (14.5 / 3 + iter / 2.5) * TILE_SIZE,
                                    2 * TILE_SIZE, 0.5 * TILE_SIZE).center))
 
-        pygame.display.update()
 
-    def shareholder_bonus(self, a_hotel):
-        player_stocks = {}
-        for player in self.lst_players:
-            if a_hotel.name in player.stock:
-                if player.stock[a_hotel.name] != 0:
-                    player_stocks[player] = player.stock[a_hotel.name]
+# Player Names, one per line, a line "name:policy" is a seat played by that bot from bots.BOTS,
+# or by another client of the server for "name:remote"
+def read_players():
+    with open("player_name.txt", "r") as file:
+        lines = file.read().strip().split('\n')
 
-        max_amount = max(list(player_stocks.values()))
-        count_max_player = list(player_stocks.values()).count(max_amount)
-        total_bonus = a_hotel.major_bonus + a_hotel.minor_bonus
+    names = []
+    policies = []
+    for line in lines:
+        name, _, policy = line.partition(":")
+        names.append(name.strip())
 
-        if count_max_player > 1:
-            money_split = math.ceil((total_bonus / count_max_player) / 100) * 100
+        policy = policy.strip()
+        if policy and policy != REMOTE and policy not in BOTS:
+            raise ValueError(f"There is no bot called {policy}, choose from {', '.join(sorted(BOTS))} or {REMOTE}.")
+        policies.append(policy)
 
-            for player, stock in player_stocks.items():
-                if stock == max_amount:
-                    player.increase_money(money_split)
+    return names, policies
 
-        else:
-            for player, stock in player_stocks.items():
-                if stock == max_amount:
-                    player.increase_money(a_hotel.major_bonus)
 
-            if len(player_stocks) == 1:
-                list(player_stocks.keys())[0].increase_money(a_hotel.minor_bonus)
+# a new game from player_name.txt, with a connection the game is a new table on the server
+# or, given table, that table joined at seats
+def new_game(connection=None, table=None, seats=()):
+    try:
+        if table is not None:
+            game = connection.open(table=table, seats=seats, hotel_colors=Hotel_Colors)
+            policies = [None if seat in connection.seats else REMOTE for seat in range(len(game.lst_players))]
+        else:
+            names, policies = read_players()
 
+            if connection is not None:
+                game = connection.open(names, seats=[seat for seat, policy in enumerate(policies) if policy != REMOTE],
+                                       hotel_colors=Hotel_Colors)
+            elif REMOTE in policies:
+                raise ValueError(f"Seats played by {REMOTE} players need a server, start with --server.")
             else:
-                second_max_amount = sorted(set(list(player_stocks.values())))[-2]
-                count_sec_max_player = list(player_stocks.values()).count(second_max_amount)
+                game = new_engine_game(names, Hotel_Colors)
 
-                money_split = math.ceil((a_hotel.minor_bonus / count_sec_max_player) / 100) * 100
+    except (ValueError, OSError) as error:
+        print(error)
+        pygame.quit()
+        sys.exit()
 
-                for player, stock in player_stocks.items():
-                    if stock == second_max_amount:
-                        player.increase_money(money_split)
+    seats = [RemoteSeat(connection, seat) if policy == REMOTE else BOTS[policy]() if policy else None
+             for seat, policy in enumerate(policies)]
+    return game, start_display(game), seats
 
 
-def new_game():
-    # Tile Creation
-    tile_bag = {}
-    for row in range(9): #9
-        for col in range(12): #12
-            name = str(col + 1) + "abcdefghi"[row]
-            tile_bag[name] = Tile(row, col)
+# draws every panel of a game at the start of a turn
+def start_display(game):
+    display = GameDisplay(game, window())
 
-    # Game initialization
-    game_board = Board(9, 12)
+    # Board Setup
+    display.fill(BLACK)
+    display.draw_board()
+    display.draw_ref_card()
+    display.stock_button()
+    display.button("START")
+    display.active_player_name()
 
-    # Player Names
-    with open("player_name.txt", "r") as file:
-        player_name = file.read()
+    return display
 
-    player_name = player_name.strip().split('\n')
 
-    # Check if correct number of players
-    if len(player_name) < 2 or len(player_name) > 6:
-        print("The number of players is not allowed.")
-        pygame.quit()
-        sys.exit()
+# Screens waiting on a click, on top of the game state of the engine
+NO_TILES = "no tiles"
+HAND_OVER = "hand over"
+ENDGAME = "endgame"
+GAME_OVER = "game over"
 
-    player_list = []
 
-    for iter, player in enumerate(player_name):
-        player_list.append(Player(player_name[iter]))
+def inside(pos, left, top, right, bottom):
+    return left <= pos[0] <= right and top <= pos[1] <= bottom
 
-    # Adding tiles to players hands
-    for player in player_list:
-        for iter in range(6):
-            player.add_tile_to_hand(tile_bag)
 
-    for iter in range(len(player_list)):
-        if len(tile_bag) != 0:
-            tile = tile_bag.pop(random.choice(list(tile_bag.keys())))
-            game_board.place_tile(tile)
+def button_clicked(pos):
+    return inside(pos, TILE_SIZE * 18, TILE_SIZE * 8, TILE_SIZE * 20, TILE_SIZE * 9)
 
-    Worldwide = Hotel("Worldwide", 1, PURPLE)
-    Sackson = Hotel("Sackson", 1, ORANGE)
-    Festival = Hotel("Festival", 2, GREEN)
-    Imperial = Hotel("Imperial", 2, GOLD)
-    American = Hotel("American", 2, BLUE)
-    Continental = Hotel("Continental", 3, RED)
-    Tower = Hotel("Tower", 3, GRAY)
-    Company_List = [Worldwide, Sackson, Festival, Imperial, American, Continental, Tower]
 
-    game = AcquireGame({"game_board": game_board,
-                        "players": player_list,
-                        "hotels": Company_List,
-                        "tile_bag": tile_bag,
-                        "screen": game_screen})
+# Define the GameLoop
+# turns clicks and bot decisions into engine calls, every one is handled at once and control goes back to the frame loop
+# screen - None while the engine game state decides, else the screen waiting on a click
+# player - the player the screen has been handed to, a merger hands it to each shareholder in turn
+# seats - the bot playing each seat, None for a person, a RemoteSeat for a seat held by another client
+# connection - the server of the table, the moves made at the other seats are sent to it
+class GameLoop:
+    def __init__(self, game=None, connection=None, table=None, seats=()):
+        self.connection = connection
+        if game is None:
+            self.game, self.display, self.seats = new_game(connection, table, seats)
+        else:
+            self.game, self.display, self.seats = game, start_display(game), [None] * len(game.lst_players)
+        self.screen = None
+        self.player = None
 
-    # Board Setup
-    game.screen.fill(BLACK)
-    game.draw_board()
-    game.draw_ref_card()
-    game.stock_button()
-    game.button("START")
-    game.active_player_name()
-
-    return game
-
-
-game = new_game()
-
-# Main game loop
-game_over = False
-while True:
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            pygame.quit()
-            sys.exit()
-
-        if event.type == pygame.MOUSEBUTTONDOWN:
-            posx = event.pos[0]
-            posy = event.pos[1]
-
-            # Display Player Information
-            if game.game_state == 0 and \
-                    TILE_SIZE * 18 <= posx <= TILE_SIZE * 20 and TILE_SIZE * 8 <= posy <= TILE_SIZE * 9:
-
-                game.active_player.draw_tiles(game_screen)
-                game.active_player_info()
-                game.button("TILE")
-
-                game.next_game_state()
-
-            # Tile Selection
-            if game.game_state == 1:
-                # checks if player has no playable tiles
-                if game.active_player.playable_tiles():
-                    rectangle = pygame.Rect(15.75 * TILE_SIZE, 7.75 * TILE_SIZE + 5,
-                                            TILE_SIZE * 2, 0.2 * TILE_SIZE)
-                    label = font_small.render("No Playable Tiles", True, WHITE)
-                    game.screen.blit(label, label.get_rect(center=rectangle.center))
-                    game.button("NEXT")
-                    while True:
-                        event = pygame.event.wait()
-                        if event.type == pygame.QUIT:
-                            pygame.quit()
-                            sys.exit()
-                        if event.type == pygame.MOUSEBUTTONDOWN:
-                            if TILE_SIZE * 18 <= event.pos[0] <= TILE_SIZE * 20 and \
-                                    TILE_SIZE * 8 <= event.pos[1] <= TILE_SIZE * 9:
-                                pygame.draw.rect(game.screen, BLACK, rectangle)
-                                game.next_game_state(2)
-                                game.button("BUY")
-                                break
-                else:
-                    for c in range(len(game.active_player.hand)):
-                        if TILE_SIZE * (13.75 + c) <= posx <= TILE_SIZE * (14.75 + c) and \
-                                TILE_SIZE * (6 + 5/6) <= posy <= TILE_SIZE * (7 + 5/6):
-
-                            selected_tile = game.active_player.hand[c]
-                            touch_hotel = game.touching_hotel(selected_tile)
-                            new_company_tiles = game.touching_board(selected_tile)
-
-                            # if the placed tile is not touching a hotel
-                            if len(touch_hotel) == 0:
-
-                                # check if a new company would be made but all 7 companies exist
-                                if len(new_company_tiles) >= 1 and not game.empty_companies:
-                                    pass
-
-                                else:
-                                    game.active_player.cover_tile(game.screen, selected_tile)
-                                    game.active_player.remove_tile_from_hand(selected_tile)
-                                    game.board.place_tile(selected_tile)
-
-                                    # Check if a company is created
-                                    if len(new_company_tiles) >= 1:
-                                        game.next_game_state()
-                                        game.button("COMPANY")
-
-                                    # Move to buy
-                                    elif sum([len(hotel.tiles) for hotel in game.lst_hotels]) > 0:
-                                        game.next_game_state(2)
-                                        game.button("BUY")
-
-                                    # Skip to next turn if no company exists to buy stocks from
-                                    else:
-                                        game.next_game_state(3)
-
-                            # if the placed tile is touching exactly hotel
-                            elif len(touch_hotel) == 1:
-                                game.active_player.cover_tile(game.screen, selected_tile)
-                                game.active_player.remove_tile_from_hand(selected_tile)
-
-                                if new_company_tiles:
-                                    for tile in new_company_tiles:
-                                        game.board.remove_tile(tile)
-                                        touch_hotel[0].add_tile(tile)
-
-                                touch_hotel[0].add_tile(selected_tile)
-
-                                game.next_game_state(2)
-                                game.button("BUY")
-
-                            # if the placed tile is touching more than one hotel
-                            elif len(touch_hotel) > 1:
-                                selected_tile.draw(game_screen, merger=True)
-                                company_length = [len(hotel.tiles) for hotel in touch_hotel]
-
-                                # More than one hotel is safe
-                                if sum(1 if length >= 11 else 0 for length in company_length) > 1:
-                                    pass
-
-                                else:
-                                    max_length = max(company_length)
-                                    sorted_hotel = []
-
-                                    for size in sorted(set(company_length), reverse=True):
-                                        if company_length.count(size) == 1:
-                                            sorted_hotel.append(touch_hotel[company_length.index(size)])
-                                        else:
-                                            indices = [i for i, num in enumerate(company_length) if num == size]
-                                            temp_hotel = [touch_hotel[i] for i in indices]
-
-                                            while len(temp_hotel) > 1:
-                                                outer_loop_flag = False
-                                                game.hotel_choice(temp_hotel)
-
-                                                for event in pygame.event.get():
-                                                    if event.type == pygame.QUIT:
-                                                        pygame.quit()
-                                                        sys.exit()
-
-                                                    if event.type == pygame.MOUSEBUTTONDOWN:
-                                                        posx = event.pos[0]
-                                                        posy = event.pos[1]
-
-                                                        # Selected Hotel
-                                                        for index, hotel in enumerate(temp_hotel):
-                                                            if 7 + (15.25 + index % 2) * TILE_SIZE <= posx \
-                                                                    <= (16.25 + index % 2) * TILE_SIZE - 2 and \
-                                                                    7 + (24 + index//2) / 3 * TILE_SIZE <= posy \
-                                                                    <= (25 + index//2) / 3 * TILE_SIZE - 2:
-                                                                sorted_hotel.append(hotel)
-                                                                temp_hotel.remove(hotel)
-
-                                                                outer_loop_flag = True
-                                                                break
-
-                                                    if outer_loop_flag:
-                                                        break
-
-                                            sorted_hotel.append(temp_hotel[0])
-
-                                    large_hotel = sorted_hotel[0]
-                                    sorted_hotel.remove(large_hotel)
-
-                                    for acquired_hotel in sorted_hotel:
-                                        # Shareholder Bonus
-                                        game.shareholder_bonus(acquired_hotel)
-
-                                        game.active_player_info()
-
-                                        # Trade/Sell/Keep
-                                        for iter_turn in range(len(game.lst_players)):
-                                            if game.active_player.stock[acquired_hotel.name] != 0:
-                                                while True:
-                                                    game.tsk_button(acquired_hotel)
-
-                                                    # Show which hotel is being acquired
-                                                    rectangle = pygame.Rect(3 + 13.75 * TILE_SIZE, 10 + 7.8 * TILE_SIZE,
-                                                                            TILE_SIZE - 6, 1 / 3 * TILE_SIZE - 9)
-                                                    pygame.draw.rect(game.screen, acquired_hotel.color, rectangle)
-                                                    label = font_small.render(acquired_hotel.name, True, WHITE)
-                                                    game.screen.blit(label, label.get_rect(center=rectangle.center))
-
-                                                    event = pygame.event.wait()
-                                                    if event.type == pygame.MOUSEBUTTONDOWN:
-                                                        if event.type == pygame.QUIT:
-                                                            pygame.quit()
-                                                            sys.exit()
-
-                                                        posx = event.pos[0]
-                                                        posy = event.pos[1]
-
-                                                        # Trade
-                                                        if TILE_SIZE * 15 <= posx <= TILE_SIZE * (15 + 1.6) and \
-                                                                TILE_SIZE * 8 <= posy <= TILE_SIZE * 9:
-                                                            if game.active_player.stock[acquired_hotel.name] >= 2 and \
-                                                                    large_hotel.available_stock > 0:
-
-                                                                large_hotel.decrease_stock(1)
-                                                                game.active_player.add_stock(large_hotel.name, 1)
-                                                                game.active_player.remove_stock(acquired_hotel.name, 2)
-                                                                acquired_hotel.increase_stock(2)
-
-                                                                game.active_player_info()
-
-                                                        # Sell
-                                                        elif TILE_SIZE * (15 + 1.66) <= posx <= TILE_SIZE * (15 + 3.26) and \
-                                                                TILE_SIZE * 8 <= posy <= TILE_SIZE * 9:
-                                                            if game.active_player.stock[acquired_hotel.name] > 0:
-
-                                                                acquired_hotel.increase_stock(1)
-                                                                game.active_player.remove_stock(acquired_hotel.name, 1)
-                                                                game.active_player.increase_money(acquired_hotel.stock_price)
-
-                                                                game.active_player_info()
-
-                                                        # Keep
-                                                        elif TILE_SIZE * (15 + 3.32) <= posx <= TILE_SIZE * (15 + 4.92) and \
-                                                                TILE_SIZE * 8 <= posy <= TILE_SIZE * 9:
-                                                            break
-
-                                                        if game.active_player.stock[acquired_hotel.name] == 0:
-                                                            break
-
-                                            game.next_turn()
-
-                                            if game.active_player.stock[acquired_hotel.name] != 0:
-
-                                                game.clear_info()
-                                                game.stock_button()
-                                                game.button("START")
-                                                game.active_player_name()
-
-                                                while True:
-                                                    event = pygame.event.wait()
-                                                    if event.type == pygame.QUIT:
-                                                        pygame.quit()
-                                                        sys.exit()
-
-                                                    if event.type == pygame.MOUSEBUTTONDOWN:
-                                                        if TILE_SIZE * 18 <= event.pos[0] <= TILE_SIZE * 20 and \
-                                                                TILE_SIZE * 8 <= event.pos[1] <= TILE_SIZE * 9:
-                                                            break
-
-                                                game.active_player.draw_tiles(game_screen)
-                                                game.active_player_info()
-
-                                        game.clear_info()
-                                        game.stock_button()
-                                        game.button("START")
-                                        game.active_player_name()
+        # moves before synced have been sent to the server or came from it
+        self.synced = len(self.game.moves)
 
-                                        while True:
-                                            event = pygame.event.wait()
-                                            if event.type == pygame.QUIT:
-                                                pygame.quit()
-                                                sys.exit()
+        # bots think in the background, the window keeps drawing frames until the decision is ready
+        self.thinking = ThreadPoolExecutor(max_workers=1)
+        self.decision = None
 
-                                            if event.type == pygame.MOUSEBUTTONDOWN:
-                                                if TILE_SIZE * 18 <= event.pos[0] <= TILE_SIZE * 20 and \
-                                                        TILE_SIZE * 8 <= event.pos[1] <= TILE_SIZE * 9:
-                                                    break
-
-                                        game.active_player.draw_tiles(game_screen)
-                                        game.active_player_info()
-
-                                        # Move tiles to new hotel
-                                        large_hotel.tiles.extend(acquired_hotel.tiles)
-                                        acquired_hotel.clear_tiles()
-
-                                    # Remove played Tile
-                                    game.active_player.cover_tile(game.screen, selected_tile)
-                                    game.active_player.remove_tile_from_hand(selected_tile)
-                                    large_hotel.add_tile(selected_tile)
-
-                                    # Move tiles on board next to played tile
-                                    if new_company_tiles:
-                                        for tile in new_company_tiles:
-                                            game.board.remove_tile(tile)
-                                            large_hotel.add_tile(tile)
+    # the bot that has to act next, None if a person does
+    @property
+    def bot(self):
+        if self.screen == GAME_OVER:
+            return None
+        return self.seats[self.game.turn_counter]
+
+    def click(self, pos):
+        if self.bot is not None:
+            return
+
+        seat = self.game.turn_counter
+
+        if self.screen == NO_TILES:
+            self.no_tiles_click(pos)
+        elif self.screen == HAND_OVER:
+            self.hand_over_click(pos)
+        elif self.screen == ENDGAME:
+            self.endgame_click(pos)
+        elif self.screen == GAME_OVER:
+            self.game_over_click(pos)
+        elif self.game.game_state == 0:
+            self.start_click(pos)
+        elif self.game.merger is not None:
+            self.merger_click(pos)
+        elif self.game.game_state == 1:
+            self.tile_click(pos)
+        elif self.game.game_state == 2:
+            self.company_click(pos)
+        elif self.game.game_state == 3:
+            self.stock_click(pos)
+
+        self.check_turn_over()
+        self.sync(seat)
+
+    # once a frame, starts the decision of a bot seat or acts on it once it is ready
+    def update(self):
+        bot = self.bot
+        if bot is None:
+            return
+
+        game = self.game
+        seat = game.turn_counter
+
+        if self.decision is not None:
+            if not self.decision.done():
+                return
+            act, choice = self.decision.result()
+            self.decision = None
+
+            # a remote seat has nothing to play once the connection is lost
+            if choice is None:
+                return
+            act(choice)
+
+        # nothing to think about, the bot presses the button at once
+        elif self.screen == NO_TILES:
+            self.skip_tiles()
+        elif self.screen == HAND_OVER:
+            self.take_screen()
+        elif game.game_state == 0:
+            self.start_turn()
+
+        elif self.screen == ENDGAME:
+            self.think(self.end_game, bot.end_game, game)
+        elif game.merger is not None and game.merger.state == MERGER_ORDER:
+            self.think(self.order_hotels, bot.order_hotels, game, list(game.merger.groups[0]))
+        elif game.merger is not None:
+            self.think(self.merger_action, bot.merger_action, game, game.merger.acquired_hotel,
+                       game.merger.large_hotel)
+        elif game.game_state == 1:
+            self.think(self.play_tile, bot.choose_tile, game,
+                       [tile for tile in game.active_player.hand if not game.unplayable_tile(tile)])
+        elif game.game_state == 2:
+            self.think(self.found_hotel, bot.choose_hotel, game,
+                       [hotel for hotel in game.lst_hotels if not hotel.tiles])
+        elif game.game_state == 3:
+            self.think(self.buy_stock, bot.choose_stock, game)
+
+        self.check_turn_over()
+        self.sync(seat)
+
+    # runs a bot decision in the background, act is called with the choice once it is made
+    def think(self, act, decide, *args):
+        self.decision = self.thinking.submit(lambda: (act, decide(*args)))
+
+    # sends the moves made at seat since the last sync to the server, unless they came from it
+    def sync(self, seat):
+        moves = self.game.moves[self.synced:]
+        self.synced = len(self.game.moves)
+
+        if self.connection is not None and moves and not isinstance(self.seats[seat], RemoteSeat):
+            self.connection.send_moves(moves)
+
+    def check_turn_over(self):
+        if self.game.game_state == 4 and self.screen is None:
+            self.turn_over()
+
+    # Game state 0 - shows the player their tiles
+    def start_click(self, pos):
+        if button_clicked(pos):
+            self.start_turn()
+
+    def start_turn(self):
+        self.display.draw_tiles()
+        self.display.active_player_info()
+        self.display.button("TILE")
+
+        self.player = self.game.active_player
+        self.game.next_game_state()
+
+        # checks if player has no playable tiles
+        if self.game.active_player.playable_tiles(self.game):
+            label = render_text(SMALL_FONT, "No Playable Tiles", WHITE)
+            self.display.blit(label, label.get_rect(center=no_tiles_rect().center))
+            self.display.button("NEXT")
+            self.screen = NO_TILES
+
+    def no_tiles_click(self, pos):
+        if button_clicked(pos):
+            self.skip_tiles()
+
+    def skip_tiles(self):
+        self.display.draw_rect(BLACK, no_tiles_rect())
+        self.game.next_game_state(2)
+        self.display.button("BUY")
+        self.screen = None
+
+    # Game state 1 - Tile Selection
+    def tile_click(self, pos):
+        for c, tile in enumerate(self.game.active_player.hand):
+            if inside(pos, TILE_SIZE * (13.75 + c), TILE_SIZE * (6 + 5/6),
+                      TILE_SIZE * (14.75 + c), TILE_SIZE * (7 + 5/6)):
+                self.play_tile(tile)
+                return
+
+    def play_tile(self, tile):
+        game = self.game
+
+        # if the placed tile is touching more than one hotel
+        if len(game.touching_hotel(tile)) > 1:
+            self.display.draw_merger_tile(tile)
+
+            # More than one hotel is safe
+            if not game.dead_tile(tile):
+                self.display.cover_tile(tile)
+                game.start_merger(tile)
+                self.show_merger()
+                return
+
+        # check if a new company would be made but all 7 companies exist
+        elif not game.unplayable_tile(tile):
+            self.display.cover_tile(tile)
+            game.place_tile(tile)
+
+            # Check if a company is created
+            if game.game_state == 2:
+                self.display.button("COMPANY")
+
+            # Move to buy
+            elif game.game_state == 3:
+                self.display.button("BUY")
 
-                                    game.button("BUY")
-                                    game.next_game_state(2)
-
-                            game.draw_board()
+        self.display.draw_board()
 
-            # Company Creation
-            elif game.game_state == 2:
-                for row, hotel in enumerate(game.lst_hotels):
-                    if len(hotel.tiles) == 0 and \
-                            TILE_SIZE * 12.1 + 3 <= posx <= TILE_SIZE * 13.2 - 3 and \
-                            TILE_SIZE * (20 + row) / 3 + 7 <= posy <= TILE_SIZE * (21 + row) / 3 - 2:
+    # Merger - draws the step the merger is waiting on
+    def show_merger(self):
+        game = self.game
+        merger = game.merger
 
-                        for tile in new_company_tiles:
-                            game.board.remove_tile(tile)
+        if merger is not None and merger.state == MERGER_ORDER:
+            self.display.hotel_choice(merger.groups[0])
 
-                        game.board.remove_tile(selected_tile)
+        # the next player to answer sits down at the screen first
+        elif game.active_player is not self.player:
+            self.display.clear_info()
+            self.display.stock_button()
+            self.display.button("START")
+            self.display.active_player_name()
+            self.screen = HAND_OVER
 
-                        hotel.tiles = new_company_tiles + [selected_tile]
+        elif merger is not None:
+            self.display.active_player_info()
+            self.display.tsk_button(merger.acquired_hotel)
 
-                        if hotel.available_stock > 0:
-                            game.active_player.add_stock(hotel.name, 1)
-                            hotel.decrease_stock(1)
-                            game.active_player_info()
-                            game.stock_button()
+            # Show which hotel is being acquired
+            rectangle = pygame.Rect(3 + 13.75 * TILE_SIZE, 10 + 7.8 * TILE_SIZE, TILE_SIZE - 6, 1 / 3 * TILE_SIZE - 9)
+            self.display.draw_rect(merger.acquired_hotel.color, rectangle)
+            label = render_text(SMALL_FONT, merger.acquired_hotel.name, WHITE)
+            self.display.blit(label, label.get_rect(center=rectangle.center))
 
-                        game.draw_board()
-                        game.next_game_state()
-                        game.button("BUY")
+        # merger complete, back to the merging player to buy
+        else:
+            self.display.clear_info()
+            self.display.stock_button()
+            self.display.draw_tiles()
+            self.display.active_player_info()
+            self.display.button("BUY")
+            self.display.draw_board()
+
+    def hand_over_click(self, pos):
+        if button_clicked(pos):
+            self.take_screen()
+
+    def take_screen(self):
+        self.display.draw_tiles()
+        self.display.active_player_info()
+
+        self.player = self.game.active_player
+        self.screen = None
+        self.show_merger()
+
+    def merger_click(self, pos):
+        if self.game.merger.state == MERGER_ORDER:
+            # Selected Hotel
+            for index, hotel in enumerate(self.game.merger.groups[0]):
+                if inside(pos, 7 + (15.25 + index % 2) * TILE_SIZE, 7 + (24 + index//2) / 3 * TILE_SIZE,
+                          (16.25 + index % 2) * TILE_SIZE - 2, (25 + index//2) / 3 * TILE_SIZE - 2):
+                    self.order_hotels([hotel])
+                    return
+
+        # Trade
+        elif inside(pos, TILE_SIZE * 15, TILE_SIZE * 8, TILE_SIZE * (15 + 1.6), TILE_SIZE * 9):
+            self.merger_action(TRADE)
+
+        # Sell
+        elif inside(pos, TILE_SIZE * (15 + 1.66), TILE_SIZE * 8, TILE_SIZE * (15 + 3.26), TILE_SIZE * 9):
+            self.merger_action(SELL)
+
+        # Keep
+        elif inside(pos, TILE_SIZE * (15 + 3.32), TILE_SIZE * 8, TILE_SIZE * (15 + 4.92), TILE_SIZE * 9):
+            self.merger_action(KEEP)
+
+    # Merger tie-break - hotels in the order chosen, the last of a group follows on its own
+    def order_hotels(self, hotels):
+        for hotel in hotels:
+            if self.game.merger is not None and self.game.merger.state == MERGER_ORDER:
+                self.game.choose_merger_hotel(hotel)
+        self.show_merger()
+
+    def merger_action(self, action):
+        if action == TRADE:
+            if not self.game.merger_trade() and self.bot is not None:
+                self.game.merger_keep()
+        elif action == SELL:
+            self.game.merger_sell()
+        else:
+            self.game.merger_keep()
 
-            # Selecting which stocks to buy
-            elif game.game_state == 3:
-                for row in range(3):
-                    for col, hotel in enumerate(game.lst_hotels):
-                        if hotel.tiles:
-                            if (12.5 + col) * TILE_SIZE + 3 <= posx <= (13.5 + col) * TILE_SIZE - 3 and \
-                                    TILE_SIZE * (16 + row)/3 + 7 <= posy <= TILE_SIZE * (17 + row)/3 - 2:
-
-                                cur_stock_amount = hotel.stock_choice_amount
-                                hotel.stock_choice(row + 1)
-
-                                cost_of_purchase = 0
-                                purchase_count = 0
-                                for c_hotel in game.lst_hotels:
-                                    cost_of_purchase += c_hotel.stock_price * c_hotel.stock_choice_amount
-                                    purchase_count += c_hotel.stock_choice_amount
-
-                                if cost_of_purchase > game.active_player.money or purchase_count > 3:
-                                    hotel.stock_choice(cur_stock_amount)
-
-                                game.stock_button()
-
-                if TILE_SIZE * 18 <= posx <= TILE_SIZE * 20 and \
-                        TILE_SIZE * 8 <= posy <= TILE_SIZE * 9:
-                    for hotel in game.lst_hotels:
-                        game.active_player.add_stock(hotel.name, hotel.stock_choice_amount)
-                        game.active_player.decrease_money(hotel.stock_price * hotel.stock_choice_amount)
-                        hotel.decrease_stock(hotel.stock_choice_amount)
-                        hotel.stock_choice(0)
-
-                    game.reset_stock_picks()
-                    game.stock_button()
-                    game.next_game_state()
-
-        if game.game_state == 4:
-            # Check For Game Ending Conditions
-            if game.endgame_con():
-                game.endgame_button()
-
-                while True:
-                    event = pygame.event.wait()
-                    if event.type == pygame.QUIT:
-                        pygame.quit()
-                        sys.exit()
-
-                    if event.type == pygame.MOUSEBUTTONDOWN:
-                        if 15 * TILE_SIZE <= event.pos[0] <= 16.2 * TILE_SIZE and \
-                                8.25 * TILE_SIZE <= event.pos[1] <= 9 * TILE_SIZE:
-                            game_over = True
-                            break
-                        elif 16.3 * TILE_SIZE <= event.pos[0] <= 17.5 * TILE_SIZE and \
-                                8.25 * TILE_SIZE <= event.pos[1] <= 9 * TILE_SIZE:
-                            break
-
-            if not game_over:
-                # Next Players Turn
-                game.active_player.add_tile_to_hand(game.tile_bag)
-                game.active_player.invalid_tiles(game.tile_bag, replace=True)
-
-                game.next_game_state()
-                game.next_turn()
-                game.clear_info()
-                game.button("START")
-                game.active_player_name()
-
-        # Game Over
-        if game_over:
-            # Scoring
-
-            # Shareholder Bonuses
-            for hotel in game.lst_hotels:
-                if hotel.available_stock != 25:
-                    game.shareholder_bonus(hotel)
-
-                    # Stock Payout
-                    for player in game.lst_players:
-                        player.increase_money(hotel.stock_price * player.stock[hotel.name])
-
-            # Final Scores
-            game.winner()
-
-            # Play Again
-            while True:
-                game.button("Play Again")
-                event = pygame.event.wait()
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    sys.exit()
-
-                if event.type == pygame.MOUSEBUTTONDOWN:
-                    if TILE_SIZE * 18 <= event.pos[0] <= TILE_SIZE * 20 and \
-                            TILE_SIZE * 8 <= event.pos[1] <= TILE_SIZE * 9:
-                        game = new_game()
-                        game_over = False
-                        break
+        self.show_merger()
 
+    # Game state 2 - Company Creation
+    def company_click(self, pos):
+        for row, hotel in enumerate(self.game.lst_hotels):
+            if len(hotel.tiles) == 0 and \
+                    inside(pos, TILE_SIZE * 12.1 + 3, TILE_SIZE * (20 + row) / 3 + 7,
+                           TILE_SIZE * 13.2 - 3, TILE_SIZE * (21 + row) / 3 - 2):
+                self.found_hotel(hotel)
+                return
+
+    def found_hotel(self, hotel):
+        self.game.found_hotel(hotel)
+
+        self.display.active_player_info()
+        self.display.stock_button()
+        self.display.draw_board()
+        self.display.button("BUY")
+
+    # Game state 3 - Selecting which stocks to buy
+    def stock_click(self, pos):
+        for row in range(3):
+            for col, hotel in enumerate(self.game.lst_hotels):
+                if hotel.tiles and inside(pos, (12.5 + col) * TILE_SIZE + 3, TILE_SIZE * (16 + row)/3 + 7,
+                                          (13.5 + col) * TILE_SIZE - 3, TILE_SIZE * (17 + row)/3 - 2):
+
+                    self.game.choose_stock(hotel, row + 1)
+                    self.display.stock_button()
+
+        if button_clicked(pos):
+            self.buy_stock([])
+
+    # picks the purchase best_buy suggests in place of the picks so far, the player can change it before BUY
+    def suggest_buy(self):
+        if self.bot is not None or self.screen is not None or self.game.game_state != 3:
+            return
+
+        self.game.reset_stock_picks()
+        for hotel in best_buy(self.game):
+            self.game.choose_stock(hotel, hotel.stock_choice_amount + 1)
+        self.display.stock_button()
+
+    # buys the stocks picked so far and one more of each hotel in picks
+    def buy_stock(self, picks):
+        for hotel in picks:
+            self.game.choose_stock(hotel, hotel.stock_choice_amount + 1)
+
+        self.game.buy_stock()
+        self.display.stock_button()
+
+    # Game state 4 - Check For Game Ending Conditions
+    # the game can be ended as in legal_moves, a remote seat sends END_GAME or END_TURN only from this screen
+    def turn_over(self):
+        if self.game.endgame_con() or self.game.stalemate():
+            self.display.endgame_button()
+            self.screen = ENDGAME
+        else:
+            self.next_turn()
+
+    # Next Players Turn
+    def next_turn(self):
+        self.game.end_turn()
+
+        self.display.clear_info()
+        self.display.button("START")
+        self.display.active_player_name()
+
+    def endgame_click(self, pos):
+        if inside(pos, 15 * TILE_SIZE, 8.25 * TILE_SIZE, 16.2 * TILE_SIZE, 9 * TILE_SIZE):
+            self.end_game(True)
+        elif inside(pos, 16.3 * TILE_SIZE, 8.25 * TILE_SIZE, 17.5 * TILE_SIZE, 9 * TILE_SIZE):
+            self.end_game(False)
+
+    def end_game(self, end):
+        if not end:
+            self.screen = None
+            self.next_turn()
+            return
+
+        # Scoring
+        self.game.final_scoring()
+        save_log(self.game, LOG_FILE)
+
+        # Final Scores
+        self.display.winner()
+
+        # Play Again, a table on the server is played once
+        if self.connection is None:
+            self.display.button("Play Again")
+        self.screen = GAME_OVER
+
+    def game_over_click(self, pos):
+        if button_clicked(pos) and self.connection is None:
+            self.game, self.display, self.seats = new_game()
+            self.synced = len(self.game.moves)
+            self.screen = None
+
+
+# drawing and window updates timed with --profile, next to the engine functions in instrument.WATCHED
+instrument.watch(GameDisplay, "draw_tiles", "active_player_info", "draw_board", "draw_ref_card", "present")
+instrument.watch(GameLoop, "click", "update")
+instrument.watch(pygame.display, "update")
+
+
+def no_tiles_rect():
+    return pygame.Rect(15.75 * TILE_SIZE, 7.75 * TILE_SIZE + 5, TILE_SIZE * 2, 0.2 * TILE_SIZE)
+
+
+# game carries on a game from replay.py instead of starting a new one
+# with a connection the game is played at a table on the server, see GameLoop
+# profile is a file the timings of instrument.py are saved to on quitting
+def main(game=None, connection=None, table=None, seats=(), profile=None):
+    if profile is not None:
+        instrument.enable()
+
+    loop = GameLoop(game, connection, table, seats)
+    clock = pygame.time.Clock()
+
+    # Main game loop, one update of the window per frame
+    while True:
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                save_log(loop.game, LOG_FILE)
+                if profile is not None:
+                    instrument.disable().save(profile)
+                if connection is not None:
+                    connection.close()
+                pygame.quit()
+                sys.exit()
+
+            if event.type == pygame.MOUSEBUTTONDOWN:
+                loop.click(event.pos)
+
+            # H in the buy phase suggests a purchase
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_h:
+                loop.suggest_buy()
+
+        loop.update()
+        loop.display.present()
+        clock.tick(FRAME_RATE)
+        instrument.frame(clock.get_rawtime())
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Play Acquire in a window, alone or at a table on server.py.")
+    parser.add_argument("--server", nargs="?", const=f"{HOST}:{PORT}", default=None, metavar="HOST:PORT",
+                        help="play at a table on the server, a new one from player_name.txt unless --table is given")
+    parser.add_argument("--table", type=int, default=None, help="join this table on the server")
+    parser.add_argument("--seats", default="", help="comma separated seats, from 0, to take at the joined table")
+    parser.add_argument("--profile", default=None, metavar="FILE",
+                        help="time the engine and drawing, saved on quitting as JSON or as folded stacks for a "
+                             "flamegraph when FILE ends in .folded")
+    return parser.parse_args(argv)
+
+
+# application entry point, the window opens once the first game is drawn
+def app(argv=None):
+    args = parse_args(argv)
+
+    if args.server is None:
+        main(profile=args.profile)
+    else:
+        host, _, port = args.server.rpartition(":")
+        try:
+            connection = Connection(host or HOST, int(port))
+        except OSError as error:
+            print(f"Could not connect to {args.server}: {error}")
+            sys.exit(1)
+        main(connection=connection, table=args.table, seats=[int(seat) for seat in args.seats.split(",") if seat],
+             profile=args.profile)
+
+
+if __name__ == "__main__":
+    app()
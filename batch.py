@@ -0,0 +1,289 @@
+import sys
+import time
+
+import numpy as np
+
+from engine import (ROW_COUNT, COLUMN_COUNT, HOTEL_LIST, HAND_SIZE, START_MONEY, START_STOCK, SAFE_SIZE,
+                    END_SIZE, EMPTY_CELL, BOARD_CELL, Price_Table)
+
+CELL_COUNT = ROW_COUNT * COLUMN_COUNT
+HOTEL_COUNT = len(HOTEL_LIST)
+
+# Padding cell, always empty, used for missing neighbours and empty hand slots
+NO_CELL = CELL_COUNT
+
+# Merger choices for held stock of an acquired hotel
+KEEP = 0
+SELL = 1
+TRADE = 2
+
+# (tier, size, price/major/minor) lookups for every hotel at once
+Price_Array = np.array(Price_Table, dtype=np.int64)
+Hotel_Tiers = np.array([tier - 1 for name, tier in HOTEL_LIST])
+
+# cell -> the four neighbouring cells, NO_CELL off the board
+Neighbours = np.full((CELL_COUNT + 1, 4), NO_CELL, dtype=np.int64)
+for index in range(CELL_COUNT):
+    row, col = divmod(index, COLUMN_COUNT)
+    for iter, (r, c) in enumerate(((row - 1, col), (row + 1, col), (row, col - 1), (row, col + 1))):
+        if 0 <= r < ROW_COUNT and 0 <= c < COLUMN_COUNT:
+            Neighbours[index, iter] = r * COLUMN_COUNT + c
+
+
+# grows each region in a (N, CELL_COUNT) bool array by one cell in every direction
+def grow(region):
+    grid = region.reshape(-1, ROW_COUNT, COLUMN_COUNT)
+    grown = grid.copy()
+    grown[:, 1:, :] |= grid[:, :-1, :]
+    grown[:, :-1, :] |= grid[:, 1:, :]
+    grown[:, :, 1:] |= grid[:, :, :-1]
+    grown[:, :, :-1] |= grid[:, :, 1:]
+    return grown.reshape(-1, CELL_COUNT)
+
+
+# Define the BatchGame
+# N games with the same number of players stepped together, each array has the game as its first axis
+# the rules follow AcquireGame, with hotels of equal size in a merger taken in hotel order
+# and dead tiles left in the hand rather than replaced
+class BatchGame:
+    def __init__(self, n_games, n_players, seed=None):
+        self.rng = np.random.default_rng(seed)
+        self.n_games = n_games
+        self.n_players = n_players
+        self.games = np.arange(n_games)
+
+        # owner of each cell as in the Board ownership index, plus the NO_CELL padding column
+        self.owners = np.full((n_games, CELL_COUNT + 1), EMPTY_CELL, dtype=np.int8)
+        self.sizes = np.zeros((n_games, HOTEL_COUNT), dtype=np.int64)
+        self.prices = Price_Array[Hotel_Tiers, self.sizes]
+        self.available_stock = np.full((n_games, HOTEL_COUNT), START_STOCK, dtype=np.int64)
+
+        self.money = np.full((n_games, n_players), START_MONEY, dtype=np.int64)
+        self.stock = np.zeros((n_games, n_players, HOTEL_COUNT), dtype=np.int64)
+
+        # each game draws from its own shuffled bag
+        self.bag = self.rng.permuted(np.tile(np.arange(CELL_COUNT), (n_games, 1)), axis=1)
+        self.hands = self.bag[:, :n_players * HAND_SIZE].reshape(n_games, n_players, HAND_SIZE).copy()
+        start = self.bag[:, n_players * HAND_SIZE:n_players * (HAND_SIZE + 1)]
+        self.owners[self.games[:, None], start] = BOARD_CELL
+        self.bag_pos = np.full(n_games, n_players * (HAND_SIZE + 1))
+
+        self.turn = self.rng.integers(0, n_players, n_games)
+        self.passes = np.zeros(n_games, dtype=np.int64)
+        self.steps = np.zeros(n_games, dtype=np.int64)
+        self.mergers = np.zeros(n_games, dtype=np.int64)
+        self.done = np.zeros(n_games, dtype=bool)
+
+    @property
+    def stock_price(self):
+        return self.prices[..., 0]
+
+    # counts the cells of every hotel and looks up their prices
+    def update_sizes(self):
+        counts = np.bincount((self.games[:, None] * (HOTEL_COUNT + 2) + self.owners - BOARD_CELL).ravel(),
+                             minlength=self.n_games * (HOTEL_COUNT + 2))
+        self.sizes = counts.reshape(self.n_games, HOTEL_COUNT + 2)[:, 2:]
+        self.prices = Price_Array[Hotel_Tiers, self.sizes]
+
+    @property
+    def active_hands(self):
+        return self.hands[self.games, self.turn]
+
+    # hotels next to each cell of cells (N, ...) as a one-hot array (N, ..., HOTEL_COUNT)
+    def touching_hotels(self, cells):
+        near = self.owners[self.games.reshape((-1,) + (1,) * cells.ndim), Neighbours[cells]]
+        return (near[..., None] == np.arange(1, HOTEL_COUNT + 1)).any(axis=-2)
+
+    def touching_board(self, cells):
+        near = self.owners[self.games.reshape((-1,) + (1,) * cells.ndim), Neighbours[cells]]
+        return (near == BOARD_CELL).any(axis=-1)
+
+    # which tiles of the active hand can be played (N, HAND_SIZE)
+    def legal_tiles(self):
+        cells = np.where(self.active_hands < 0, NO_CELL, self.active_hands)
+        hotels = self.touching_hotels(cells)
+
+        safe = self.sizes >= SAFE_SIZE
+        dead = (hotels & safe[:, None, :]).sum(-1) >= 2
+        founding = ~hotels.any(-1) & self.touching_board(cells)
+        no_free_hotel = ~(self.sizes == 0).any(-1)
+
+        return (cells != NO_CELL) & ~dead & ~(founding & no_free_hotel[:, None]) & ~self.done[:, None]
+
+    # random legal moves for every game: hand slot, hotel to found, up to 3 stocks to buy and merger choices
+    def random_moves(self):
+        legal = self.legal_tiles()
+        scores = np.where(legal, self.rng.random(legal.shape), -1)
+        slots = np.where(legal.any(-1), scores.argmax(-1), -1)
+
+        found = self.rng.integers(0, HOTEL_COUNT, self.n_games)
+        buys = np.where(self.rng.random((self.n_games, 3)) < 0.5,
+                        self.rng.integers(0, HOTEL_COUNT, (self.n_games, 3)), -1)
+        dispose = self.rng.integers(KEEP, TRADE + 1, (self.n_games, self.n_players))
+        return slots, found, buys, dispose
+
+    # pays the majority and minority bonus of hotel h in the games of mask, as in shareholder_bonus
+    # h is one hotel for every game or a hotel per game
+    def shareholder_bonus(self, mask, h):
+        holdings = np.where(mask[:, None], self.stock[self.games, :, h], 0)
+        prices = self.prices[self.games, h]
+        major, minor = prices[:, 1:2], prices[:, 2:3]
+
+        max_amount = holdings.max(1, keepdims=True)
+        is_max = (holdings == max_amount) & (holdings > 0)
+        count_max = is_max.sum(1, keepdims=True)
+        holders = (holdings > 0).sum(1, keepdims=True)
+
+        second_amount = np.where(is_max, 0, holdings).max(1, keepdims=True)
+        is_second = (holdings == second_amount) & (holdings > 0) & ~is_max
+        count_second = np.maximum(is_second.sum(1, keepdims=True), 1)
+
+        tie_split = np.ceil((major + minor) / np.maximum(count_max, 1) / 100).astype(np.int64) * 100
+        minor_split = np.ceil(minor / count_second / 100).astype(np.int64) * 100
+
+        bonus = np.where(is_max & (count_max > 1), tie_split, 0)
+        bonus += np.where(is_max & (count_max == 1), major, 0)
+        bonus += np.where(is_max & (count_max == 1) & (holders == 1), minor, 0)
+        bonus += np.where(is_second & (count_max == 1), minor_split, 0)
+        self.money += bonus
+
+    # trade/sell/keep of every player for hotel h acquired by survivor, players in turn order
+    def dispose_stock(self, mask, h, survivor, dispose):
+        price = self.stock_price[self.games, h]
+        for offset in range(self.n_players):
+            player = (self.turn + offset) % self.n_players
+            held = np.where(mask, self.stock[self.games, player, h], 0)
+            choice = dispose[self.games, player]
+
+            traded = np.where(choice == TRADE, np.minimum(held // 2, self.available_stock[self.games, survivor]), 0)
+            self.available_stock[self.games, survivor] -= traded
+            self.stock[self.games, player, survivor] += traded
+            held -= 2 * traded
+
+            sold = np.where(choice == SELL, held, 0)
+            self.money[self.games, player] += sold * price
+
+            self.stock[self.games, player, h] -= 2 * traded + sold
+            self.available_stock[self.games, h] += 2 * traded + sold
+
+    # applies one turn in every unfinished game
+    def step(self, slots, found, buys, dispose=None):
+        if dispose is None:
+            dispose = np.full((self.n_games, self.n_players), KEEP)
+
+        legal = self.legal_tiles()
+        playing = (slots >= 0) & legal[self.games, np.maximum(slots, 0)] & ~self.done
+        cells = np.where(playing, self.active_hands[self.games, np.maximum(slots, 0)], NO_CELL)
+
+        hotels = self.touching_hotels(cells)
+        hotel_count = hotels.sum(-1)
+
+        # the played tile and every board tile connected to it
+        is_board = self.owners[:, :CELL_COUNT] == BOARD_CELL
+        region = np.zeros((self.n_games, CELL_COUNT), dtype=bool)
+        region[self.games[playing], cells[playing]] = True
+        while True:
+            grown = region | (grow(region) & is_board)
+            if (grown == region).all():
+                break
+            region = grown
+
+        # founding - fall back to the first free hotel when the choice is taken
+        founding = playing & (hotel_count == 0) & (region.sum(-1) > 1)
+        free = self.sizes == 0
+        found = np.where(free[self.games, found % HOTEL_COUNT], found % HOTEL_COUNT, free.argmax(-1))
+
+        # survivor of a merger is the largest touching hotel
+        merging = playing & (hotel_count > 1)
+        survivor = np.where(hotels, self.sizes, -1).argmax(-1)
+        owner = np.where(hotel_count == 0, np.where(founding, found + 1, BOARD_CELL), survivor + 1)
+
+        # the acquired hotels are paid out and disposed of from largest to smallest, as in next_acquired
+        if merging.any():
+            self.mergers += merging
+            acquired_sizes = np.where(hotels & (np.arange(HOTEL_COUNT) != survivor[:, None]), self.sizes, -1)
+            order = np.argsort(-acquired_sizes, axis=-1, kind="stable")
+            for rank in range(HOTEL_COUNT - 1):
+                h = order[:, rank]
+                acquired = merging & (acquired_sizes[self.games, h] >= 0)
+                if acquired.any():
+                    self.shareholder_bonus(acquired, h)
+                    self.dispose_stock(acquired, h, survivor, dispose)
+                    moved = acquired[:, None] & (self.owners == h[:, None] + 1)
+                    self.owners[moved] = np.broadcast_to(owner[:, None], moved.shape)[moved]
+
+        self.owners[:, :CELL_COUNT][region] = np.broadcast_to(owner[:, None], region.shape)[region]
+        self.update_sizes()
+
+        # founder's free stock
+        bonus_stock = founding & (self.available_stock[self.games, found] > 0)
+        self.stock[self.games[bonus_stock], self.turn[bonus_stock], found[bonus_stock]] += 1
+        self.available_stock[self.games[bonus_stock], found[bonus_stock]] -= 1
+
+        # buying stock, one purchase at a time
+        for k in range(buys.shape[1]):
+            h = np.maximum(buys[:, k], 0)
+            price = self.stock_price[self.games, h]
+            buying = (~self.done & (buys[:, k] >= 0) & (self.sizes[self.games, h] > 0) &
+                      (self.available_stock[self.games, h] > 0) & (self.money[self.games, self.turn] >= price))
+            self.stock[self.games[buying], self.turn[buying], h[buying]] += 1
+            self.available_stock[self.games[buying], h[buying]] -= 1
+            self.money[self.games[buying], self.turn[buying]] -= price[buying]
+
+        # refill the hand
+        drawn = np.where(self.bag_pos < CELL_COUNT, self.bag[self.games, np.minimum(self.bag_pos, CELL_COUNT - 1)], -1)
+        self.hands[self.games[playing], self.turn[playing], slots[playing]] = drawn[playing]
+        self.bag_pos += playing
+
+        # a game is over when a hotel reaches 41, every hotel is safe, or every player in a row has nothing to play
+        # dead tiles stay in the hand, so unlike the engine the bag need not be empty, the next round would pass again
+        self.passes = np.where(playing, 0, self.passes + 1)
+        exists = self.sizes > 0
+        ended = ((self.sizes >= END_SIZE).any(-1) | (((self.sizes >= SAFE_SIZE) | ~exists).all(-1) & exists.any(-1)) |
+                 (self.passes >= self.n_players))
+        ended &= ~self.done
+
+        if ended.any():
+            self.final_scoring(ended)
+        self.done |= ended
+
+        self.steps += ~self.done | ended
+        self.turn = np.where(self.done, self.turn, (self.turn + 1) % self.n_players)
+
+    # shareholder bonuses and stock sold for every hotel in the ended games
+    def final_scoring(self, ended):
+        for h in range(HOTEL_COUNT):
+            mask = ended & (self.available_stock[:, h] != START_STOCK)
+            if mask.any():
+                self.shareholder_bonus(mask, h)
+                self.money += np.where(mask[:, None], self.stock[:, :, h] * self.stock_price[:, h:h + 1], 0)
+
+    # plays every game to the end with random moves
+    def play_random(self, max_steps=1000):
+        for iter in range(max_steps):
+            if self.done.all():
+                break
+            self.step(*self.random_moves())
+
+    # winning seat of each game, ties go to the earlier seat
+    def winners(self):
+        return self.money.argmax(-1)
+
+
+def main():
+    n_games = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    n_players = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+
+    batch = BatchGame(n_games, n_players, seed=0)
+    start = time.perf_counter()
+    batch.play_random()
+    elapsed = time.perf_counter() - start
+
+    print(f"{n_games} games, {batch.steps.sum()} game-steps in {elapsed:.2f}s "
+          f"({batch.steps.sum() / elapsed:,.0f} game-steps/s)")
+    print(f"mean length {batch.steps.mean():.1f} turns, mean mergers {batch.mergers.mean():.2f}, "
+          f"seat win rates {np.bincount(batch.winners(), minlength=n_players) / n_games}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+import argparse
+import os
+import random
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from batch import BatchGame, HOTEL_COUNT, CELL_COUNT, SELL, TRADE
+from common import PLAYERS
+from engine import (new_game, MOVE_TILE, MOVE_FOUND, MOVE_ORDER, MOVE_TRADE, MOVE_SELL, MOVE_KEEP, MOVE_END_TURN,
+                    MERGER_ORDER)
+
+# a BatchGame of one game dealt as the engine game was
+def load_batch(game):
+    batch = BatchGame(1, len(game.lst_players), seed=game.seed)
+    batch.owners[0, :CELL_COUNT] = game.board.cell_owners
+    batch.bag[0] = np.frombuffer(game.tile_bag.order, dtype=np.uint8)
+    batch.bag_pos[0] = game.tile_bag.position
+    batch.hands[0] = [[tile.index for tile in player.hand] for player in game.lst_players]
+    batch.turn[0] = game.turn_counter
+    batch.update_sizes()
+    return batch
+
+
+def hand_sets(batch, game):
+    return ([{int(cell) for cell in hand if cell >= 0} for hand in batch.hands[0]],
+            [{tile.index for tile in player.hand} for player in game.lst_players])
+
+
+# where the two games disagree, None if they agree
+def difference(batch, game):
+    if (batch.owners[0, :CELL_COUNT] != game.board.cell_owners).any():
+        return "board"
+    if batch.money[0].tolist() != [player.money for player in game.lst_players]:
+        return "money"
+    if batch.stock[0].tolist() != [list(player.stock) for player in game.lst_players]:
+        return "stock"
+    if batch.available_stock[0].tolist() != [hotel.available_stock for hotel in game.lst_hotels]:
+        return "available stock"
+    return None
+
+
+# the engine answers the merger the way BatchGame does, ties in hotel order and each holder by their dispose choice
+def resolve_merger(game, dispose):
+    while game.merger is not None:
+        if game.merger.state == MERGER_ORDER:
+            game.play_move(MOVE_ORDER, min(hotel.owner_id - 1 for hotel in game.merger.groups[0]))
+            continue
+
+        choice = dispose[0, game.turn_counter]
+        moves = game.legal_moves()
+        if choice == TRADE and (MOVE_TRADE,) in moves:
+            game.play_move(MOVE_TRADE)
+        elif choice == SELL:
+            game.play_move(MOVE_SELL)
+        else:
+            game.play_move(MOVE_KEEP)
+
+
+# plays one game in both, the batch picks the random tile, hotel and merger choices, the engine the purchase
+# returns (turns that agreed, None or where the games first disagreed)
+def play(seed):
+    game = new_game(PLAYERS, seed=seed)
+    batch = load_batch(game)
+    rng = random.Random(seed)
+
+    for turn in range(1000):
+        if batch.done[0]:
+            return turn, None
+
+        slots, found, buys, dispose = batch.random_moves()
+        legal = {int(cell) for cell, ok in zip(batch.active_hands[0], batch.legal_tiles()[0]) if ok}
+        moves = game.legal_moves()
+        if legal != {move[1] for move in moves if move[0] == MOVE_TILE}:
+            return turn, "playable tiles"
+
+        if slots[0] >= 0:
+            game.play_move(MOVE_TILE, int(batch.active_hands[0, slots[0]]))
+            resolve_merger(game, dispose)
+
+        if game.game_state == 2:
+            free = [hotel.index for hotel in game.lst_hotels if not hotel.tiles]
+            game.play_move(MOVE_FOUND, int(found[0]) % HOTEL_COUNT if int(found[0]) % HOTEL_COUNT in free else free[0])
+
+        buys[:] = -1
+        if game.game_state in (1, 3):
+            buy = rng.choice(game.buy_moves())
+            buys[0, :buy[1]] = buy[2:]
+            game.play_move(*buy)
+
+        batch.step(slots, found, buys, dispose)
+        if batch.done[0]:
+            game.final_scoring()
+        else:
+            game.play_move(MOVE_END_TURN)
+
+        problem = difference(batch, game)
+        if problem is not None:
+            return turn, problem
+
+        # the engine replaces dead tiles, BatchGame keeps them, the games part ways from here on
+        batch_hands, game_hands = hand_sets(batch, game)
+        if batch_hands != game_hands:
+            return turn + 1, None
+
+    return turn, None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Play the same games in BatchGame and the engine and compare them.")
+    parser.add_argument("-n", "--games", type=int, default=1000)
+    args = parser.parse_args()
+
+    turns = 0
+    failures = []
+    for seed in range(args.games):
+        agreed, problem = play(seed)
+        turns += agreed
+        if problem is not None:
+            failures.append((seed, agreed, problem))
+
+    print(f"{args.games} games, {turns} turns compared, {len(failures)} disagreed")
+    for seed, agreed, problem in failures[:10]:
+        print(f"  seed {seed}: {problem} after {agreed} turns")
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
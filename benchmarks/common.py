@@ -0,0 +1,25 @@
+import os
+import random
+
+# draw to an offscreen window, set before pygame is first imported
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+from bots import Bot, play_turn
+from engine import new_game
+
+PLAYERS = ["Player 1", "Player 2", "Player 3", "Player 4"]
+
+
+# a game after turns turns of random bots, the same game for the same seed every run, 0 turns for a game just dealt
+# ongoing=True checks the game could not have been ended on any of the turns
+def played_game(turns, seed=0, hotel_colors=None, ongoing=False):
+    game = new_game(PLAYERS, hotel_colors, seed=seed)
+    bots = [Bot(random.Random(seed + seat)) for seat in range(len(PLAYERS))]
+    for iter in range(turns):
+        play_turn(game, bots)
+        if ongoing:
+            assert not game.endgame_con(), f"the game of seed {seed} reaches the endgame within {turns} turns"
+        game.end_turn()
+    return game
@@ -0,0 +1,39 @@
+import argparse
+import gc
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from common import played_game
+
+
+# bytes held by each of count games kept resident at once, the bots that played them are freed
+def footprint(turns, count):
+    gc.collect()
+    tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+
+    games = [played_game(turns, seed) for seed in range(count)]
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0] - start
+
+    tracemalloc.stop()
+    del games
+    return size / count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure the memory an idle game keeps resident.")
+    parser.add_argument("-n", "--games", type=int, default=200, help="games kept resident for each measurement")
+    args = parser.parse_args()
+
+    print(f"{'turns':>6}{'KiB/game':>10}{'games/GiB':>11}")
+    for turns in (0, 40):
+        size = footprint(turns, args.games)
+        print(f"{turns:>6}{size / 1024:>10.1f}{2 ** 30 / size:>11.0f}")
+
+
+if __name__ == "__main__":
+    main()
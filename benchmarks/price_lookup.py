@@ -0,0 +1,71 @@
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from engine import Hotel, Tile, Score_Card, HOTEL_LIST
+
+REPEAT = 5
+NUMBER = 20000
+
+
+# The stock price as it was read before Price_Table, scanning a column of Score_Card on each access
+def scan_stock_price(hotel):
+    return Score_Card[next((i for i, val in enumerate(Score_Card[:, hotel.tier - 1])
+                            if val > hotel.size), - 1) - 1][3] if hotel.size >= 2 else 0
+
+
+def scan_bonus(hotel):
+    row = next((i for i, val in enumerate(Score_Card[:, hotel.tier - 1]) if val > hotel.size), - 1) - 1
+    return (Score_Card[row][4], Score_Card[row][5]) if hotel.size >= 2 else (0, 0)
+
+
+# hotels of each tier at sizes seen through a game
+def sample_hotels():
+    hotels = []
+    for iter, size in enumerate([2, 5, 9, 15, 24, 35, 45]):
+        name, tier = HOTEL_LIST[iter]
+        hotel = Hotel(name, tier)
+        hotel.tiles = [Tile(index // 12, index % 12) for index in range(size)]
+        hotels.append(hotel)
+    return hotels
+
+
+# buy-phase total, every hotel read once per click
+def buy_total_scan(hotels):
+    return sum(scan_stock_price(hotel) for hotel in hotels)
+
+
+def buy_total_table(hotels):
+    return sum(hotel.stock_price for hotel in hotels)
+
+
+def bonus_scan(hotels):
+    return [scan_bonus(hotel) for hotel in hotels]
+
+
+def bonus_table(hotels):
+    return [(hotel.major_bonus, hotel.minor_bonus) for hotel in hotels]
+
+
+def best_time(func, hotels):
+    return min(timeit.repeat(lambda: func(hotels), repeat=REPEAT, number=NUMBER)) / NUMBER
+
+
+def main():
+    hotels = sample_hotels()
+
+    assert buy_total_scan(hotels) == buy_total_table(hotels)
+    assert bonus_scan(hotels) == bonus_table(hotels)
+
+    print(f"{'case':<24}{'scan (us)':>12}{'table (us)':>12}{'speedup':>10}")
+    for name, scan, table in [("buy total, 7 hotels", buy_total_scan, buy_total_table),
+                              ("bonuses, 7 hotels", bonus_scan, bonus_table)]:
+        scan_time = best_time(scan, hotels) * 1e6
+        table_time = best_time(table, hotels) * 1e6
+        print(f"{name:<24}{scan_time:>12.2f}{table_time:>12.2f}{scan_time / table_time:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+# before pygame, common draws to an offscreen window
+from common import played_game
+
+import pygame
+
+import Acquire
+
+FRAMES = 200
+
+# turns played before the game is drawn, with hotels on the board and stock held
+TURNS = 40
+
+
+# one full frame, every panel drawn as after a new game or a play again
+def full_frame(display):
+    display.screen.fill(Acquire.BLACK)
+    display.cell_states = [None] * len(display.game.tiles)
+    display.draw_board()
+    display.draw_ref_card()
+    display.stock_button()
+    display.active_player_info()
+    display.draw_tiles()
+    display.button("START")
+    display.active_player_name()
+    display.present()
+
+
+# the panels redrawn after a click in the buy phase
+def buy_frame(display):
+    display.stock_button()
+    display.active_player_info()
+    display.button("BUY")
+    display.present()
+
+
+def time_frames(frame, display):
+    times = []
+    for iter in range(FRAMES):
+        start = time.perf_counter()
+        frame(display)
+        times.append(time.perf_counter() - start)
+    times.sort()
+    return times[len(times) // 2] * 1000
+
+
+def main():
+    display = Acquire.GameDisplay(played_game(TURNS, hotel_colors=Acquire.Hotel_Colors), Acquire.window())
+
+    print(f"{'frame':<12}{'median ms':>10}")
+    for name, frame in [("full", full_frame), ("buy click", buy_frame)]:
+        print(f"{name:<12}{time_frames(frame, display):>10.3f}")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from common import PLAYERS
+from engine import MOVE_END_GAME
+from replay import replay
+from server import GameServer, HOST
+
+
+# Define a TimedServer, times the handling of every move in the server apart from the sockets
+class TimedServer(GameServer):
+    def __init__(self):
+        super().__init__()
+        self.move_times = []
+
+    def request(self, client, message):
+        start = time.perf_counter()
+        reply = super().request(client, message)
+        if message.get("op") == "move":
+            self.move_times.append(time.perf_counter() - start)
+        return reply
+
+
+def send(writer, message):
+    writer.write(json.dumps(message, separators=(",", ":")).encode() + b"\n")
+
+
+async def receive(reader):
+    message = json.loads(await reader.readline())
+    assert message["type"] != "error", message["message"]
+    return message
+
+
+# one scripted client, it plays random legal moves for its seats from its own copy of the game
+# after thinking for up to twice think seconds, and times each move from sending it until the server sends it back
+async def play_client(port, table_id, seats, rng, latencies, created, think):
+    reader, writer = await asyncio.open_connection(HOST, port)
+
+    if table_id is None:
+        send(writer, {"op": "create", "players": PLAYERS, "seats": seats, "seed": rng.randrange(2 ** 32)})
+        info = await receive(reader)
+        created.set_result(info["table"])
+    else:
+        send(writer, {"op": "join", "table": await table_id, "seats": seats})
+        info = await receive(reader)
+
+    game = replay(info["seed"], info["players"], bytes.fromhex(info["moves"]))
+    over = False
+    sent = None
+
+    while not over:
+        if sent is None and game.turn_counter in seats:
+            moves = game.legal_moves()
+            move = (MOVE_END_GAME,) if (MOVE_END_GAME,) in moves else rng.choice(moves)
+            if think:
+                await asyncio.sleep(rng.uniform(0, 2 * think))
+
+            sent = time.perf_counter()
+            send(writer, {"op": "move", "table": info["table"], "move": list(move)})
+            await writer.drain()
+
+        message = await receive(reader)
+        move = tuple(message["move"])
+        if message["seat"] in seats:
+            latencies.append(time.perf_counter() - sent)
+            sent = None
+
+        game.play_move(*move)
+        over = move[0] == MOVE_END_GAME
+
+    writer.close()
+    return info["table"], game.snapshot()
+
+
+async def play_table(port, clients, rng, latencies, server, think):
+    created = asyncio.get_running_loop().create_future()
+    players = [play_client(port, None if index == 0 else created, list(range(index, len(PLAYERS), clients)),
+                           random.Random(rng.random()), latencies, created, think)
+               for index in range(clients)]
+
+    results = []
+    for player in asyncio.as_completed(players):
+        table_id, snapshot = await player
+        if table_id in server.tables:
+            assert snapshot == server.tables[table_id].game.snapshot()
+        results.append(snapshot)
+
+    # every client ends with the same game as the server
+    assert len(set(results)) == 1
+
+
+def percentile(values, fraction):
+    values = sorted(values)
+    return values[min(int(fraction * len(values)), len(values) - 1)]
+
+
+async def run(tables, clients, seed, think):
+    server = TimedServer()
+    listener = await server.serve(HOST, 0)
+    port = listener.sockets[0].getsockname()[1]
+
+    rng = random.Random(seed)
+    latencies = []
+
+    start = time.perf_counter()
+    await asyncio.gather(*[play_table(port, clients, random.Random(rng.random()), latencies, server, think)
+                           for iter in range(tables)])
+    elapsed = time.perf_counter() - start
+
+    listener.close()
+    await listener.wait_closed()
+    return latencies, server.move_times, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Play tables at a localhost server with scripted clients.")
+    parser.add_argument("-t", "--tables", type=int, default=200, help="tables played at once")
+    parser.add_argument("-c", "--clients", type=int, default=2, help="clients sharing the seats of each table")
+    parser.add_argument("-s", "--seed", type=int, default=0)
+    parser.add_argument("--think", type=float, default=0.2,
+                        help="mean seconds a client waits before each move, 0 to play as fast as possible")
+    args = parser.parse_args()
+
+    latencies, move_times, elapsed = asyncio.run(run(args.tables, args.clients, args.seed, args.think))
+
+    print(f"{args.tables} tables of {args.clients} clients, {len(latencies)} moves in {elapsed:.2f}s "
+          f"({len(latencies) / elapsed:.0f} moves/s)")
+    print(f"move round trip ms  p50 {percentile(latencies, 0.5) * 1000:.3f}  "
+          f"p99 {percentile(latencies, 0.99) * 1000:.3f}  max {max(latencies) * 1000:.3f}")
+    print(f"server ms per move  p50 {percentile(move_times, 0.5) * 1000:.3f}  "
+          f"p99 {percentile(move_times, 0.99) * 1000:.3f}  max {max(move_times) * 1000:.3f}")
+
+
+if __name__ == "__main__":
+    main()
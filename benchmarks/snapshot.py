@@ -0,0 +1,39 @@
+import copy
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from common import PLAYERS, played_game
+from engine import new_game, SNAPSHOT_SIZE
+
+REPEAT = 5
+NUMBER = 2000
+
+# turns played before the game is copied, with hotels on the board and stock held
+TURNS = 40
+
+
+def best_time(func, number=NUMBER):
+    return min(timeit.repeat(func, repeat=REPEAT, number=number)) / number
+
+
+def main():
+    print(f"snapshot of {SNAPSHOT_SIZE} bytes")
+    print(f"{'snapshot (us)':>15}{'restore (us)':>15}{'deepcopy (us)':>15}")
+
+    game = played_game(TURNS)
+    buffer = game.snapshot()
+
+    copy_game = new_game(PLAYERS)
+    copy_game.restore(buffer)
+    assert copy_game.snapshot() == buffer
+
+    print(f"{best_time(game.snapshot) * 1e6:>15.2f}"
+          f"{best_time(lambda: copy_game.restore(buffer)) * 1e6:>15.2f}"
+          f"{best_time(lambda: copy.deepcopy(game), 20) * 1e6:>15.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+import argparse
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from bots import BOTS, play_game
+from common import PLAYERS
+from engine import new_game, MOVE_END_GAME
+
+
+# a game at the end of a turn with the bag drawn and every hand played out, before any hotel was founded
+def stalemate_game(seed):
+    game = new_game(PLAYERS, seed=seed)
+    game.tile_bag.position = len(game.tile_bag.tiles)
+    for player in game.lst_players:
+        player.hand = []
+    game.game_state = 4
+    return game
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Ask every bot to end a game on a stalemate.")
+    parser.add_argument("-n", "--games", type=int, default=10)
+    args = parser.parse_args()
+
+    for seed in range(args.games):
+        game = stalemate_game(seed)
+        assert game.stalemate() and not game.endgame_con()
+        assert (MOVE_END_GAME,) in game.legal_moves()
+
+        for name, bot_class in BOTS.items():
+            bot = bot_class(random.Random(seed))
+            assert bot.end_game(game) in (True, False), name
+
+            turns, mergers = play_game(stalemate_game(seed), [bot_class(random.Random(seed)) for player in PLAYERS])
+            assert turns == 1, name
+
+    print(f"{args.games} stalemates, every bot decided")
+
+
+if __name__ == "__main__":
+    main()
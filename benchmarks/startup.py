@@ -0,0 +1,40 @@
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+# modules run without a window, none of them may load pygame
+HEADLESS = ["engine", "bots", "replay", "server", "client", "tournament", "batch", "instrument"]
+
+# (name, code run in a fresh interpreter) of each cold start, from the repository so player_name.txt is found
+CASES = [("interpreter", "pass")]
+CASES += [(f"import {module}", f"import sys, {module}; assert 'pygame' not in sys.modules") for module in HEADLESS]
+CASES += [("import Acquire", "import Acquire"),
+          ("first frame", "import Acquire; Acquire.GameLoop().display.present()")]
+
+
+# seconds from starting a new interpreter until it exits after running code
+def cold_start(code):
+    env = dict(os.environ, SDL_VIDEODRIVER="dummy", SDL_AUDIODRIVER="dummy", PYGAME_HIDE_SUPPORT_PROMPT="1")
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", code], cwd=ROOT, env=env, check=True)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time cold starts of the game window and the headless tools.")
+    parser.add_argument("-n", "--runs", type=int, default=10, help="fresh interpreters started for each case")
+    args = parser.parse_args()
+
+    print(f"{'start':<20}{'best ms':>10}{'median ms':>11}")
+    for name, code in CASES:
+        times = [cold_start(code) * 1000 for iter in range(args.runs)]
+        print(f"{name:<20}{min(times):>10.1f}{statistics.median(times):>11.1f}")
+
+
+if __name__ == "__main__":
+    main()
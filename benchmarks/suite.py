@@ -0,0 +1,195 @@
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from bots import Bot, play_game
+from common import PLAYERS, played_game
+from engine import new_game, EMPTY_CELL
+
+BASELINE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+SEED = 0
+
+# REPEAT short measurements of about REPEAT_SECONDS each, see measure
+REPEAT = 25
+REPEAT_SECONDS = 0.01
+
+# turns played by random bots before each board is measured, every board is timed while the game is still being
+# played, the game of SEED reaches the endgame after 58
+BOARDS = {"sparse": 0, "mid": 40, "late": 55}
+
+
+def empty_tiles(game):
+    return [tile for tile in game.tiles if game.board.cell_owners[tile.index] == EMPTY_CELL]
+
+
+# Benchmarks, each returns the function to time
+def touching_board(turns):
+    game = played_game(turns, SEED, ongoing=True)
+    tiles = empty_tiles(game)
+    return lambda: [game.touching_board(tile) for tile in tiles]
+
+
+def touching_hotel(turns):
+    game = played_game(turns, SEED, ongoing=True)
+    tiles = empty_tiles(game)
+    return lambda: [game.touching_hotel(tile) for tile in tiles]
+
+
+def playable_tiles(turns):
+    game = played_game(turns, SEED, ongoing=True)
+    return lambda: [player.playable_tiles(game) for player in game.lst_players]
+
+
+def invalid_tiles(turns):
+    game = played_game(turns, SEED, ongoing=True)
+    return lambda: [player.invalid_tiles(game, replace=False) for player in game.lst_players]
+
+
+def stock_price(turns):
+    game = played_game(turns, SEED, ongoing=True)
+    return lambda: [hotel.stock_price for hotel in game.lst_hotels]
+
+
+# two players tie for the most stock and two for the second most
+def shareholder_bonus(turns):
+    game = played_game(turns, SEED, ongoing=True)
+    hotel = max(game.lst_hotels, key=lambda x: x.size)
+    for player, count in zip(game.lst_players, [5, 5, 2, 2]):
+        player.remove_stock(hotel.index, player.stock[hotel.index])
+        player.add_stock(hotel.index, count)
+    return lambda: game.shareholder_bonus(hotel)
+
+
+# whole games of random bots from the deal to the final scoring
+def playthrough(games=5):
+    def play():
+        for seed in range(games):
+            game = new_game(PLAYERS, seed=seed)
+            play_game(game, [Bot(random.Random(seed + seat)) for seat in range(len(PLAYERS))])
+    return play
+
+
+def render_display(turns):
+    import Acquire
+    return Acquire.GameDisplay(played_game(turns, SEED, Acquire.Hotel_Colors, ongoing=True), Acquire.window())
+
+
+# every cell drawn, as after a new game
+def draw_board(turns):
+    display = render_display(turns)
+
+    def frame():
+        display.cell_states = [None] * len(display.game.tiles)
+        display.draw_board()
+    return frame
+
+
+def draw_ref_card(turns):
+    display = render_display(turns)
+    return display.draw_ref_card
+
+
+def cases():
+    for board, turns in BOARDS.items():
+        for bench in (touching_board, touching_hotel, playable_tiles, invalid_tiles):
+            yield f"{bench.__name__}/{board}", bench, (turns,)
+
+    yield "stock_price/mid", stock_price, (BOARDS["mid"],)
+    yield "shareholder_bonus/tied", shareholder_bonus, (BOARDS["mid"],)
+    yield "playthrough", playthrough, ()
+    yield "draw_board/mid", draw_board, (BOARDS["mid"],)
+    yield "draw_ref_card", draw_ref_card, (BOARDS["mid"],)
+
+
+# fixed pure Python work timed next to every benchmark, a machine that is busier or slower
+# than when the baseline was saved slows both down alike
+def calibration():
+    total = 0
+    for index in range(1000):
+        total += index * index % 7
+    return total
+
+
+# a timer and the number of calls that take about REPEAT_SECONDS
+def timer(func):
+    timer = timeit.Timer(func)
+    number, elapsed = timer.autorange()
+    return timer, max(1, round(number * REPEAT_SECONDS / elapsed))
+
+
+# microseconds per call and per call of calibration, each measurement of func is followed by one of calibration
+# and the median of their ratios is kept, busy spells of the machine slow down both measurements of a pair
+def measure(func):
+    func_timer, func_number = timer(func)
+    calibration_timer, calibration_number = timer(calibration)
+
+    ratios = []
+    for iter in range(REPEAT):
+        elapsed = func_timer.timeit(func_number) / func_number
+        ratios.append(elapsed / (calibration_timer.timeit(calibration_number) / calibration_number))
+    return statistics.median(ratios)
+
+
+def load_baseline(path):
+    if not os.path.exists(path):
+        return {"calibration": None, "results": {}}
+    with open(path, "r") as file:
+        return json.load(file)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time the rules engine and renderer against saved baselines.")
+    parser.add_argument("-k", "--filter", default="", help="run only benchmarks with this in their name")
+    parser.add_argument("-t", "--tolerance", type=float, default=0.3,
+                        help="slowdown over the baseline flagged as a regression, 0.3 for 30%%")
+    parser.add_argument("--save", action="store_true", help="save the results as the new baseline")
+    parser.add_argument("--baseline", default=BASELINE_FILE)
+    args = parser.parse_args()
+
+    baseline = load_baseline(args.baseline)
+    reference = baseline["calibration"] or min(timeit.repeat(calibration, repeat=REPEAT, number=100)) / 100 * 1e6
+    results = {}
+    regressions = []
+
+    # microseconds on the machine the baseline was saved on, the time relative to calibration there
+    print(f"{'benchmark':<38}{'baseline us':>13}{'now us':>13}{'change':>9}")
+    for name, bench, bench_args in cases():
+        if args.filter not in name:
+            continue
+
+        results[name] = now = measure(bench(*bench_args)) * reference
+
+        before = baseline["results"].get(name)
+        if before is None:
+            print(f"{name:<38}{'-':>13}{now:>13.2f}")
+            continue
+
+        change = now / before - 1
+        flag = ""
+        if change > args.tolerance:
+            flag = "  REGRESSION"
+            regressions.append(name)
+        print(f"{name:<38}{before:>13.2f}{now:>13.2f}{change:>+9.0%}{flag}")
+
+    if args.save:
+        baseline["calibration"] = round(reference, 3)
+        baseline["results"].update({name: round(now, 3) for name, now in results.items()})
+        baseline["results"] = dict(sorted(baseline["results"].items()))
+        with open(args.baseline, "w") as file:
+            json.dump(baseline, file, indent=2)
+            file.write("\n")
+        print(f"saved {len(results)} results to {args.baseline}")
+
+    if regressions:
+        print(f"{len(regressions)} regressions over {args.tolerance:.0%}: {', '.join(regressions)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,449 @@
+import itertools
+import math
+import random
+import time
+from collections import OrderedDict
+
+import numpy as np
+
+from engine import new_game, MERGER_ORDER, BUY_COUNTS, BUY_MOVES
+
+# Merger choices for held stock of an acquired hotel
+TRADE = "trade"
+SELL = "sell"
+KEEP = "keep"
+
+
+# Define a Bot, a computer player that picks a random legal option at every decision
+class Bot:
+    name = "random"
+
+    def __init__(self, rng=None):
+        self.rng = rng or random.Random()
+
+    # Game state 1 - one of the playable tiles in hand
+    def choose_tile(self, game, tiles):
+        return self.rng.choice(tiles)
+
+    # Game state 2 - one of the hotels without tiles
+    def choose_hotel(self, game, hotels):
+        return self.rng.choice(hotels)
+
+    # Merger tie-break - order of equally sized hotels, first is kept longest
+    def order_hotels(self, game, hotels):
+        return self.rng.sample(hotels, len(hotels))
+
+    # Merger - trade, sell or keep the stock of the acquired hotel, asked until keep or no stock is left
+    def merger_action(self, game, acquired_hotel, large_hotel):
+        return self.rng.choice([TRADE, SELL, KEEP])
+
+    # Game state 3 - up to 3 hotels to buy one stock each from, repeats allowed
+    def choose_stock(self, game):
+        hotels = game.active_hotels
+        if not hotels:
+            return []
+        return [self.rng.choice(hotels) for iter in range(self.rng.randint(0, 3))]
+
+    # Game state 4 - whether to end the game once endgame_con is met
+    def end_game(self, game):
+        return True
+
+
+# Define a GreedyBot, grows the hotels it owns most of and buys the cheapest stock
+class GreedyBot(Bot):
+    name = "greedy"
+
+    def stake(self, game, hotel):
+        return game.active_player.stock[hotel.index]
+
+    def choose_tile(self, game, tiles):
+        def score(tile):
+            hotels = game.touching_hotel(tile)
+            return sum(self.stake(game, hotel) for hotel in hotels) + len(game.touching_board(tile))
+        return max(tiles, key=score)
+
+    def choose_hotel(self, game, hotels):
+        return max(hotels, key=lambda x: x.tier)
+
+    def order_hotels(self, game, hotels):
+        return sorted(hotels, key=lambda x: self.stake(game, x), reverse=True)
+
+    def merger_action(self, game, acquired_hotel, large_hotel):
+        if self.stake(game, acquired_hotel) >= 2 and large_hotel.available_stock > 0:
+            return TRADE
+        return SELL
+
+    def choose_stock(self, game):
+        hotels = [hotel for hotel in game.active_hotels if hotel.available_stock > 0]
+        hotels.sort(key=lambda x: x.stock_price)
+        picks = []
+        money = game.active_player.money
+        for hotel in hotels:
+            for iter in range(min(3 - len(picks), hotel.available_stock)):
+                if hotel.stock_price > money:
+                    break
+                picks.append(hotel)
+                money -= hotel.stock_price
+        return picks
+
+
+# Define a TranspositionTable, search results by the Zobrist hash of a position,
+# the least recently used are dropped once there are more than capacity
+class TranspositionTable:
+    def __init__(self, capacity=100000):
+        self.capacity = capacity
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, zobrist):
+        return zobrist in self.entries
+
+    def get(self, zobrist, default=None):
+        if zobrist not in self.entries:
+            self.misses += 1
+            return default
+
+        self.hits += 1
+        self.entries.move_to_end(zobrist)
+        return self.entries[zobrist]
+
+    def put(self, zobrist, value):
+        self.entries[zobrist] = value
+        self.entries.move_to_end(zobrist)
+
+        if len(self.entries) > self.capacity:
+            self.entries.popitem(last=False)
+
+    def clear(self):
+        self.entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+# Merger - the bot of the active player answers trade/sell/keep, a failed trade keeps
+def resolve_stock(game, bot):
+    merger = game.merger
+    action = bot.merger_action(game, merger.acquired_hotel, merger.large_hotel)
+
+    if action == TRADE:
+        if not game.merger_trade():
+            game.merger_keep()
+    elif action == SELL:
+        game.merger_sell()
+    else:
+        game.merger_keep()
+
+
+# plays one turn of the active player, returns the number of hotels acquired
+def play_turn(game, bots):
+    game.next_game_state()
+    return resume_turn(game, bots)
+
+
+# plays the rest of a turn from whichever decision it is waiting on, returns the number of hotels acquired
+def resume_turn(game, bots):
+    mergers = 0
+
+    if game.game_state == 1 and game.merger is None:
+        tiles = [tile for tile in game.active_player.hand if not game.unplayable_tile(tile)]
+
+        # no playable tiles, skip to buying
+        if not tiles:
+            game.next_game_state(2)
+
+        else:
+            tile = bots[game.turn_counter].choose_tile(game, tiles)
+            touch_hotel = game.touching_hotel(tile)
+
+            if game.start_merger(tile):
+                mergers = len(touch_hotel) - 1
+            else:
+                game.place_tile(tile)
+
+    while game.merger is not None:
+        merger = game.merger
+
+        # ties are ordered all at once, then chosen one by one
+        if merger.state == MERGER_ORDER:
+            for hotel in bots[game.turn_counter].order_hotels(game, list(merger.groups[0]))[:-1]:
+                game.choose_merger_hotel(hotel)
+
+        # Trade/Sell/Keep from the active player around the table
+        else:
+            resolve_stock(game, bots[game.turn_counter])
+
+    if game.game_state == 2:
+        hotels = [hotel for hotel in game.lst_hotels if not hotel.tiles]
+        game.found_hotel(bots[game.turn_counter].choose_hotel(game, hotels))
+
+    if game.game_state == 3:
+        for hotel in bots[game.turn_counter].choose_stock(game):
+            game.choose_stock(hotel, hotel.stock_choice_amount + 1)
+        game.buy_stock()
+
+    return mergers
+
+
+# plays a game to the end with one bot per player, returns the number of turns and hotels acquired
+def play_game(game, bots, max_turns=1000):
+    turns = 0
+    mergers = 0
+
+    while turns < max_turns:
+        mergers += play_turn(game, bots)
+        turns += 1
+
+        if (game.endgame_con() and bots[game.turn_counter].end_game(game)) or game.stalemate():
+            break
+
+        game.end_turn()
+
+    game.final_scoring()
+    return turns, mergers
+
+
+# every purchase of up to 3 stocks the active player can afford, as the list of hotels to buy one stock each from
+def stock_options(game):
+    return [[game.lst_hotels[pos] for pos in move[2:]] for move in game.buy_moves()]
+
+
+# Buy phase valuations, value(game, counts) scores every purchase at once, one row of counts per purchase
+# with the number of stocks bought from each hotel
+
+# the shareholder bonus the active player would be paid for every hotel if it were acquired now
+def bonus_value(game, counts):
+    holdings = np.array([player.stock for player in game.lst_players], dtype=np.int64)
+    others = np.delete(holdings, game.turn_counter, axis=0)
+    held = holdings[game.turn_counter] + counts
+
+    # other players holding more than, and as much as, the active player would
+    above = (others[None, :, :] > held[:, None, :]).sum(axis=1)
+    equal = (others[None, :, :] == held[:, None, :]).sum(axis=1)
+    sole = (others > 0).sum(axis=0) == 0
+
+    major = np.array([hotel.major_bonus if hotel.tiles else 0 for hotel in game.lst_hotels])
+    minor = np.array([hotel.minor_bonus if hotel.tiles else 0 for hotel in game.lst_hotels])
+
+    first = np.where(equal == 0, major + np.where(sole, minor, 0), (major + minor) / (equal + 1))
+    second = np.where(above == 1, minor / (equal + 1), 0)
+    bonus = np.where(above == 0, first, second)
+    return np.where(held > 0, bonus, 0).sum(axis=1)
+
+
+# the purchase value scores highest, the first of those that tie, as the list of hotels to buy one stock each from
+def best_buy(game, value=bonus_value):
+    rows = game.affordable_buys()
+    best = rows[np.argmax(value(game, BUY_COUNTS[rows]))]
+    return [game.lst_hotels[pos] for pos in BUY_MOVES[best][2:]]
+
+
+def merger_actions(game, acquired_hotel, large_hotel):
+    if game.active_player.stock[acquired_hotel.index] >= 2 and large_hotel.available_stock > 0:
+        return [TRADE, SELL, KEEP]
+    return [SELL, KEEP]
+
+
+def tile_key(tile):
+    return tile.index
+
+
+def hotel_key(hotel):
+    return hotel.name
+
+
+def hotels_key(hotels):
+    return tuple(hotel.name for hotel in hotels)
+
+
+def same_key(option):
+    return option
+
+
+# deals the tiles the player at seat can't see, the other hands and the bag, again at random
+def redeal(game, seat, rng):
+    bag = game.tile_bag
+    hidden = bag.tiles[bag.position:]
+    for iter, player in enumerate(game.lst_players):
+        if iter != seat:
+            hidden.extend(player.hand)
+    rng.shuffle(hidden)
+
+    for iter, player in enumerate(game.lst_players):
+        if iter != seat:
+            player.hand = hidden[:len(player.hand)]
+            del hidden[:len(player.hand)]
+
+    bag.tiles[bag.position:] = hidden
+    bag.order = bytes([tile.index for tile in bag.tiles])
+
+
+# Define an OptionBot, hands every decision to decide(game, context, options, key, fallback) as a list of options,
+# every subclass defines decide and returns one of the options
+# context tells decisions in the same position apart, key gives each option an id shared with copies of the game,
+# fallback makes the decision the way the rollout policy would
+class OptionBot(Bot):
+    def __init__(self, rng=None):
+        super().__init__(rng)
+        self.rollout = GreedyBot(self.rng)
+
+    def choose_tile(self, game, tiles):
+        return self.decide(game, "tile", tiles, tile_key, lambda: self.rollout.choose_tile(game, tiles))
+
+    def choose_hotel(self, game, hotels):
+        return self.decide(game, "found", hotels, hotel_key, lambda: self.rollout.choose_hotel(game, hotels))
+
+    def order_hotels(self, game, hotels):
+        orders = [list(order) for order in itertools.permutations(hotels)]
+        return self.decide(game, ("order", hotels_key(hotels)), orders, hotels_key,
+                           lambda: self.rollout.order_hotels(game, hotels))
+
+    def merger_action(self, game, acquired_hotel, large_hotel):
+        return self.decide(game, ("merger", acquired_hotel.name, game.merger.players_left),
+                           merger_actions(game, acquired_hotel, large_hotel), same_key,
+                           lambda: self.rollout.merger_action(game, acquired_hotel, large_hotel))
+
+    def choose_stock(self, game):
+        return self.decide(game, "stock", stock_options(game), hotels_key, lambda: self.rollout.choose_stock(game))
+
+    def end_game(self, game):
+        return self.decide(game, "end", [True, False], same_key, lambda: self.rollout.end_game(game))
+
+
+# Define a TreePolicy, the searching player inside one playout
+# walks down the tree with UCB1 and adds one node, then plays the rest like the rollout policy
+class TreePolicy(OptionBot):
+    def __init__(self, table, exploration, rng):
+        super().__init__(rng)
+        self.table = table
+        self.exploration = exploration
+        self.in_tree = True
+
+        # (node, option id) of every decision taken in the tree
+        self.path = []
+
+    def decide(self, game, context, options, key, fallback):
+        if not self.in_tree:
+            return fallback()
+        if len(options) == 1:
+            return options[0]
+
+        # nodes are found by position so the same position reached in a different order shares its statistics
+        node_key = (game.zobrist, context)
+        node = self.table.get(node_key)
+        if node is None:
+            node = [0, {}]
+            self.table.put(node_key, node)
+
+        visits, children = node
+        keys = [key(option) for option in options]
+        untried = [option_id for option_id in keys if option_id not in children]
+
+        if untried:
+            choice = self.rng.choice(untried)
+            self.in_tree = False
+        else:
+            log_visits = math.log(visits)
+            choice = max(keys, key=lambda x: children[x][1] / children[x][0] +
+                         self.exploration * math.sqrt(log_visits / children[x][0]))
+
+        self.path.append((node, choice))
+        return options[keys.index(choice)]
+
+    def backup(self, value):
+        for node, choice in self.path:
+            node[0] += 1
+            child = node[1].setdefault(choice, [0, 0.0])
+            child[0] += 1
+            child[1] += value
+
+
+# Define a MCTSBot, Monte Carlo tree search over its own decisions for the rest of the turn
+# every playout restores a snapshot into a scratch game, deals the hidden tiles again at random, plays to
+# horizon rounds with the rollout policy and scores the money after final scoring against the best opponent
+# stops after playouts or seconds, whichever comes first
+class MCTSBot(OptionBot):
+    name = "mcts"
+
+    def __init__(self, rng=None, seconds=0.5, playouts=2000, horizon=2, exploration=0.7, scale=5000,
+                 table_size=100000):
+        super().__init__(rng)
+        self.seconds = seconds
+        self.playouts = playouts
+        self.horizon = horizon
+        self.exploration = exploration
+        self.scale = scale
+        self.table_size = table_size
+
+        # scratch games by player names, playouts never touch the real game
+        self.scratch_games = {}
+        self.last_playouts = 0
+
+    def scratch_game(self, game):
+        names = tuple(player.name for player in game.lst_players)
+        if names not in self.scratch_games:
+            self.scratch_games[names] = new_game(list(names), seed=0)
+        return self.scratch_games[names]
+
+    def decide(self, game, context, options, key, fallback):
+        if len(options) == 1:
+            return options[0]
+
+        seat = game.turn_counter
+        buffer = game.snapshot()
+        scratch = self.scratch_game(game)
+        table = TranspositionTable(self.table_size)
+        deadline = time.perf_counter() + self.seconds
+
+        # the root is put back before every playout, the least recently used nodes are dropped but never the root
+        root_key = (game.zobrist, context)
+        root = [0, {}]
+        self.last_playouts = 0
+
+        for playout in range(self.playouts):
+            if playout and time.perf_counter() > deadline:
+                break
+
+            scratch.restore(buffer)
+            scratch.moves.clear()
+            redeal(scratch, seat, self.rng)
+            table.put(root_key, root)
+
+            policy = TreePolicy(table, self.exploration, self.rng)
+            policy.rollout = self.rollout
+            policy.backup(self.playout(scratch, seat, policy))
+            self.last_playouts += 1
+
+        # the most visited option
+        visits, children = root
+        best = max(children, key=lambda x: children[x][0])
+        return options[[key(option) for option in options].index(best)]
+
+    # plays from the decision to the horizon, returns the value to the player at seat between 0 and 1
+    def playout(self, game, seat, policy):
+        bots = [policy if iter == seat else self.rollout for iter in range(len(game.lst_players))]
+        resume_turn(game, bots)
+
+        # the policy is asked whenever the game can end, so a decision to end it always reaches the tree
+        for iter in range(self.horizon * len(game.lst_players)):
+            if (game.endgame_con() or game.stalemate()) and bots[game.turn_counter].end_game(game):
+                break
+
+            # only the decisions of this turn are in the tree
+            policy.in_tree = False
+            game.end_turn()
+            play_turn(game, bots)
+
+        game.final_scoring()
+
+        money = [player.money for player in game.lst_players]
+        best = max(amount for iter, amount in enumerate(money) if iter != seat)
+        return 0.5 + 0.5 * math.tanh((money[seat] - best) / self.scale)
+
+
+BOTS = {Bot.name: Bot,
+        GreedyBot.name: GreedyBot,
+        MCTSBot.name: MCTSBot}
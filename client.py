@@ -0,0 +1,126 @@
+import json
+import queue
+import socket
+import threading
+
+from engine import MOVE_TRADE, MOVE_SELL, MOVE_END_TURN, MOVE_END_GAME
+from bots import TRADE, SELL, KEEP
+from replay import replay, read_moves
+from server import HOST, PORT
+
+
+# Define a Connection, a blocking connection to server.py for one table, see the protocol in server.py
+# once the table is open a thread reads the moves made there, those of seats held elsewhere wait in moves
+class Connection:
+    def __init__(self, host=HOST, port=PORT):
+        self.socket = socket.create_connection((host, port))
+        self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.reader = self.socket.makefile("rb")
+        self.writer = self.socket.makefile("wb")
+
+        self.table = None
+        self.seats = []
+        self.moves = {}
+        self.closed = False
+
+    def send(self, message):
+        self.writer.write(json.dumps(message, separators=(",", ":")).encode() + b"\n")
+        self.writer.flush()
+
+    def receive(self):
+        line = self.reader.readline()
+        if not line:
+            raise ConnectionError("the server closed the connection")
+
+        message = json.loads(line)
+        if message["type"] == "error":
+            raise ValueError(message["message"])
+        return message
+
+    # creates a table for player_names, or joins table, sitting at seats
+    # returns the game of the table played up to now
+    def open(self, player_names=None, table=None, seats=(), hotel_colors=None, seed=None):
+        if table is None:
+            self.send({"op": "create", "players": player_names, "seats": list(seats), "seed": seed})
+        else:
+            self.send({"op": "join", "table": table, "seats": list(seats)})
+
+        info = self.receive()
+        self.table = info["table"]
+        self.seats = info["seats"]
+        self.moves = {seat: queue.Queue() for seat in range(len(info["players"])) if seat not in self.seats}
+
+        threading.Thread(target=self.read_table, daemon=True).start()
+        return replay(info["seed"], info["players"], bytes.fromhex(info["moves"]), hotel_colors=hotel_colors)
+
+    def read_table(self):
+        try:
+            for line in self.reader:
+                message = json.loads(line)
+
+                if message["type"] == "move" and message["seat"] in self.moves:
+                    self.moves[message["seat"]].put(tuple(message["move"]))
+                elif message["type"] == "error":
+                    print(f"server: {message['message']}")
+
+        except (OSError, ValueError):
+            pass
+
+        # nothing more is coming, wakes any seat still waiting on a move
+        self.closed = True
+        for moves in self.moves.values():
+            moves.put(None)
+
+    # sends the moves in a move log, all of them made at seats held here
+    def send_moves(self, moves):
+        for op, args in read_moves(moves):
+            self.send({"op": "move", "table": self.table, "move": [op, *args]})
+
+    def close(self):
+        self.closed = True
+        try:
+            self.socket.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self.socket.close()
+
+
+# Define a RemoteSeat, a seat held by another client, the game window plays it in place of a bot
+# every decision waits for the next move of the seat from the server, None once the connection is closed
+class RemoteSeat:
+    def __init__(self, connection, seat):
+        self.connection = connection
+        self.seat = seat
+
+    # the window ends the turn on its own, so END_TURN is only waited for when ending the game is an option,
+    # which is also the only time END_GAME is legal, see GameLoop.turn_over
+    def next_move(self, end_turn=False):
+        while not self.connection.closed or not self.connection.moves[self.seat].empty():
+            move = self.connection.moves[self.seat].get()
+            if move is None or end_turn or move[0] != MOVE_END_TURN:
+                return move
+        return None
+
+    def choose_tile(self, game, tiles):
+        move = self.next_move()
+        return move and game.tiles[move[1]]
+
+    def choose_hotel(self, game, hotels):
+        move = self.next_move()
+        return move and game.lst_hotels[move[1]]
+
+    def order_hotels(self, game, hotels):
+        move = self.next_move()
+        return move and [game.lst_hotels[move[1]]]
+
+    def merger_action(self, game, acquired_hotel, large_hotel):
+        move = self.next_move()
+        return move and {MOVE_TRADE: TRADE, MOVE_SELL: SELL}.get(move[0], KEEP)
+
+    def choose_stock(self, game):
+        move = self.next_move()
+        return move and [game.lst_hotels[pos] for pos in move[2:]]
+
+    def end_game(self, game):
+        move = self.next_move(end_turn=True)
+        return move and move[0] == MOVE_END_GAME
@@ -0,0 +1,1298 @@
+import numpy as np
+import functools
+import itertools
+import random
+import math
+import struct
+from array import array
+
+random.seed()
+
+# Constants
+ROW_COUNT = 9
+COLUMN_COUNT = 12
+
+MIN_PLAYERS = 2
+MAX_PLAYERS = 6
+
+START_MONEY = 6000
+START_STOCK = 25
+HAND_SIZE = 6
+SAFE_SIZE = 11
+END_SIZE = 41
+TIER_COUNT = 3
+
+# Ownership index values, hotels use their position in the hotel list plus one
+EMPTY_CELL = 0
+BOARD_CELL = -1
+
+# Hotel names and their price tier
+HOTEL_LIST = [("Worldwide", 1),
+              ("Sackson", 1),
+              ("Festival", 2),
+              ("Imperial", 2),
+              ("American", 2),
+              ("Continental", 3),
+              ("Tower", 3)]
+
+# Reference Card
+Score_Card = np.array([[ 2,  0,  0,  200,  2000, 1000],
+                       [ 3,  2,  0,  300,  3000, 1500],
+                       [ 4,  3,  2,  400,  4000, 2000],
+                       [ 5,  4,  3,  500,  5000, 2500],
+                       [ 6,  5,  4,  600,  6000, 3000],
+                       [11,  6,  5,  700,  7000, 3500],
+                       [21, 11,  6,  800,  8000, 4000],
+                       [31, 21, 11,  900,  9000, 4500],
+                       [41, 31, 21, 1000, 10000, 5000],
+                       [99, 41, 31, 1100, 11000, 5500],
+                       [99, 99, 41, 1200, 12000, 6000]])
+
+
+# row of the reference card for a hotel of the given tier and size
+def score_card_row(tier, size):
+    return next((i for i, val in enumerate(Score_Card[:, tier - 1]) if val > size), - 1) - 1
+
+
+# (stock price, major bonus, minor bonus) indexed by [tier - 1][size], built once from the reference card
+Price_Table = [[tuple(int(value) for value in Score_Card[score_card_row(tier, size)][3:]) if size >= 2 else (0, 0, 0)
+                for size in range(ROW_COUNT * COLUMN_COUNT + 1)]
+               for tier in range(1, TIER_COUNT + 1)]
+
+
+# Zobrist keys, the hash of a position is the XOR of one key for each part of it
+# fixed seed so the same position hashes the same in every process, the key of a starting value is 0
+zobrist_rng = random.Random(0x5A0B)
+
+# [cell index][owner_id + 1], an empty cell adds nothing
+Cell_Keys = [[0 if owner_id == EMPTY_CELL else zobrist_rng.getrandbits(64)
+              for owner_id in range(BOARD_CELL, len(HOTEL_LIST) + 1)]
+             for index in range(ROW_COUNT * COLUMN_COUNT)]
+Cell_Key_Array = np.array(Cell_Keys, dtype=np.uint64)
+
+# [seat][hotel index][count held]
+Holding_Keys = [[[0] + [zobrist_rng.getrandbits(64) for count in range(START_STOCK)] for name, tier in HOTEL_LIST]
+                for seat in range(MAX_PLAYERS)]
+
+# [hotel name][available stock]
+Stock_Keys = {name: [zobrist_rng.getrandbits(64) for count in range(START_STOCK)] + [0] for name, tier in HOTEL_LIST}
+
+Turn_Keys = [zobrist_rng.getrandbits(64) for seat in range(MAX_PLAYERS)]
+State_Keys = [zobrist_rng.getrandbits(64) for game_state in range(5)]
+
+
+# Define a Tile
+# tiles never change, who owns the cell is kept in the ownership index of the board,
+# so every game shares the tiles in TILES and copying a game keeps them
+class Tile:
+    __slots__ = ("row", "col", "index")
+
+    def __init__(self, row, col):
+        self.row = row
+        self.col = col
+        self.index = row * COLUMN_COUNT + col
+
+    # name of the cell as printed on the tile, "1a" to "12i"
+    @property
+    def position(self):
+        return str(self.col + 1) + "abcdefghi"[self.row]
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+
+# every tile of the game by Tile.index
+TILES = tuple(Tile(row, col) for row in range(ROW_COUNT) for col in range(COLUMN_COUNT))
+
+# hotel name -> Hotel.index, the position of the hotel in HOTEL_LIST
+Hotel_Index = {name: index for index, (name, tier) in enumerate(HOTEL_LIST)}
+
+
+# Define a TileBag
+# tiles are shuffled once when the game is made and drawn in that order, the same rng deals the same game
+class TileBag:
+    __slots__ = ("tiles", "order", "position")
+
+    def __init__(self, tiles, rng):
+        self.tiles = list(tiles)
+        rng.shuffle(self.tiles)
+        self.order = bytes([tile.index for tile in self.tiles])
+
+        # tiles before position have been drawn
+        self.position = 0
+
+    def __len__(self):
+        return len(self.tiles) - self.position
+
+    def draw(self):
+        if self.position == len(self.tiles):
+            return None
+
+        tile = self.tiles[self.position]
+        self.position += 1
+        return tile
+
+
+# Define a Player
+# stock holds the count of stock held in each hotel by Hotel.index
+class Player:
+    __slots__ = ("name", "hand", "money", "stock", "stock_keys", "zobrist")
+
+    def __init__(self, name, seat=0):
+        self.name = name
+        self.hand = []
+        self.money = START_MONEY
+        self.stock = array("B", bytes(len(HOTEL_LIST)))
+
+        # Zobrist hash of the stock held
+        self.stock_keys = Holding_Keys[seat]
+        self.zobrist = 0
+
+    def add_tile_to_hand(self, bag):
+        tile = bag.draw()
+        if tile is not None:
+            self.hand.append(tile)
+
+    def remove_tile_from_hand(self, tile):
+        if tile in self.hand:
+            self.hand.remove(tile)
+
+    def increase_money(self, amount):
+        self.money += amount
+
+    def decrease_money(self, amount):
+        self.money -= amount
+
+    # hotel is the Hotel.index of the stock
+    def add_stock(self, hotel, count):
+        held = self.stock[hotel]
+        self.stock[hotel] = held + count
+        keys = self.stock_keys[hotel]
+        self.zobrist ^= keys[held] ^ keys[held + count]
+
+    def remove_stock(self, hotel, count):
+        held = self.stock[hotel]
+        self.stock[hotel] = held - count
+        keys = self.stock_keys[hotel]
+        self.zobrist ^= keys[held] ^ keys[held - count]
+
+    # Zobrist hash of the stock held, worked out from scratch
+    def rehash(self):
+        self.zobrist = 0
+        for hotel, count in enumerate(self.stock):
+            self.zobrist ^= self.stock_keys[hotel][count]
+
+    def invalid_tiles(self, game, bag=None, replace=True):
+        count = 0
+        for tile in self.hand.copy():
+            if game.dead_tile(tile):
+                # Tile is invalid
+                if replace:
+                    self.remove_tile_from_hand(tile)
+                    self.add_tile_to_hand(bag)
+                else:
+                    count += 1
+        if not replace:
+            return count
+
+    # True if none of the tiles in hand can be played
+    def playable_tiles(self, game):
+        count = len(self.hand)
+
+        for tile in self.hand:
+            if game.unplayable_tile(tile):
+                count -= 1
+
+        return count == 0
+
+
+# Define a Hotel
+class Hotel:
+    __slots__ = ("name", "index", "tier", "color", "tiles", "available_stock", "stock_choice_amount", "stock_keys",
+                 "zobrist", "price_size", "price_row", "board", "owner_id")
+
+    def __init__(self, name, tier, color=None):
+        self.name = name
+        self.index = Hotel_Index[name]
+        self.tier = tier
+        self.color = color
+        self.tiles = []
+        self.available_stock = START_STOCK
+        self.stock_choice_amount = 0
+
+        # Zobrist hash of the available stock
+        self.stock_keys = Stock_Keys[name]
+        self.zobrist = 0
+
+        # prices from Price_Table, looked up again only when the size changes
+        self.price_size = 0
+        self.price_row = Price_Table[tier - 1][0]
+
+        # set when the hotel is registered with a board
+        self.board = None
+        self.owner_id = EMPTY_CELL
+
+    @property
+    def size(self):
+        return len(self.tiles)
+
+    @property
+    def prices(self):
+        if self.price_size != len(self.tiles):
+            self.price_size = len(self.tiles)
+            self.price_row = Price_Table[self.tier - 1][self.price_size]
+        return self.price_row
+
+    @property
+    def stock_price(self):
+        return self.prices[0]
+
+    @property
+    def major_bonus(self):
+        return self.prices[1]
+
+    @property
+    def minor_bonus(self):
+        return self.prices[2]
+
+    def add_tile(self, tile):
+        self.tiles.append(tile)
+        if self.board is not None:
+            self.board.set_owner(tile, self.owner_id)
+
+    def add_tiles(self, tiles):
+        for tile in tiles:
+            self.add_tile(tile)
+
+    # moves every tile of the acquired hotel into this hotel, the ownership index is updated in one step
+    def absorb(self, hotel):
+        if self.board is not None:
+            self.board.change_owner(hotel.owner_id, self.owner_id)
+
+        self.tiles.extend(hotel.tiles)
+        hotel.tiles = []
+
+    def increase_stock(self, count):
+        self.zobrist ^= self.stock_keys[self.available_stock] ^ self.stock_keys[self.available_stock + count]
+        self.available_stock += count
+
+    def decrease_stock(self, count):
+        self.zobrist ^= self.stock_keys[self.available_stock] ^ self.stock_keys[self.available_stock - count]
+        self.available_stock -= count
+
+    # Zobrist hash of the available stock, worked out from scratch
+    def rehash(self):
+        self.zobrist = self.stock_keys[self.available_stock]
+
+    # keeps track of players purchasing
+    def stock_choice(self, choice):
+        if choice == self.stock_choice_amount:
+            self.stock_choice_amount = 0
+        elif choice <= self.available_stock:
+            self.stock_choice_amount = choice
+
+
+# Cell classes, what playing a tile on an unplaced cell would do
+CELL_PLAIN = 0       # joins nothing
+CELL_FOUNDING = 1    # joins unincorporated tiles, founding a hotel
+CELL_GROWTH = 2      # grows the one hotel next to it
+CELL_MERGER = 3      # merges two or more hotels
+CELL_DEAD = 4        # would merge two or more safe hotels, can never be played
+CELL_PLACED = 5      # already on the board
+
+
+# cell index -> the cells next to it, and the mask of the cell with those next to it,
+# worked out once for a board size and shared by every board of that size
+@functools.lru_cache(maxsize=None)
+def board_neighbours(rows, cols):
+    neighbours = []
+    for index in range(rows * cols):
+        row, col = divmod(index, cols)
+        neighbours.append(tuple(r * cols + c
+                                for r, c in ((row - 1, col), (row + 1, col), (row, col - 1), (row, col + 1))
+                                if 0 <= r < rows and 0 <= c < cols))
+
+    areas = tuple(sum(1 << n_index for n_index in cells) | 1 << index for index, cells in enumerate(neighbours))
+    return tuple(neighbours), areas
+
+
+# Define the Board
+# unincorporated tiles are grouped into labeled regions of connected tiles, kept up to date on
+# every place_tile/remove_tile so the tiles a new tile would join are found without searching
+# owners is the ownership index, a grid holding EMPTY_CELL, BOARD_CELL or the owner_id of a hotel
+class Board:
+    def __init__(self, rows, cols):
+        self.rows = rows
+        self.cols = cols
+        self.tiles = []
+
+        self.hotels = []
+        self.owners = np.full((rows, cols), EMPTY_CELL, dtype=np.int8)
+        self.cell_owners = self.owners.reshape(-1)
+
+        # Zobrist hash of the ownership index, updated with every change of owner
+        self.zobrist = 0
+
+        # chain counters, kept up to date with every change of owner
+        # hotel_sizes by owner_id, hotels with tiles, hotels of SAFE_SIZE or more, size of the largest hotel
+        self.hotel_sizes = [0]
+        self.active_count = 0
+        self.safe_count = 0
+        self.largest = 0
+
+        # class of every cell, only cells next to a change are classified again and only when next asked for
+        # bit index of stale_mask is set while the class of cell index is out of date
+        self.cell_classes = bytearray(rows * cols)
+        self.stale_mask = 0
+
+        # cell index -> region label, label -> tiles in that region
+        self.labels = [None] * (rows * cols)
+        self.regions = {}
+        self.next_label = 0
+
+        self.neighbours, self.areas = board_neighbours(rows, cols)
+
+    # gives each hotel its owner_id in the ownership index
+    def add_hotels(self, hotels):
+        self.hotels = list(hotels)
+        self.hotel_sizes = [0] * (len(self.hotels) + 1)
+        for index, hotel in enumerate(self.hotels):
+            hotel.board = self
+            hotel.owner_id = index + 1
+            for tile in hotel.tiles:
+                self.set_owner(tile, hotel.owner_id)
+
+    def set_owner(self, tile, owner_id):
+        old_owner_id = int(self.cell_owners[tile.index])
+        self.cell_owners[tile.index] = owner_id
+
+        keys = Cell_Keys[tile.index]
+        self.zobrist ^= keys[old_owner_id + 1] ^ keys[owner_id + 1]
+
+        self.stale_mask |= self.areas[tile.index]
+
+        if old_owner_id > 0:
+            self.resize(old_owner_id, -1)
+        if owner_id > 0:
+            self.resize(owner_id, 1)
+
+    # hands every cell of one owner to another
+    def change_owner(self, old_owner_id, new_owner_id):
+        cells = np.flatnonzero(self.cell_owners == old_owner_id)
+        self.cell_owners[cells] = new_owner_id
+        self.zobrist ^= int(np.bitwise_xor.reduce(Cell_Key_Array[cells, old_owner_id + 1] ^
+                                                  Cell_Key_Array[cells, new_owner_id + 1]))
+
+        self.stale_neighbours(cells)
+
+        if old_owner_id > 0:
+            self.resize(old_owner_id, -len(cells))
+        if new_owner_id > 0:
+            self.resize(new_owner_id, len(cells))
+
+    # keeps the chain counters up to date when a hotel grows or shrinks by count tiles
+    def resize(self, owner_id, count):
+        old_size = self.hotel_sizes[owner_id]
+        size = old_size + count
+        self.hotel_sizes[owner_id] = size
+
+        self.active_count += (size > 0) - (old_size > 0)
+
+        # cells next to a hotel that becomes safe, or stops being safe, may now be dead or not
+        if (size >= SAFE_SIZE) != (old_size >= SAFE_SIZE):
+            self.safe_count += 1 if size >= SAFE_SIZE else -1
+            self.stale_neighbours(np.flatnonzero(self.cell_owners == owner_id))
+
+        if size > self.largest:
+            self.largest = size
+        elif old_size == self.largest and size < old_size:
+            self.largest = max(self.hotel_sizes)
+
+    def stale_neighbours(self, cells):
+        for index in cells.tolist():
+            self.stale_mask |= self.areas[index]
+
+    # class of the cell at index, see CELL_PLAIN
+    def cell_class(self, index):
+        if self.stale_mask:
+            self.classify()
+        return self.cell_classes[index]
+
+    # classifies every stale cell again from its neighbours
+    def classify(self):
+        cell_owners = self.cell_owners.tolist()
+
+        stale = self.stale_mask
+        while stale:
+            bit = stale & -stale
+            stale ^= bit
+            index = bit.bit_length() - 1
+
+            if cell_owners[index] != EMPTY_CELL:
+                self.cell_classes[index] = CELL_PLACED
+                continue
+
+            owner_ids = []
+            next_to_board = False
+            for n_index in self.neighbours[index]:
+                owner_id = cell_owners[n_index]
+                if owner_id == BOARD_CELL:
+                    next_to_board = True
+                elif owner_id > 0 and owner_id not in owner_ids:
+                    owner_ids.append(owner_id)
+
+            if len(owner_ids) > 1:
+                safe = sum(1 for owner_id in owner_ids if self.hotel_sizes[owner_id] >= SAFE_SIZE)
+                self.cell_classes[index] = CELL_DEAD if safe > 1 else CELL_MERGER
+            elif owner_ids:
+                self.cell_classes[index] = CELL_GROWTH
+            else:
+                self.cell_classes[index] = CELL_FOUNDING if next_to_board else CELL_PLAIN
+
+        self.stale_mask = 0
+
+    # works out the chain counters and cell classes from scratch
+    def recount(self):
+        self.hotel_sizes = np.bincount(self.cell_owners[self.cell_owners > 0],
+                                       minlength=len(self.hotels) + 1).tolist()
+        self.active_count = sum(size > 0 for size in self.hotel_sizes)
+        self.safe_count = sum(size >= SAFE_SIZE for size in self.hotel_sizes)
+        self.largest = max(self.hotel_sizes)
+        self.stale_mask = (1 << len(self.cell_owners)) - 1
+
+    # Zobrist hash of the ownership index, worked out from scratch
+    def rehash(self):
+        cells = np.arange(len(self.cell_owners))
+        self.zobrist = int(np.bitwise_xor.reduce(Cell_Key_Array[cells, self.cell_owners + 1]))
+
+    # hotels next to a cell, in hotel list order
+    def neighbour_hotels(self, index):
+        owner_ids = []
+        for n_index in self.neighbours[index]:
+            owner_id = self.cell_owners[n_index]
+            if owner_id > 0 and owner_id not in owner_ids:
+                owner_ids.append(owner_id)
+        owner_ids.sort()
+        return [self.hotels[owner_id - 1] for owner_id in owner_ids]
+
+    def place_tile(self, tile):
+        self.tiles.append(tile)
+        self.set_owner(tile, BOARD_CELL)
+
+        # join the tile to the largest neighbouring region and relabel the smaller ones into it
+        labels = self.neighbour_labels(tile.index)
+
+        if not labels:
+            label = self.next_label
+            self.next_label += 1
+            self.regions[label] = []
+        else:
+            label = max(labels, key=lambda x: len(self.regions[x]))
+            for other in labels:
+                if other != label:
+                    for b_tile in self.regions.pop(other):
+                        self.labels[b_tile.index] = label
+                        self.regions[label].append(b_tile)
+
+        self.labels[tile.index] = label
+        self.regions[label].append(tile)
+
+    def remove_tile(self, tile):
+        if tile in self.tiles:
+            self.tiles.remove(tile)
+            self.set_owner(tile, EMPTY_CELL)
+
+            label = self.labels[tile.index]
+            self.labels[tile.index] = None
+            region = self.regions.pop(label)
+            region.remove(tile)
+
+            # the rest of the region may have been split in two by the removal
+            cells = {}
+            for b_tile in region:
+                self.labels[b_tile.index] = None
+                cells[b_tile.index] = b_tile
+            for b_tile in region:
+                if self.labels[b_tile.index] is None:
+                    self.label_region(b_tile, cells)
+
+    # gives a new label to every tile in cells connected to start_tile
+    def label_region(self, start_tile, cells):
+        label = self.next_label
+        self.next_label += 1
+
+        self.labels[start_tile.index] = label
+        found = [start_tile]
+
+        for b_tile in found:
+            for index in self.neighbours[b_tile.index]:
+                if index in cells and self.labels[index] is None:
+                    self.labels[index] = label
+                    found.append(cells[index])
+
+        self.regions[label] = found
+
+    # labels of the regions next to a cell
+    def neighbour_labels(self, index):
+        labels = []
+        for n_index in self.neighbours[index]:
+            label = self.labels[n_index]
+            if label is not None and label not in labels:
+                labels.append(label)
+        return labels
+
+    # tiles on the board connected to the given tile, not including the tile itself
+    def connected_tiles(self, tile):
+        own_label = self.labels[tile.index]
+        if own_label is not None:
+            return [b_tile for b_tile in self.regions[own_label] if b_tile is not tile]
+
+        list_of_tiles = []
+        for label in self.neighbour_labels(tile.index):
+            list_of_tiles.extend(self.regions[label])
+        return list_of_tiles
+
+
+# Move log, one op byte followed by its arguments for every decision of a player, see replay.py
+MOVE_TILE = 0        # tile index
+MOVE_FOUND = 1       # hotel list position
+MOVE_ORDER = 2       # hotel list position
+MOVE_TRADE = 3
+MOVE_SELL = 4
+MOVE_KEEP = 5
+MOVE_BUY = 6         # number of stocks bought, then the hotel list position of each
+MOVE_END_TURN = 7
+MOVE_END_GAME = 8
+
+# every purchase of up to 3 stocks, fewest stocks first and then in hotel order
+# BUY_MOVES holds each as a MOVE_BUY move and BUY_COUNTS as a row with the number bought from each hotel
+BUY_MOVES = [(MOVE_BUY, count) + picks for count in range(4)
+             for picks in itertools.combinations_with_replacement(range(len(HOTEL_LIST)), count)]
+BUY_COUNTS = np.array([np.bincount(np.array(move[2:], dtype=np.int64), minlength=len(HOTEL_LIST))
+                       for move in BUY_MOVES])
+
+# Merger sub-states, game_state stays at 1 until the merger is complete
+MERGER_ORDER = "order"
+MERGER_DISPOSE = "dispose"
+
+
+# Define a Merger, the progress of one merger through its sub-states
+# MERGER_ORDER - the merging player orders the hotels of equal size in groups[0]
+# MERGER_DISPOSE - the active player trades, sells or keeps their stock in acquired_hotel
+class Merger:
+    def __init__(self, tile, groups):
+        self.tile = tile
+        self.groups = groups
+        self.sorted_hotel = []
+        self.state = MERGER_ORDER
+
+        self.large_hotel = None
+        self.acquired = []
+        self.acquired_hotel = None
+
+        # players still to be asked about acquired_hotel, counting the active player
+        self.players_left = 0
+
+
+# Snapshot, the whole state of a game between two decisions in a fixed layout of SNAPSHOT_SIZE bytes
+# header - game_state, turn_counter, number of players, tile bag position, selected tile
+# owners - the ownership index by cell, bag - tile indexes in drawing order
+# hands, money, holdings - MAX_PLAYERS rows, NO_TILE pads a hand
+# available_stock, stock_choice_amount - one byte per hotel
+# merger - sub-state, tile, sorted_hotel, position of acquired_hotel in sorted_hotel, players_left,
+#          then the hotels still to be ordered and the group of each
+NO_TILE = 0xFF
+CELL_COUNT = ROW_COUNT * COLUMN_COUNT
+MERGER_HOTELS = 4
+
+SNAPSHOT_HEADER = struct.Struct("<5B")
+SNAPSHOT_MONEY = struct.Struct(f"<{MAX_PLAYERS}i")
+SNAPSHOT_MERGER = struct.Struct(f"<2B{MERGER_HOTELS}B2B{MERGER_HOTELS}B{MERGER_HOTELS}B")
+
+SNAPSHOT_OWNERS = SNAPSHOT_HEADER.size
+SNAPSHOT_BAG = SNAPSHOT_OWNERS + CELL_COUNT
+SNAPSHOT_HANDS = SNAPSHOT_BAG + CELL_COUNT
+SNAPSHOT_MONEY_AT = SNAPSHOT_HANDS + MAX_PLAYERS * HAND_SIZE
+SNAPSHOT_HOLDINGS = SNAPSHOT_MONEY_AT + SNAPSHOT_MONEY.size
+SNAPSHOT_STOCK = SNAPSHOT_HOLDINGS + MAX_PLAYERS * len(HOTEL_LIST)
+SNAPSHOT_CHOICE = SNAPSHOT_STOCK + len(HOTEL_LIST)
+SNAPSHOT_MERGER_AT = SNAPSHOT_CHOICE + len(HOTEL_LIST)
+SNAPSHOT_SIZE = SNAPSHOT_MERGER_AT + SNAPSHOT_MERGER.size
+
+MERGER_STATES = [None, MERGER_ORDER, MERGER_DISPOSE]
+
+
+def padded(values, length, pad=NO_TILE):
+    return list(values) + [pad] * (length - len(values))
+
+
+# Define the Game
+# game_state: 0 - start of turn, 1 - tile selection, 2 - company creation, 3 - buying stock, 4 - end of turn
+class AcquireGame:
+    def __init__(self, game_items):
+        self.board = game_items["game_board"]
+        self.tile_bag = game_items["tile_bag"]
+        self.lst_players = game_items["players"]
+        self.lst_hotels = game_items["hotels"]
+        self.board.add_hotels(self.lst_hotels)
+
+        # every tile of the game by Tile.index
+        self.tiles = game_items["tiles"]
+
+        # seed of the rng that shuffled the tile bag and picks the first player
+        self.seed = game_items.get("seed")
+        rng = game_items.get("rng") or random.Random(self.seed)
+
+        self.turn_counter = rng.randint(0, len(self.lst_players) - 1)
+        self.game_state = 0
+
+        # tile waiting on a company to be chosen in game state 2
+        self.selected_tile = None
+        self.new_company_tiles = []
+
+        # merger in progress in game state 1
+        self.merger = None
+
+        # every decision so far, with the seed this is enough to play the game again
+        self.moves = bytearray()
+
+    # True if empty company exists
+    @property
+    def empty_companies(self):
+        return self.board.active_count < len(self.lst_hotels)
+
+    # 64 bit Zobrist hash of the position, the board, hotels and players each keep their part up to date
+    @property
+    def zobrist(self):
+        value = self.board.zobrist ^ Turn_Keys[self.turn_counter] ^ State_Keys[self.game_state]
+        for player in self.lst_players:
+            value ^= player.zobrist
+        for hotel in self.lst_hotels:
+            value ^= hotel.zobrist
+        return value
+
+    # works out every part of the Zobrist hash from scratch
+    def rehash(self):
+        self.board.rehash()
+        for player in self.lst_players:
+            player.rehash()
+        for hotel in self.lst_hotels:
+            hotel.rehash()
+
+    @property
+    def active_player(self):
+        return self.lst_players[self.turn_counter]
+
+    @property
+    def active_hotels(self):
+        return [hotel for hotel in self.lst_hotels if hotel.tiles]
+
+    def record(self, op, *args):
+        self.moves.append(op)
+        self.moves.extend(args)
+
+    def next_game_state(self, num=1):
+        self.game_state = (self.game_state + num) % 5
+
+    def next_turn(self):
+        self.turn_counter = (self.turn_counter + 1) % len(self.lst_players)
+
+    def reset_stock_picks(self):
+        for hotel in self.lst_hotels:
+            hotel.stock_choice(0)
+
+    # checks what tiles on board would form a hotel with new tile
+    def touching_board(self, tile):
+        return self.board.connected_tiles(tile)
+
+    # checks if places tile is touching any hotels
+    def touching_hotel(self, tile):
+        return self.board.neighbour_hotels(tile.index)
+
+    # True if the tile would merge more than one safe hotel
+    def dead_tile(self, tile):
+        return self.board.cell_class(tile.index) == CELL_DEAD
+
+    # True if the tile can't be played, it merges safe hotels or founds a hotel when all 7 exist
+    def unplayable_tile(self, tile):
+        cell_class = self.board.cell_class(tile.index)
+        return cell_class == CELL_DEAD or (cell_class == CELL_FOUNDING and not self.empty_companies)
+
+    # checks endgame conditions, 41 or more in length or at least one hotel and all hotels are safe
+    def endgame_con(self):
+        board = self.board
+        return board.largest >= END_SIZE or 0 < board.active_count == board.safe_count
+
+    # True once no player can play and no tiles are left to draw, the game can end then too
+    def stalemate(self):
+        return not self.tile_bag and all(player.playable_tiles(self) for player in self.lst_players)
+
+    # Game state 1 - places a tile that touches at most one hotel
+    # returns False if the tile can not be placed this way
+    def place_tile(self, tile):
+        touch_hotel = self.touching_hotel(tile)
+        new_company_tiles = self.touching_board(tile)
+
+        if self.unplayable_tile(tile) or len(touch_hotel) > 1:
+            return False
+
+        self.record(MOVE_TILE, tile.index)
+
+        # if the placed tile is not touching a hotel
+        if len(touch_hotel) == 0:
+            self.active_player.remove_tile_from_hand(tile)
+            self.board.place_tile(tile)
+
+            # Check if a company is created
+            if len(new_company_tiles) >= 1:
+                self.selected_tile = tile
+                self.new_company_tiles = new_company_tiles
+                self.next_game_state()
+
+            # Move to buy
+            elif self.active_hotels:
+                self.next_game_state(2)
+
+            # Skip to next turn if no company exists to buy stocks from
+            else:
+                self.next_game_state(3)
+
+            return True
+
+        # if the placed tile is touching exactly hotel
+        elif len(touch_hotel) == 1:
+            self.active_player.remove_tile_from_hand(tile)
+
+            for b_tile in new_company_tiles:
+                self.board.remove_tile(b_tile)
+            touch_hotel[0].add_tiles(new_company_tiles)
+
+            touch_hotel[0].add_tile(tile)
+
+            self.next_game_state(2)
+            return True
+
+    # Game state 1 - groups the hotels in a merger from largest to smallest
+    # hotels of equal size share a group and need to be ordered by the player
+    def merger_groups(self, hotels):
+        company_length = [len(hotel.tiles) for hotel in hotels]
+
+        return [[hotel for hotel in hotels if len(hotel.tiles) == size]
+                for size in sorted(set(company_length), reverse=True)]
+
+    # Merger - pays the majority and minority shareholders of an acquired hotel
+    def shareholder_bonus(self, a_hotel):
+        player_stocks = {}
+        for player in self.lst_players:
+            if player.stock[a_hotel.index] != 0:
+                player_stocks[player] = player.stock[a_hotel.index]
+
+        if not player_stocks:
+            return
+
+        max_amount = max(list(player_stocks.values()))
+        count_max_player = list(player_stocks.values()).count(max_amount)
+        total_bonus = a_hotel.major_bonus + a_hotel.minor_bonus
+
+        if count_max_player > 1:
+            money_split = math.ceil((total_bonus / count_max_player) / 100) * 100
+
+            for player, stock in player_stocks.items():
+                if stock == max_amount:
+                    player.increase_money(money_split)
+
+        else:
+            for player, stock in player_stocks.items():
+                if stock == max_amount:
+                    player.increase_money(a_hotel.major_bonus)
+
+            if len(player_stocks) == 1:
+                list(player_stocks.keys())[0].increase_money(a_hotel.minor_bonus)
+
+            else:
+                second_max_amount = sorted(set(list(player_stocks.values())))[-2]
+                count_sec_max_player = list(player_stocks.values()).count(second_max_amount)
+
+                money_split = math.ceil((a_hotel.minor_bonus / count_sec_max_player) / 100) * 100
+
+                for player, stock in player_stocks.items():
+                    if stock == second_max_amount:
+                        player.increase_money(money_split)
+
+    # Merger - trades two stock of the acquired hotel for one of the large hotel
+    def trade_stock(self, acquired_hotel, large_hotel):
+        if self.active_player.stock[acquired_hotel.index] >= 2 and large_hotel.available_stock > 0:
+            large_hotel.decrease_stock(1)
+            self.active_player.add_stock(large_hotel.index, 1)
+            self.active_player.remove_stock(acquired_hotel.index, 2)
+            acquired_hotel.increase_stock(2)
+            return True
+        return False
+
+    # Merger - sells one stock of the acquired hotel
+    def sell_stock(self, acquired_hotel):
+        if self.active_player.stock[acquired_hotel.index] > 0:
+            acquired_hotel.increase_stock(1)
+            self.active_player.remove_stock(acquired_hotel.index, 1)
+            self.active_player.increase_money(acquired_hotel.stock_price)
+            return True
+        return False
+
+    # Merger - moves the tiles of the acquired hotel to the large hotel
+    def absorb_hotel(self, large_hotel, acquired_hotel):
+        large_hotel.absorb(acquired_hotel)
+
+    # Merger - places the merging tile and any board tiles next to it in the large hotel
+    def complete_merger(self, tile, large_hotel):
+        new_company_tiles = self.touching_board(tile)
+
+        self.active_player.remove_tile_from_hand(tile)
+        large_hotel.add_tile(tile)
+
+        for b_tile in new_company_tiles:
+            self.board.remove_tile(b_tile)
+        large_hotel.add_tiles(new_company_tiles)
+
+        self.next_game_state(2)
+
+    # Game state 1 - starts the merger caused by the tile, returns False for a dead tile
+    def start_merger(self, tile):
+        touch_hotel = self.touching_hotel(tile)
+        if len(touch_hotel) < 2 or self.dead_tile(tile):
+            return False
+
+        self.record(MOVE_TILE, tile.index)
+
+        # the tile leaves the hand as it is played, it joins the board once the merger is complete
+        self.active_player.remove_tile_from_hand(tile)
+
+        self.merger = Merger(tile, self.merger_groups(touch_hotel))
+        self.order_merger()
+        return True
+
+    # Merger - takes hotels in size order until a tie needs the player to choose
+    def order_merger(self):
+        merger = self.merger
+
+        while merger.groups and len(merger.groups[0]) == 1:
+            merger.sorted_hotel.append(merger.groups.pop(0)[0])
+
+        if not merger.groups:
+            merger.large_hotel = merger.sorted_hotel[0]
+            merger.acquired = merger.sorted_hotel[1:]
+            self.next_acquired()
+
+    # Merger tie-break - the chosen hotel comes next of those with equal size
+    def choose_merger_hotel(self, hotel):
+        merger = self.merger
+        if merger is None or merger.state != MERGER_ORDER or hotel not in merger.groups[0]:
+            return False
+
+        self.record(MOVE_ORDER, hotel.owner_id - 1)
+
+        merger.groups[0].remove(hotel)
+        merger.sorted_hotel.append(hotel)
+        self.order_merger()
+        return True
+
+    # Merger - pays the bonus of the next acquired hotel and asks its holders in turn,
+    # completes the merger once every hotel is acquired
+    def next_acquired(self):
+        merger = self.merger
+
+        if merger.acquired:
+            merger.acquired_hotel = merger.acquired.pop(0)
+            merger.state = MERGER_DISPOSE
+            merger.players_left = len(self.lst_players)
+
+            self.shareholder_bonus(merger.acquired_hotel)
+            self.next_holder()
+        else:
+            self.merger = None
+            self.complete_merger(merger.tile, merger.large_hotel)
+
+    # Merger - moves round the table to the next player holding stock in the acquired hotel
+    def next_holder(self):
+        merger = self.merger
+
+        while merger.players_left > 0 and self.active_player.stock[merger.acquired_hotel.index] == 0:
+            self.next_turn()
+            merger.players_left -= 1
+
+        if merger.players_left == 0:
+            self.absorb_hotel(merger.large_hotel, merger.acquired_hotel)
+            self.next_acquired()
+
+    # Merger - the active player is done with the acquired hotel
+    def finish_holder(self):
+        self.next_turn()
+        self.merger.players_left -= 1
+        self.next_holder()
+
+    # Merger - trade, sell or keep for the active player, the next holder is asked once they keep or have no stock left
+    def merger_trade(self):
+        merger = self.merger
+        if not self.trade_stock(merger.acquired_hotel, merger.large_hotel):
+            return False
+        self.record(MOVE_TRADE)
+        if self.active_player.stock[merger.acquired_hotel.index] == 0:
+            self.finish_holder()
+        return True
+
+    def merger_sell(self):
+        merger = self.merger
+        if not self.sell_stock(merger.acquired_hotel):
+            return False
+        self.record(MOVE_SELL)
+        if self.active_player.stock[merger.acquired_hotel.index] == 0:
+            self.finish_holder()
+        return True
+
+    def merger_keep(self):
+        self.record(MOVE_KEEP)
+        self.finish_holder()
+        return True
+
+    # Game state 2 - creates the chosen hotel from the selected tile
+    def found_hotel(self, hotel):
+        if hotel.tiles or self.selected_tile is None:
+            return False
+
+        self.record(MOVE_FOUND, hotel.owner_id - 1)
+
+        for tile in self.new_company_tiles:
+            self.board.remove_tile(tile)
+
+        self.board.remove_tile(self.selected_tile)
+
+        hotel.add_tiles(self.new_company_tiles + [self.selected_tile])
+        self.selected_tile = None
+        self.new_company_tiles = []
+
+        if hotel.available_stock > 0:
+            self.active_player.add_stock(hotel.index, 1)
+            hotel.decrease_stock(1)
+
+        self.next_game_state()
+        return True
+
+    # Game state 3 - selects an amount of stock, reverted if it can't be afforded or exceeds 3 stocks
+    def choose_stock(self, hotel, amount):
+        if not hotel.tiles:
+            return False
+
+        cur_stock_amount = hotel.stock_choice_amount
+        hotel.stock_choice(amount)
+
+        if self.purchase_cost > self.active_player.money or self.purchase_count > 3:
+            hotel.stock_choice(cur_stock_amount)
+            return False
+        return True
+
+    @property
+    def purchase_cost(self):
+        return sum(hotel.stock_price * hotel.stock_choice_amount for hotel in self.lst_hotels)
+
+    @property
+    def purchase_count(self):
+        return sum(hotel.stock_choice_amount for hotel in self.lst_hotels)
+
+    # Game state 3 - buys the selected stocks
+    def buy_stock(self):
+        bought = [hotel.owner_id - 1 for hotel in self.lst_hotels for iter in range(hotel.stock_choice_amount)]
+        self.record(MOVE_BUY, len(bought), *bought)
+
+        for hotel in self.lst_hotels:
+            self.active_player.add_stock(hotel.index, hotel.stock_choice_amount)
+            self.active_player.decrease_money(hotel.stock_price * hotel.stock_choice_amount)
+            hotel.decrease_stock(hotel.stock_choice_amount)
+            hotel.stock_choice(0)
+
+        self.reset_stock_picks()
+        self.next_game_state()
+
+    # rows of BUY_COUNTS the active player can afford from hotels on the board with enough stock left
+    def affordable_buys(self):
+        prices = np.array([hotel.stock_price for hotel in self.lst_hotels])
+        available = np.array([hotel.available_stock if hotel.tiles else 0 for hotel in self.lst_hotels])
+
+        affordable = (BUY_COUNTS @ prices <= self.active_player.money) & (BUY_COUNTS <= available).all(axis=1)
+        return np.flatnonzero(affordable)
+
+    # every purchase the active player can make as MOVE_BUY moves, fewest stocks first
+    def buy_moves(self):
+        return [BUY_MOVES[row] for row in self.affordable_buys().tolist()]
+
+    # every legal decision of the active player as a move tuple, the op then its arguments as in the move log
+    # a player with no playable tile goes straight to buying
+    def legal_moves(self):
+        merger = self.merger
+        if merger is not None:
+            if merger.state == MERGER_ORDER:
+                return [(MOVE_ORDER, hotel.owner_id - 1) for hotel in merger.groups[0]]
+
+            moves = [(MOVE_SELL,), (MOVE_KEEP,)]
+            if self.active_player.stock[merger.acquired_hotel.index] >= 2 and \
+                    merger.large_hotel.available_stock > 0:
+                moves.insert(0, (MOVE_TRADE,))
+            return moves
+
+        if self.game_state <= 1:
+            moves = [(MOVE_TILE, tile.index) for tile in self.active_player.hand if not self.unplayable_tile(tile)]
+            return moves or self.buy_moves()
+
+        if self.game_state == 2:
+            return [(MOVE_FOUND, pos) for pos, hotel in enumerate(self.lst_hotels) if not hotel.tiles]
+
+        if self.game_state == 3:
+            return self.buy_moves()
+
+        # the game can end once a hotel is large enough or all are safe, or no player can play and no tiles are left
+        if self.endgame_con() or self.stalemate():
+            return [(MOVE_END_TURN,), (MOVE_END_GAME,)]
+        return [(MOVE_END_TURN,)]
+
+    # makes the decision of the active player given by a move, from legal_moves or the move log
+    def play_move(self, op, *args):
+        if self.game_state == 0:
+            self.next_game_state()
+
+        if op == MOVE_TILE:
+            tile = self.tiles[args[0]]
+            if not self.start_merger(tile):
+                self.place_tile(tile)
+
+        elif op == MOVE_FOUND:
+            self.found_hotel(self.lst_hotels[args[0]])
+
+        elif op == MOVE_ORDER:
+            self.choose_merger_hotel(self.lst_hotels[args[0]])
+
+        elif op == MOVE_TRADE:
+            self.merger_trade()
+
+        elif op == MOVE_SELL:
+            self.merger_sell()
+
+        elif op == MOVE_KEEP:
+            self.merger_keep()
+
+        elif op == MOVE_BUY:
+            # a player with no playable tiles skips to buying
+            if self.game_state == 1:
+                self.next_game_state(2)
+
+            self.reset_stock_picks()
+            for position in args[1:]:
+                hotel = self.lst_hotels[position]
+                self.choose_stock(hotel, hotel.stock_choice_amount + 1)
+            self.buy_stock()
+
+        elif op == MOVE_END_TURN:
+            self.end_turn()
+
+        elif op == MOVE_END_GAME:
+            self.final_scoring()
+
+    # Game state 4 - refills the hand and passes the turn
+    def end_turn(self):
+        self.record(MOVE_END_TURN)
+
+        self.active_player.add_tile_to_hand(self.tile_bag)
+        self.active_player.invalid_tiles(self, self.tile_bag, replace=True)
+
+        self.next_game_state()
+        self.next_turn()
+
+    # Game Over - pays shareholder bonuses and sells all stock
+    def final_scoring(self):
+        self.record(MOVE_END_GAME)
+
+        for hotel in self.lst_hotels:
+            if hotel.available_stock != START_STOCK:
+                self.shareholder_bonus(hotel)
+
+                # Stock Payout
+                for player in self.lst_players:
+                    player.increase_money(hotel.stock_price * player.stock[hotel.index])
+
+    # the state of the game as SNAPSHOT_SIZE bytes, the move log is not included
+    def snapshot(self):
+        selected = NO_TILE if self.selected_tile is None else self.selected_tile.index
+
+        buffer = bytearray(SNAPSHOT_SIZE)
+        SNAPSHOT_HEADER.pack_into(buffer, 0, self.game_state, self.turn_counter, len(self.lst_players),
+                                  self.tile_bag.position, selected)
+        buffer[SNAPSHOT_OWNERS:SNAPSHOT_BAG] = self.board.cell_owners.tobytes()
+        buffer[SNAPSHOT_BAG:SNAPSHOT_HANDS] = self.tile_bag.order
+
+        money = [0] * MAX_PLAYERS
+        for iter, player in enumerate(self.lst_players):
+            hand = SNAPSHOT_HANDS + iter * HAND_SIZE
+            buffer[hand:hand + len(player.hand)] = bytes([tile.index for tile in player.hand])
+            buffer[hand + len(player.hand):hand + HAND_SIZE] = bytes([NO_TILE]) * (HAND_SIZE - len(player.hand))
+
+            holdings = SNAPSHOT_HOLDINGS + iter * len(HOTEL_LIST)
+            buffer[holdings:holdings + len(HOTEL_LIST)] = player.stock
+            money[iter] = player.money
+        SNAPSHOT_MONEY.pack_into(buffer, SNAPSHOT_MONEY_AT, *money)
+
+        buffer[SNAPSHOT_STOCK:SNAPSHOT_CHOICE] = bytes([hotel.available_stock for hotel in self.lst_hotels])
+        buffer[SNAPSHOT_CHOICE:SNAPSHOT_MERGER_AT] = bytes([hotel.stock_choice_amount for hotel in self.lst_hotels])
+
+        merger = self.merger
+        if merger is not None:
+            sorted_ids = [hotel.owner_id - 1 for hotel in merger.sorted_hotel]
+            acquired = NO_TILE if merger.acquired_hotel is None else \
+                merger.sorted_hotel.index(merger.acquired_hotel)
+            group_ids = [hotel.owner_id - 1 for group in merger.groups for hotel in group]
+            group_numbers = [number for number, group in enumerate(merger.groups) for hotel in group]
+
+            SNAPSHOT_MERGER.pack_into(buffer, SNAPSHOT_MERGER_AT, MERGER_STATES.index(merger.state), merger.tile.index,
+                                      *padded(sorted_ids, MERGER_HOTELS), acquired, merger.players_left,
+                                      *padded(group_ids, MERGER_HOTELS), *padded(group_numbers, MERGER_HOTELS))
+
+        return bytes(buffer)
+
+    # sets the state of the game from a snapshot of a game with the same players
+    def restore(self, buffer):
+        game_state, turn_counter, player_count, bag_position, selected = SNAPSHOT_HEADER.unpack_from(buffer, 0)
+        if player_count != len(self.lst_players) or len(buffer) != SNAPSHOT_SIZE:
+            raise ValueError("The snapshot is not from a game with these players.")
+
+        self.game_state = game_state
+        self.turn_counter = turn_counter
+        tiles = self.tiles
+
+        # Board, hotels and the ownership index
+        board = self.board
+        board.cell_owners[:] = np.frombuffer(buffer, dtype=np.int8, count=CELL_COUNT, offset=SNAPSHOT_OWNERS)
+
+        board.tiles = []
+        for hotel in self.lst_hotels:
+            hotel.tiles = []
+        for tile, owner_id in zip(tiles, board.cell_owners.tolist()):
+            if owner_id == BOARD_CELL:
+                board.tiles.append(tile)
+            elif owner_id != EMPTY_CELL:
+                self.lst_hotels[owner_id - 1].tiles.append(tile)
+
+        board.labels = [None] * len(tiles)
+        board.regions = {}
+        cells = {tile.index: tile for tile in board.tiles}
+        for tile in board.tiles:
+            if board.labels[tile.index] is None:
+                board.label_region(tile, cells)
+
+        board.rehash()
+        board.recount()
+
+        for hotel, available, choice in zip(self.lst_hotels, buffer[SNAPSHOT_STOCK:SNAPSHOT_CHOICE],
+                                            buffer[SNAPSHOT_CHOICE:SNAPSHOT_MERGER_AT]):
+            hotel.available_stock = available
+            hotel.stock_choice_amount = choice
+            hotel.rehash()
+
+        # Tile bag and players
+        self.tile_bag.order = bytes(buffer[SNAPSHOT_BAG:SNAPSHOT_HANDS])
+        self.tile_bag.tiles = [tiles[index] for index in self.tile_bag.order]
+        self.tile_bag.position = bag_position
+
+        money = SNAPSHOT_MONEY.unpack_from(buffer, SNAPSHOT_MONEY_AT)
+        for iter, player in enumerate(self.lst_players):
+            hand = SNAPSHOT_HANDS + iter * HAND_SIZE
+            player.hand = [tiles[index] for index in buffer[hand:hand + HAND_SIZE] if index != NO_TILE]
+
+            holdings = SNAPSHOT_HOLDINGS + iter * len(HOTEL_LIST)
+            player.stock = array("B", buffer[holdings:holdings + len(HOTEL_LIST)])
+            player.money = money[iter]
+            player.rehash()
+
+        # Founding and merger in progress
+        self.selected_tile = None if selected == NO_TILE else tiles[selected]
+        self.new_company_tiles = [] if self.selected_tile is None else board.connected_tiles(self.selected_tile)
+
+        merger = SNAPSHOT_MERGER.unpack_from(buffer, SNAPSHOT_MERGER_AT)
+        self.merger = None
+        if merger[0]:
+            hotels = self.lst_hotels
+            sorted_hotel = [hotels[iter] for iter in merger[2:2 + MERGER_HOTELS] if iter != NO_TILE]
+            acquired, players_left = merger[2 + MERGER_HOTELS:4 + MERGER_HOTELS]
+
+            groups = []
+            for iter, number in zip(merger[4 + MERGER_HOTELS:4 + 2 * MERGER_HOTELS], merger[4 + 2 * MERGER_HOTELS:]):
+                if iter != NO_TILE:
+                    if number == len(groups):
+                        groups.append([])
+                    groups[number].append(hotels[iter])
+
+            self.merger = Merger(tiles[merger[1]], groups)
+            self.merger.state = MERGER_STATES[merger[0]]
+            self.merger.sorted_hotel = sorted_hotel
+            self.merger.players_left = players_left
+            if acquired != NO_TILE:
+                self.merger.large_hotel = sorted_hotel[0]
+                self.merger.acquired_hotel = sorted_hotel[acquired]
+                self.merger.acquired = sorted_hotel[acquired + 1:]
+
+    # finishing place, name and money of each player from first to last
+    def standings(self):
+        player_money = {}
+
+        for player in self.lst_players:
+            player_money[player.name] = player.money
+
+        sorted_players = sorted(player_money, key=lambda x: player_money[x], reverse=True)
+
+        counts = {}
+        finish_place = [counts.setdefault(item, index) for index, item
+                        in enumerate(sorted(list(player_money.values()), reverse=True))]
+
+        return [(finish, player, player_money[player]) for player, finish in zip(sorted_players, finish_place)]
+
+
+# seed deals the tiles and picks the first player, the same seed always deals the same game
+def new_game(player_names, hotel_colors=None, seed=None):
+    # Check if correct number of players
+    if len(player_names) < MIN_PLAYERS or len(player_names) > MAX_PLAYERS:
+        raise ValueError("The number of players is not allowed.")
+
+    if seed is None:
+        seed = random.randrange(2 ** 32)
+    rng = random.Random(seed)
+
+    tile_bag = TileBag(TILES, rng)
+
+    # Game initialization
+    game_board = Board(ROW_COUNT, COLUMN_COUNT)
+
+    player_list = []
+
+    for seat, name in enumerate(player_names):
+        player_list.append(Player(name, seat))
+
+    # Adding tiles to players hands
+    for player in player_list:
+        for iter in range(HAND_SIZE):
+            player.add_tile_to_hand(tile_bag)
+
+    for iter in range(len(player_list)):
+        tile = tile_bag.draw()
+        if tile is not None:
+            game_board.place_tile(tile)
+
+    hotel_colors = hotel_colors or {}
+    company_list = [Hotel(name, tier, hotel_colors.get(name)) for name, tier in HOTEL_LIST]
+
+    game_items = {"game_board": game_board,
+                  "players": player_list,
+                  "hotels": company_list,
+                  "tile_bag": tile_bag,
+                  "tiles": TILES,
+                  "seed": seed,
+                  "rng": rng}
+
+    return AcquireGame(game_items)
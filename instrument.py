@@ -0,0 +1,176 @@
+import functools
+import json
+import threading
+import time
+from collections import Counter, defaultdict
+
+from engine import AcquireGame, Player
+
+# upper bounds in ms of the frame time histogram, the last bucket holds every slower frame
+FRAME_BUCKETS = [1, 2, 4, 8, 17, 33, 50, 100, 250]
+
+
+def game_phase(game, *args):
+    return f"state {game.game_state}"
+
+
+def player_phase(player, game, *args):
+    return game_phase(game)
+
+
+# (owner, method name, phase) of every watched function, owner is a class or a module
+# the first call into the engine is filed under a frame for the game state it started in, see Recorder.call
+WATCHED = [(AcquireGame, name, game_phase) for name in
+           ["place_tile", "start_merger", "choose_merger_hotel", "order_merger", "next_acquired", "next_holder",
+            "shareholder_bonus", "merger_trade", "merger_sell", "merger_keep", "absorb_hotel", "complete_merger",
+            "found_hotel", "buy_stock", "end_turn", "final_scoring", "touching_board", "touching_hotel",
+            "dead_tile", "unplayable_tile", "legal_moves", "play_move"]]
+WATCHED += [(Player, name, player_phase) for name in ["playable_tiles", "invalid_tiles"]]
+
+
+# watches more functions, such as the drawing of the game window
+def watch(owner, *names, phase=None):
+    WATCHED.extend((owner, name, phase) for name in names)
+
+
+# Define a Recorder, the timings collected while instrumentation is enabled
+# each thread keeps its own stack of the watched calls in progress, the times are shared
+class Recorder:
+    def __init__(self):
+        self.local = threading.local()
+        self.calls = Counter()
+
+        # seconds in each function counting its callees, and in each stack of calls not counting callees
+        self.total = defaultdict(float)
+        self.own = defaultdict(float)
+
+        self.frame_counts = [0] * (len(FRAME_BUCKETS) + 1)
+        self.frame_times = []
+
+    def stacks(self):
+        local = self.local
+        if not hasattr(local, "names"):
+            # names of the calls in progress, seconds spent in the finished callees of each, the open phase frames
+            local.names = []
+            local.callees = []
+            local.phases = 0
+        return local
+
+    def enter(self, local, name):
+        local.names.append(name)
+        local.callees.append(0.0)
+
+    def leave(self, local, elapsed):
+        name = local.names[-1]
+        self.own[";".join(local.names)] += elapsed - local.callees.pop()
+        local.names.pop()
+
+        if local.callees:
+            local.callees[-1] += elapsed
+        # a recursive call is already counted by the call it is inside
+        if name not in local.names:
+            self.total[name] += elapsed
+        self.calls[name] += 1
+
+    def call(self, func, name, phase, args, kwargs):
+        local = self.stacks()
+        phased = phase is not None and local.phases == 0
+        if phased:
+            local.phases += 1
+            self.enter(local, phase(*args))
+        self.enter(local, name)
+
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            self.leave(local, elapsed)
+            if phased:
+                self.leave(local, elapsed)
+                local.phases -= 1
+
+    # ms of work in one frame of the game window
+    def frame(self, ms):
+        self.frame_times.append(ms)
+        for bucket, bound in enumerate(FRAME_BUCKETS):
+            if ms <= bound:
+                self.frame_counts[bucket] += 1
+                return
+        self.frame_counts[-1] += 1
+
+    def report(self):
+        own = Counter()
+        for stack, seconds in self.own.items():
+            own[stack.rpartition(";")[2]] += seconds
+
+        frames = self.frame_times
+        labels = [f"<={bound}" for bound in FRAME_BUCKETS] + [f">{FRAME_BUCKETS[-1]}"]
+        phases = sorted(name for name in self.calls if name.startswith("state "))
+        functions = sorted(set(self.calls) - set(phases), key=lambda x: -self.total[x])
+        return {
+            "phases": {name: {"calls": self.calls[name], "total_ms": round(self.total[name] * 1000, 3)}
+                       for name in phases},
+            "functions": {name: {"calls": self.calls[name], "total_ms": round(self.total[name] * 1000, 3),
+                                 "own_ms": round(own[name] * 1000, 3)} for name in functions},
+            "frames": {"count": len(frames), "mean_ms": round(sum(frames) / len(frames), 3) if frames else 0,
+                       "max_ms": max(frames, default=0), "histogram": dict(zip(labels, self.frame_counts))},
+        }
+
+    # one line per stack of calls and its microseconds, the input of flamegraph.pl or speedscope
+    def folded(self):
+        return "".join(f"{stack} {round(seconds * 1e6)}\n" for stack, seconds in sorted(self.own.items())
+                       if round(seconds * 1e6) > 0)
+
+    # folded stacks for a path ending in .folded, the report as JSON otherwise
+    def save(self, path):
+        with open(path, "w") as file:
+            if path.endswith(".folded"):
+                file.write(self.folded())
+            else:
+                json.dump(self.report(), file, indent=2)
+                file.write("\n")
+
+
+# recorder of the timings, None while disabled
+recorder = None
+
+# (owner, name) -> the function replaced while enabled
+originals = {}
+
+
+def timed(recorder, func, name, phase):
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        return recorder.call(func, name, phase, args, kwargs)
+    return wrapper
+
+
+# replaces every watched function with one timing its calls, disabled the functions are untouched and cost nothing
+def enable():
+    global recorder
+    if recorder is not None:
+        return recorder
+
+    recorder = Recorder()
+    for owner, name, phase in WATCHED:
+        func = getattr(owner, name)
+        originals[owner, name] = func
+        setattr(owner, name, timed(recorder, func, f"{owner.__name__}.{name}", phase))
+    return recorder
+
+
+# puts back the watched functions, returns the recorder with the timings collected
+def disable():
+    global recorder
+    for (owner, name), func in originals.items():
+        setattr(owner, name, func)
+    originals.clear()
+
+    finished, recorder = recorder, None
+    return finished
+
+
+def frame(ms):
+    if recorder is not None:
+        recorder.frame(ms)
@@ -0,0 +1,82 @@
+import argparse
+import json
+import time
+
+from engine import new_game, MOVE_TILE, MOVE_FOUND, MOVE_ORDER, MOVE_BUY, MOVE_END_TURN
+
+
+# the seed, players and moves of a game, enough to play it again
+def game_log(game):
+    return {"seed": game.seed,
+            "players": [player.name for player in game.lst_players],
+            "moves": game.moves.hex()}
+
+
+def save_log(game, path):
+    with open(path, "w") as file:
+        json.dump(game_log(game), file)
+
+
+def load_log(path):
+    with open(path, "r") as file:
+        log = json.load(file)
+    return log["seed"], log["players"], bytes.fromhex(log["moves"])
+
+
+# splits a move log into (op, args)
+def read_moves(moves):
+    pos = 0
+    while pos < len(moves):
+        op = moves[pos]
+        if op in (MOVE_TILE, MOVE_FOUND, MOVE_ORDER):
+            count = 1
+        elif op == MOVE_BUY:
+            count = moves[pos + 1] + 1
+        else:
+            count = 0
+
+        yield op, moves[pos + 1:pos + 1 + count]
+        pos += 1 + count
+
+
+# plays the logged moves again without drawing anything, stopping at the start of turn if given
+def replay(seed, player_names, moves, turn=None, hotel_colors=None):
+    game = new_game(player_names, hotel_colors, seed=seed)
+
+    turns = 0
+    for op, args in read_moves(moves):
+        if turns == turn:
+            break
+
+        game.play_move(op, *args)
+        if op == MOVE_END_TURN:
+            turns += 1
+
+    return game
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Play an Acquire game again from its move log.")
+    parser.add_argument("log", help="move log saved by save_log")
+    parser.add_argument("-t", "--turn", type=int, default=None, help="stop at the start of this turn")
+    parser.add_argument("--gui", action="store_true", help="carry on playing from there in the game window")
+    args = parser.parse_args()
+
+    seed, player_names, moves = load_log(args.log)
+
+    if args.gui:
+        import Acquire
+        Acquire.main(replay(seed, player_names, moves, args.turn, Acquire.Hotel_Colors))
+        return
+
+    start = time.perf_counter()
+    game = replay(seed, player_names, moves, args.turn)
+    elapsed = time.perf_counter() - start
+
+    print(f"{len(game.moves)} of {len(moves)} move bytes played in {elapsed * 1000:.2f}ms")
+    for finish, name, money in game.standings():
+        print(f"  {finish + 1}. {name:<12} {money}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,215 @@
+import argparse
+import asyncio
+import itertools
+import json
+import signal
+
+import instrument
+from engine import new_game, MIN_PLAYERS, MAX_PLAYERS, MOVE_END_GAME
+
+HOST = "127.0.0.1"
+PORT = 8765
+
+
+# Protocol, one JSON object per line each way
+# client -> server, every request has an "op"
+#   create - {"players": [names], "seed": optional, "seats": optional} starts a table and joins it
+#   join - {"table": id, "seats": [seat, ...]} sits at the given seats, no seats to watch
+#   move - {"table": id, "move": [op, args...]} a move from AcquireGame.legal_moves for a seat held
+#   legal - {"table": id} the legal moves of the active seat
+#   leave - {"table": id}
+# server -> client, every message has a "type"
+#   table - seed, players and move log of a table after create or join, enough to play it again locally
+#   move - a move made at a table, sent to every client there including the one that made it
+#   legal - the reply to legal
+#   error - a request that could not be carried out, nothing was changed
+
+
+# Define a Table, one game hosted by the server
+# seats - the client holding each seat, None while no one does
+# clients - every client at the table, seated or watching
+class Table:
+    def __init__(self, table_id, player_names, seed=None):
+        self.table_id = table_id
+        self.game = new_game(player_names, seed=seed)
+        self.seats = [None] * len(player_names)
+        self.clients = set()
+        self.over = False
+
+    def info(self, seats):
+        return {"type": "table",
+                "table": self.table_id,
+                "seed": self.game.seed,
+                "players": [player.name for player in self.game.lst_players],
+                "moves": self.game.moves.hex(),
+                "seats": seats}
+
+    def join(self, client, seats):
+        for seat in seats:
+            if not 0 <= seat < len(self.seats) or self.seats[seat] not in (None, client):
+                raise ValueError(f"seat {seat} is not free at table {self.table_id}")
+
+        for seat in seats:
+            self.seats[seat] = client
+        self.clients.add(client)
+
+    def leave(self, client):
+        self.seats = [None if holder is client else holder for holder in self.seats]
+        self.clients.discard(client)
+
+    # plays the move for the active seat, which the client must hold
+    def play(self, client, move):
+        game = self.game
+        seat = game.turn_counter
+
+        if self.over:
+            raise ValueError(f"the game at table {self.table_id} is over")
+        if self.seats[seat] is not client:
+            raise ValueError(f"it is not your turn at table {self.table_id}")
+
+        legal_moves = game.legal_moves()
+        if move not in legal_moves:
+            raise ValueError(f"{list(move)} is not a legal move")
+        move = legal_moves[legal_moves.index(move)]
+
+        game.play_move(*move)
+        self.over = move[0] == MOVE_END_GAME
+
+        message = {"type": "move", "table": self.table_id, "seat": seat, "move": list(move)}
+        for other in self.clients:
+            other.send(message)
+
+
+# Define a Client, one connection to the server and the tables it is at
+class Client:
+    def __init__(self, writer):
+        self.writer = writer
+        self.tables = set()
+
+    def send(self, message):
+        self.writer.write(json.dumps(message, separators=(",", ":")).encode() + b"\n")
+
+
+# Define the GameServer, any number of tables in one process, each request is handled in full before the next
+class GameServer:
+    def __init__(self):
+        self.tables = {}
+        self.table_ids = itertools.count(1)
+
+    def table(self, message):
+        table = self.tables.get(message.get("table"))
+        if table is None:
+            raise ValueError(f"there is no table {message.get('table')}")
+        return table
+
+    # carries out one request, returns the reply to the client if there is one
+    def request(self, client, message):
+        op = message.get("op")
+
+        if op == "create":
+            player_names = [str(name) for name in message["players"]]
+            if not MIN_PLAYERS <= len(player_names) <= MAX_PLAYERS:
+                raise ValueError(f"a table needs between {MIN_PLAYERS} and {MAX_PLAYERS} players")
+
+            table = Table(next(self.table_ids), player_names, message.get("seed"))
+            self.tables[table.table_id] = table
+            return self.join(client, table, message.get("seats", []))
+
+        if op == "join":
+            return self.join(client, self.table(message), message.get("seats", []))
+
+        if op == "move":
+            self.table(message).play(client, tuple(message["move"]))
+            return None
+
+        if op == "legal":
+            game = self.table(message).game
+            return {"type": "legal", "table": message["table"], "seat": game.turn_counter,
+                    "moves": [list(move) for move in game.legal_moves()]}
+
+        if op == "leave":
+            self.leave(client, self.table(message))
+            return None
+
+        raise ValueError(f"unknown op {op}")
+
+    def join(self, client, table, seats):
+        seats = [int(seat) for seat in seats]
+        table.join(client, seats)
+        client.tables.add(table)
+        return table.info(seats)
+
+    # a table is closed once its last client has left
+    def leave(self, client, table):
+        table.leave(client)
+        client.tables.discard(table)
+        if not table.clients:
+            del self.tables[table.table_id]
+
+    # the client and everyone at its tables, each move is sent to all of them
+    def recipients(self, client):
+        return {client}.union(*[table.clients for table in client.tables])
+
+    async def handle(self, reader, writer):
+        client = Client(writer)
+        try:
+            while line := await reader.readline():
+                try:
+                    reply = self.request(client, json.loads(line))
+                except (ValueError, KeyError, TypeError, AttributeError) as error:
+                    reply = {"type": "error", "message": str(error)}
+
+                if reply is not None:
+                    client.send(reply)
+
+                # waits on everyone sent a message, a slow client holds up the sender instead of buffering without end
+                for other in self.recipients(client):
+                    try:
+                        await other.writer.drain()
+                    except ConnectionError:
+                        if other is client:
+                            raise
+
+        except ConnectionError:
+            pass
+
+        finally:
+            for table in list(client.tables):
+                self.leave(client, table)
+            writer.close()
+
+    async def serve(self, host=HOST, port=PORT):
+        return await asyncio.start_server(self.handle, host, port)
+
+
+async def run(host, port):
+    server = await GameServer().serve(host, port)
+    print(f"serving Acquire tables on {host}:{port}")
+    async with server:
+        await server.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Host Acquire tables for clients to play over a socket.")
+    parser.add_argument("--host", default=HOST)
+    parser.add_argument("-p", "--port", type=int, default=PORT)
+    parser.add_argument("--profile", default=None, metavar="FILE",
+                        help="time the engine, saved on stopping as JSON or as folded stacks for a flamegraph "
+                             "when FILE ends in .folded")
+    args = parser.parse_args()
+
+    if args.profile is not None:
+        instrument.enable()
+
+    # stopped by a service manager as by Ctrl-C
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+    try:
+        asyncio.run(run(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+    if args.profile is not None:
+        instrument.disable().save(args.profile)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+import argparse
+import json
+import multiprocessing
+import random
+import time
+
+from engine import new_game, MIN_PLAYERS, MAX_PLAYERS
+from bots import BOTS, play_game
+
+
+# seed of one game, independent of which worker plays it or in what order
+def game_seed(seed, index):
+    return seed * 1000003 + index
+
+
+# plays the games of one chunk and returns only their results, never the game objects
+def play_chunk(args):
+    policies, seed, indexes = args
+    results = {"wins": [0] * len(policies),
+               "money": [[] for policy in policies],
+               "lengths": [],
+               "mergers": [],
+               "ties": 0}
+
+    for index in indexes:
+        rng = random.Random(game_seed(seed, index))
+
+        game = new_game([f"{policy} {seat + 1}" for seat, policy in enumerate(policies)], seed=rng.randrange(2 ** 32))
+        bots = [BOTS[policy](random.Random(rng.random())) for policy in policies]
+
+        turns, mergers = play_game(game, bots)
+        results["lengths"].append(turns)
+        results["mergers"].append(mergers)
+
+        for seat, player in enumerate(game.lst_players):
+            results["money"][seat].append(player.money)
+
+        # a win shared by players tied for first is split between them, the win rates add up to 1
+        names = [player.name for player in game.lst_players]
+        winners = [names.index(name) for finish, name, money in game.standings() if finish == 0]
+        for seat in winners:
+            results["wins"][seat] += 1 / len(winners)
+        if len(winners) > 1:
+            results["ties"] += 1
+
+    return results
+
+
+def merge_results(total, results):
+    for seat, wins in enumerate(results["wins"]):
+        total["wins"][seat] += wins
+        total["money"][seat].extend(results["money"][seat])
+    total["lengths"].extend(results["lengths"])
+    total["mergers"].extend(results["mergers"])
+    total["ties"] += results["ties"]
+
+
+def mean(values):
+    return sum(values) / len(values) if values else 0
+
+
+def percentile(values, fraction):
+    values = sorted(values)
+    return values[min(int(fraction * len(values)), len(values) - 1)] if values else 0
+
+
+def summary(total, policies, games, elapsed):
+    return {"games": games,
+            "seconds": round(elapsed, 3),
+            "games_per_second": round(games / elapsed, 1) if elapsed else 0,
+            "seats": [{"seat": seat + 1,
+                       "policy": policy,
+                       "win_rate": total["wins"][seat] / games,
+                       "money_mean": mean(total["money"][seat]),
+                       "money_p10": percentile(total["money"][seat], 0.1),
+                       "money_p50": percentile(total["money"][seat], 0.5),
+                       "money_p90": percentile(total["money"][seat], 0.9)}
+                      for seat, policy in enumerate(policies)],
+            "length_mean": mean(total["lengths"]),
+            "length_max": max(total["lengths"], default=0),
+            "mergers_mean": mean(total["mergers"]),
+            "tied_games": total["ties"]}
+
+
+def run_tournament(policies, games, workers=None, seed=0, chunk_size=25):
+    workers = workers or multiprocessing.cpu_count()
+    chunks = [(policies, seed, range(start, min(start + chunk_size, games)))
+              for start in range(0, games, chunk_size)]
+
+    total = {"wins": [0] * len(policies),
+             "money": [[] for policy in policies],
+             "lengths": [],
+             "mergers": [],
+             "ties": 0}
+
+    start = time.perf_counter()
+    if workers == 1:
+        for chunk in chunks:
+            merge_results(total, play_chunk(chunk))
+    else:
+        with multiprocessing.Pool(workers) as pool:
+            for results in pool.imap_unordered(play_chunk, chunks):
+                merge_results(total, results)
+
+    return summary(total, policies, games, time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Play many headless Acquire games between bot policies.")
+    parser.add_argument("policies", nargs="+", choices=sorted(BOTS),
+                        help="one bot policy per seat")
+    parser.add_argument("-n", "--games", type=int, default=1000)
+    parser.add_argument("-w", "--workers", type=int, default=None,
+                        help="processes to use, defaults to the number of cores")
+    parser.add_argument("-s", "--seed", type=int, default=0)
+    parser.add_argument("--chunk-size", type=int, default=25,
+                        help="games handed to a worker at a time")
+    parser.add_argument("--json", action="store_true", help="print the results as JSON")
+    args = parser.parse_args()
+
+    if not MIN_PLAYERS <= len(args.policies) <= MAX_PLAYERS:
+        parser.error(f"between {MIN_PLAYERS} and {MAX_PLAYERS} policies are needed")
+
+    results = run_tournament(args.policies, args.games, args.workers, args.seed, args.chunk_size)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{results['games']} games in {results['seconds']}s ({results['games_per_second']} games/s)")
+    for seat in results["seats"]:
+        print(f"  seat {seat['seat']} {seat['policy']:<8} win rate {seat['win_rate']:6.1%}  "
+              f"money mean {seat['money_mean']:8.0f}  p10/p50/p90 "
+              f"{seat['money_p10']}/{seat['money_p50']}/{seat['money_p90']}")
+    print(f"  length mean {results['length_mean']:.1f} turns (max {results['length_max']}), "
+          f"mergers mean {results['mergers_mean']:.2f}")
+    print(f"  games tied for first {results['tied_games']}, each win split evenly between the tied seats")
+
+
+if __name__ == "__main__":
+    main()